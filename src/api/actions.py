@@ -4,8 +4,8 @@ API endpoints for action execution and validation.
 
 import logging
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status, Header
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi.responses import ORJSONResponse, Response
 
 from src.models import (
     ActionRequest,
@@ -13,43 +13,49 @@ from src.models import (
     ValidationRequest,
     ValidationResponse
 )
-from src.services import ActionExecutor, ActionValidator, StateManager
+from src.models.action_descriptor import action_registry
+from src.models import descriptors  # noqa: F401  (registers built-in actions)
+from src.models import actions as action_models
+from src.api.deps import get_executor, get_validator
+from src.services import ActionExecutor, ActionValidator
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/actions", tags=["actions"])
+# Per-request status codes, bound once to skip the module attribute lookup
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_HTTP_400 = status.HTTP_400_BAD_REQUEST
+_HTTP_304 = status.HTTP_304_NOT_MODIFIED
 
-# Service instances (will be injected via dependency injection in production)
-_validator: Optional[ActionValidator] = None
-_executor: Optional[ActionExecutor] = None
-_state_manager: Optional[StateManager] = None
+router = APIRouter(
+    prefix="/actions",
+    tags=["actions"],
+    default_response_class=ORJSONResponse
+)
 
+# Action types are static for the process lifetime; let clients and proxies reuse them
+ACTION_TYPES_CACHE_CONTROL = "public, max-age=300"
 
-def get_validator() -> ActionValidator:
-    """Get or create validator instance."""
-    global _validator
-    if _validator is None:
-        _validator = ActionValidator()
-    return _validator
 
+def _action_class_for(action_id: str) -> Optional[type]:
+    """
+    Resolve the action implementation class for a registered descriptor.
 
-def get_state_manager() -> StateManager:
-    """Get or create state manager instance."""
-    global _state_manager
-    if _state_manager is None:
-        _state_manager = StateManager()
-    return _state_manager
+    Each action module defines its input model as ``<Name>Input`` next to its
+    ``<Name>Action`` class, so the descriptor's validation_class names the
+    module, which src.models.actions imports on first access.
 
+    Args:
+        action_id: Action identifier (e.g. "pre-cooling")
 
-def get_executor() -> ActionExecutor:
-    """Get or create executor instance."""
-    global _executor
-    if _executor is None:
-        _executor = ActionExecutor(
-            state_manager=get_state_manager(),
-            validator=get_validator()
-        )
-    return _executor
+    Returns:
+        The action class, or None if the action or its implementation is unknown
+    """
+    descriptor = action_registry.get(action_id)
+    if descriptor is None:
+        return None
+    class_name = descriptor.validation_class.removesuffix("Input") + "Action"
+    return getattr(action_models, class_name, None)
 
 
 @router.post(
@@ -61,7 +67,8 @@ def get_executor() -> ActionExecutor:
 )
 async def execute_action(
     request: ActionRequest,
-    x_user_id: Optional[str] = Header(None, description="User identifier for audit trail")
+    x_user_id: Optional[str] = Header(None, description="User identifier for audit trail"),
+    executor: ActionExecutor = Depends(get_executor)
 ) -> ActionResponse:
     """
     Execute a building automation action.
@@ -78,16 +85,15 @@ async def execute_action(
     """
     try:
         logger.info(
-            f"Received action execution request: {request.action_type} "
-            f"for zone {request.target_zone}"
+            "Received action execution request: %s for zone %s",
+            request.action_type,
+            request.target_zone
         )
-
-        executor = get_executor()
         response = await executor.execute_action(request, user=x_user_id)
 
         if response.status == "error":
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=_HTTP_500,
                 detail={
                     "message": "Action execution failed",
                     "errors": response.errors
@@ -96,7 +102,7 @@ async def execute_action(
 
         if response.status == "validation_failed":
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=_HTTP_400,
                 detail={
                     "message": "Action validation failed",
                     "errors": response.errors
@@ -108,9 +114,9 @@ async def execute_action(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error executing action: {str(e)}", exc_info=True)
+        logger.exception("Unexpected error executing action: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Internal server error: {str(e)}"
         )
 
@@ -122,7 +128,10 @@ async def execute_action(
     summary="Validate an action",
     description="Validate action parameters without executing"
 )
-async def validate_action(request: ValidationRequest) -> ValidationResponse:
+async def validate_action(
+    request: ValidationRequest,
+    validator: ActionValidator = Depends(get_validator)
+) -> ValidationResponse:
     """
     Validate an action without executing it.
 
@@ -134,19 +143,18 @@ async def validate_action(request: ValidationRequest) -> ValidationResponse:
     """
     try:
         logger.info(
-            f"Received validation request: {request.action_type} "
-            f"for zone {request.target_zone}"
+            "Received validation request: %s for zone %s",
+            request.action_type,
+            request.target_zone
         )
-
-        validator = get_validator()
         response = await validator.validate_request(request)
 
         return response
 
     except Exception as e:
-        logger.error(f"Error during validation: {str(e)}", exc_info=True)
+        logger.exception("Error during validation: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Validation error: {str(e)}"
         )
 
@@ -156,7 +164,7 @@ async def validate_action(request: ValidationRequest) -> ValidationResponse:
     summary="Get active actions",
     description="Get all currently executing actions"
 )
-async def get_active_actions():
+async def get_active_actions(executor: ActionExecutor = Depends(get_executor)):
     """
     Get all currently executing actions.
 
@@ -164,7 +172,6 @@ async def get_active_actions():
         Dictionary of active actions
     """
     try:
-        executor = get_executor()
         active_actions = await executor.get_active_actions()
 
         return {
@@ -173,9 +180,9 @@ async def get_active_actions():
         }
 
     except Exception as e:
-        logger.error(f"Error retrieving active actions: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving active actions: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving active actions: {str(e)}"
         )
 
@@ -185,7 +192,10 @@ async def get_active_actions():
     summary="Cancel an action",
     description="Cancel a currently executing action"
 )
-async def cancel_action(action_id: str):
+async def cancel_action(
+    action_id: str,
+    executor: ActionExecutor = Depends(get_executor)
+):
     """
     Cancel a currently executing action.
 
@@ -196,12 +206,11 @@ async def cancel_action(action_id: str):
         Cancellation status
     """
     try:
-        executor = get_executor()
         cancelled = await executor.cancel_action(action_id)
 
         if not cancelled:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=_HTTP_404,
                 detail=f"Action {action_id} not found or already completed"
             )
 
@@ -213,9 +222,9 @@ async def cancel_action(action_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error cancelling action: {str(e)}", exc_info=True)
+        logger.exception("Error cancelling action: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error cancelling action: {str(e)}"
         )
 
@@ -225,32 +234,110 @@ async def cancel_action(action_id: str):
     summary="Get supported action types",
     description="Get list of all supported action types and their parameters"
 )
-async def get_action_types():
+async def get_action_types(
+    if_none_match: Optional[str] = Header(None, description="Entity tag from a previous response"),
+    validator: ActionValidator = Depends(get_validator)
+):
     """
     Get list of supported action types.
 
+    Args:
+        if_none_match: Optional entity tag; a match returns 304 Not Modified
+
     Returns:
         Dictionary of action types and their specifications
     """
     try:
-        validator = get_validator()
+        etag = validator.action_types_etag
+        headers = {"ETag": etag, "Cache-Control": ACTION_TYPES_CACHE_CONTROL}
 
-        # Get validation rules which define supported actions
-        action_types = {}
-        for action_type, rules in validator._validation_rules.items():
-            action_types[action_type] = {
-                "required_parameters": rules["required_params"],
-                "optional_parameters": rules.get("optional_params", []),
-                "parameter_specs": rules["validations"]
-            }
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=_HTTP_304, headers=headers)
 
-        return {
-            "supported_actions": action_types
-        }
+        return Response(
+            content=validator.action_types_json,
+            media_type="application/json",
+            headers=headers
+        )
 
     except Exception as e:
-        logger.error(f"Error retrieving action types: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving action types: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving action types: {str(e)}"
         )
+
+
+@router.get(
+    "/descriptors",
+    summary="Get action descriptors",
+    description="Get UI, graph, audit, and governance metadata for all registered actions"
+)
+async def get_action_descriptors():
+    """
+    Get descriptors for every registered action.
+
+    The registry caches its serialized export, so the body is sent as-is
+    without passing through FastAPI's JSON encoder.
+
+    Returns:
+        Dictionary of action descriptors keyed by action ID
+    """
+    try:
+        return Response(
+            content=action_registry.to_json_bytes(),
+            media_type="application/json"
+        )
+
+    except Exception as e:
+        logger.exception("Error retrieving action descriptors: %s", e)
+        raise HTTPException(
+            status_code=_HTTP_500,
+            detail=f"Error retrieving action descriptors: {str(e)}"
+        )
+
+
+@router.get(
+    "/descriptors/{action_id}/input-schema",
+    summary="Get action input schema",
+    description="Get the JSON Schema for an action's input parameters",
+    responses={404: {"description": "Action not found"}}
+)
+async def get_action_input_schema(action_id: str):
+    """
+    Get the input JSON Schema for a single action.
+
+    Each action module serializes its schema once at import, so the cached
+    bytes are returned without re-encoding.
+
+    Args:
+        action_id: Action identifier (e.g. "pre-cooling")
+
+    Returns:
+        JSON Schema describing the action's input model
+
+    Raises:
+        HTTPException: If the action does not exist
+    """
+    try:
+        action_class = _action_class_for(action_id)
+        if action_class is None:
+            raise HTTPException(
+                status_code=_HTTP_404,
+                detail=f"Action {action_id} not found"
+            )
+
+        return Response(
+            content=action_class.get_input_schema_json(),
+            media_type="application/json",
+            headers={"Cache-Control": ACTION_TYPES_CACHE_CONTROL}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error retrieving input schema for %s: %s", action_id, e)
+        raise HTTPException(
+            status_code=_HTTP_500,
+            detail=f"Error retrieving input schema: {str(e)}"
+        )
@@ -3,27 +3,72 @@ API endpoints for action history and audit trail.
 """
 
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Iterable, Literal, Optional, List
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status, Query
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from src.models import AuditEntry
+from src.api.deps import get_state_manager
 from src.services import StateManager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/audit", tags=["audit"])
+# Per-request status codes, bound once to skip the module attribute lookup
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_HTTP_304 = status.HTTP_304_NOT_MODIFIED
+
+router = APIRouter(
+    prefix="/audit",
+    tags=["audit"],
+    default_response_class=ORJSONResponse
+)
+
+StreamFormat = Literal["json", "ndjson"]
+
+
+async def _stream_entries(
+    entries: Iterable[AuditEntry],
+    stream_format: StreamFormat
+) -> AsyncIterator[bytes]:
+    """
+    Serialize audit entries one at a time.
+
+    Args:
+        entries: Audit entries to serialize
+        stream_format: "json" for a JSON array, "ndjson" for one object per line
 
-# Service instance (will be injected via dependency injection in production)
-_state_manager: Optional[StateManager] = None
+    Yields:
+        Encoded chunks of the response body
+    """
+    # Pydantic's JSON mode, so timestamps match the non-streamed endpoints ("Z", not "+00:00")
+    if stream_format == "ndjson":
+        for entry in entries:
+            yield entry.model_dump_json().encode() + b"\n"
+        return
 
+    separator = b"["
+    for entry in entries:
+        yield separator + entry.model_dump_json().encode()
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
 
-def get_state_manager() -> StateManager:
-    """Get or create state manager instance."""
-    global _state_manager
-    if _state_manager is None:
-        _state_manager = StateManager()
-    return _state_manager
+
+def _streaming_entries_response(
+    entries: Iterable[AuditEntry],
+    stream_format: StreamFormat
+) -> StreamingResponse:
+    """
+    Build a streaming response for a list of audit entries.
+
+    Returning a Response bypasses FastAPI's response_model validation, which
+    would otherwise re-validate entries StateManager has already built.
+    The response_model on each route is kept for the OpenAPI schema.
+    """
+    media_type = "application/x-ndjson" if stream_format == "ndjson" else "application/json"
+    return StreamingResponse(_stream_entries(entries, stream_format), media_type=media_type)
 
 
 @router.get(
@@ -38,8 +83,12 @@ async def get_action_history(
     start_time: Optional[datetime] = Query(None, description="Filter by start time (ISO 8601)"),
     end_time: Optional[datetime] = Query(None, description="Filter by end time (ISO 8601)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
-    offset: int = Query(0, ge=0, description="Number of records to skip")
-) -> List[AuditEntry]:
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    stream_format: StreamFormat = Query(
+        "json", alias="format", description="Response format: json array or ndjson"
+    ),
+    state_manager: StateManager = Depends(get_state_manager)
+) -> StreamingResponse:
     """
     Get action audit trail with optional filters.
 
@@ -50,17 +99,17 @@ async def get_action_history(
         end_time: Optional end time filter
         limit: Maximum number of records
         offset: Number of records to skip
+        stream_format: Response format ("json" or "ndjson")
 
     Returns:
-        List of audit entries
+        Streamed list of audit entries
     """
     try:
-        logger.info(
-            f"Retrieving audit history with filters: zone={zone_id}, "
-            f"action_type={action_type}, start={start_time}, end={end_time}"
+        logger.debug(
+            "Retrieving audit history with filters: zone=%s, action_type=%s, start=%s, end=%s",
+            zone_id, action_type, start_time, end_time
         )
 
-        state_manager = get_state_manager()
         audit_entries = await state_manager.get_audit_trail(
             zone_id=zone_id,
             action_type=action_type,
@@ -70,56 +119,72 @@ async def get_action_history(
             offset=offset
         )
 
-        return audit_entries
+        return _streaming_entries_response(audit_entries, stream_format)
 
     except Exception as e:
-        logger.error(f"Error retrieving audit history: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving audit history: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving audit history: {str(e)}"
         )
 
 
+# HEAD shares the handler but stays out of the schema to avoid a duplicate operation ID
+@router.head("/actions/{action_id}", include_in_schema=False)
 @router.get(
     "/actions/{action_id}",
-    response_model=Optional[AuditEntry],
+    response_model=AuditEntry,
+    responses={
+        304: {"description": "Entry unchanged since the supplied ETag"},
+        404: {"description": "Action not found in audit trail"}
+    },
     summary="Get action details",
     description="Get detailed information about a specific action"
 )
-async def get_action_details(action_id: str) -> Optional[AuditEntry]:
+async def get_action_details(
+    action_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="Entity tag from a previous response"),
+    state_manager: StateManager = Depends(get_state_manager)
+):
     """
     Get details of a specific action from audit trail.
 
+    Audit entries never change once recorded, so the action ID doubles as the ETag.
+
     Args:
         action_id: Action identifier
+        response: Outgoing response, used to attach the ETag
+        if_none_match: Optional entity tag; a match returns 304 Not Modified
 
     Returns:
-        AuditEntry if found, None otherwise
+        AuditEntry for the action
 
     Raises:
         HTTPException: If action not found
     """
     try:
-        state_manager = get_state_manager()
+        entry = await state_manager.get_audit_entry(action_id)
 
-        # Get all audit entries and find the one with matching action_id
-        all_entries = await state_manager.get_audit_trail(limit=10000)
+        if entry is None:
+            raise HTTPException(
+                status_code=_HTTP_404,
+                detail=f"Action {action_id} not found in audit trail"
+            )
 
-        for entry in all_entries:
-            if entry.action_id == action_id:
-                return entry
+        etag = f'"{action_id}"'
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=_HTTP_304, headers={"ETag": etag})
 
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Action {action_id} not found in audit trail"
-        )
+        response.headers["ETag"] = etag
+        return entry
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving action details: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving action details: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving action details: {str(e)}"
         )
 
@@ -133,8 +198,9 @@ async def get_action_details(action_id: str) -> Optional[AuditEntry]:
 async def get_zone_action_history(
     zone_id: str,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
-    offset: int = Query(0, ge=0, description="Number of records to skip")
-) -> List[AuditEntry]:
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    state_manager: StateManager = Depends(get_state_manager)
+) -> StreamingResponse:
     """
     Get action history for a specific zone.
 
@@ -144,22 +210,21 @@ async def get_zone_action_history(
         offset: Number of records to skip
 
     Returns:
-        List of audit entries for the zone
+        Streamed list of audit entries for the zone
     """
     try:
-        state_manager = get_state_manager()
         audit_entries = await state_manager.get_audit_trail(
             zone_id=zone_id,
             limit=limit,
             offset=offset
         )
 
-        return audit_entries
+        return _streaming_entries_response(audit_entries, "json")
 
     except Exception as e:
-        logger.error(f"Error retrieving zone action history: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving zone action history: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving zone action history: {str(e)}"
         )
 
@@ -172,7 +237,8 @@ async def get_zone_action_history(
 async def get_audit_summary(
     zone_id: Optional[str] = Query(None, description="Filter by zone ID"),
     start_time: Optional[datetime] = Query(None, description="Start time for summary"),
-    end_time: Optional[datetime] = Query(None, description="End time for summary")
+    end_time: Optional[datetime] = Query(None, description="End time for summary"),
+    state_manager: StateManager = Depends(get_state_manager)
 ):
     """
     Get summary statistics of audit trail.
@@ -186,42 +252,14 @@ async def get_audit_summary(
         Dictionary with summary statistics
     """
     try:
-        state_manager = get_state_manager()
-
-        # Get filtered entries
-        entries = await state_manager.get_audit_trail(
+        summary = await state_manager.get_audit_summary(
             zone_id=zone_id,
             start_time=start_time,
-            end_time=end_time,
-            limit=10000
+            end_time=end_time
         )
 
-        # Compute summary statistics
-        action_counts = {}
-        zone_counts = {}
-        user_counts = {}
-        status_counts = {}
-
-        for entry in entries:
-            # Count by action type
-            action_counts[entry.action_type] = action_counts.get(entry.action_type, 0) + 1
-
-            # Count by zone
-            zone_counts[entry.target_zone] = zone_counts.get(entry.target_zone, 0) + 1
-
-            # Count by user
-            if entry.user:
-                user_counts[entry.user] = user_counts.get(entry.user, 0) + 1
-
-            # Count by status
-            status_counts[entry.status] = status_counts.get(entry.status, 0) + 1
-
         return {
-            "total_actions": len(entries),
-            "action_type_counts": action_counts,
-            "zone_counts": zone_counts,
-            "user_counts": user_counts,
-            "status_counts": status_counts,
+            **summary,
             "filters": {
                 "zone_id": zone_id,
                 "start_time": start_time.isoformat() if start_time else None,
@@ -230,9 +268,9 @@ async def get_audit_summary(
         }
 
     except Exception as e:
-        logger.error(f"Error computing audit summary: {str(e)}", exc_info=True)
+        logger.exception("Error computing audit summary: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error computing audit summary: {str(e)}"
         )
 
@@ -244,26 +282,30 @@ async def get_audit_summary(
     description="Get most recent actions across all zones"
 )
 async def get_recent_actions(
-    limit: int = Query(50, ge=1, le=500, description="Number of recent actions to retrieve")
-) -> List[AuditEntry]:
+    limit: int = Query(50, ge=1, le=500, description="Number of recent actions to retrieve"),
+    stream_format: StreamFormat = Query(
+        "json", alias="format", description="Response format: json array or ndjson"
+    ),
+    state_manager: StateManager = Depends(get_state_manager)
+) -> StreamingResponse:
     """
     Get most recent actions.
 
     Args:
         limit: Number of recent actions to retrieve
+        stream_format: Response format ("json" or "ndjson")
 
     Returns:
-        List of recent audit entries
+        Streamed list of recent audit entries
     """
     try:
-        state_manager = get_state_manager()
         recent_entries = await state_manager.get_audit_trail(limit=limit)
 
-        return recent_entries
+        return _streaming_entries_response(recent_entries, stream_format)
 
     except Exception as e:
-        logger.error(f"Error retrieving recent actions: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving recent actions: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving recent actions: {str(e)}"
         )
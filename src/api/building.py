@@ -4,26 +4,25 @@ API endpoints for building and zone state management.
 
 import logging
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, status, Query
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 
-from src.models import BuildingState
+from src.models import BuildingState, check_json_ints
+from src.api.deps import get_state_manager
 from src.services import StateManager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/building", tags=["building"])
+# Per-request status codes, bound once to skip the module attribute lookup
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_HTTP_400 = status.HTTP_400_BAD_REQUEST
 
-# Service instance (will be injected via dependency injection in production)
-_state_manager: Optional[StateManager] = None
-
-
-def get_state_manager() -> StateManager:
-    """Get or create state manager instance."""
-    global _state_manager
-    if _state_manager is None:
-        _state_manager = StateManager()
-    return _state_manager
+router = APIRouter(
+    prefix="/building",
+    tags=["building"],
+    default_response_class=ORJSONResponse
+)
 
 
 @router.get(
@@ -32,23 +31,27 @@ def get_state_manager() -> StateManager:
     summary="Get building state",
     description="Get current state of all zones or entire building"
 )
-async def get_building_state() -> List[BuildingState]:
+async def get_building_state(
+    state_manager: StateManager = Depends(get_state_manager)
+) -> ORJSONResponse:
     """
     Get current state of all zones in the building.
 
+    The states are built by StateManager as validated models, so they are
+    serialized directly rather than re-validated against the response model.
+
     Returns:
         List of BuildingState objects for all zones
     """
     try:
-        state_manager = get_state_manager()
         zones_state = await state_manager.get_all_zones_state()
 
-        return zones_state
+        return ORJSONResponse([zone_state.model_dump() for zone_state in zones_state])
 
     except Exception as e:
-        logger.error(f"Error retrieving building state: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving building state: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving building state: {str(e)}"
         )
 
@@ -59,7 +62,10 @@ async def get_building_state() -> List[BuildingState]:
     summary="Get zone state",
     description="Get current state of a specific zone"
 )
-async def get_zone_state(zone_id: str) -> BuildingState:
+async def get_zone_state(
+    zone_id: str,
+    state_manager: StateManager = Depends(get_state_manager)
+) -> BuildingState:
     """
     Get current state of a specific zone.
 
@@ -73,12 +79,11 @@ async def get_zone_state(zone_id: str) -> BuildingState:
         HTTPException: If zone not found
     """
     try:
-        state_manager = get_state_manager()
         zone_state = await state_manager.get_zone_state(zone_id)
 
         if zone_state is None:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=_HTTP_404,
                 detail=f"Zone {zone_id} not found"
             )
 
@@ -87,9 +92,9 @@ async def get_zone_state(zone_id: str) -> BuildingState:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving zone state: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving zone state: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving zone state: {str(e)}"
         )
 
@@ -102,7 +107,8 @@ async def get_zone_state(zone_id: str) -> BuildingState:
 )
 async def initialize_zone(
     zone_id: str,
-    initial_state: Optional[dict] = None
+    initial_state: Optional[dict] = None,
+    state_manager: StateManager = Depends(get_state_manager)
 ):
     """
     Initialize a zone with default or provided state.
@@ -113,9 +119,12 @@ async def initialize_zone(
 
     Returns:
         Success message
+
+    Raises:
+        HTTPException: If the state holds integers too wide to serialize
     """
     try:
-        state_manager = get_state_manager()
+        check_json_ints(initial_state)
         await state_manager.initialize_zone(zone_id, initial_state)
 
         return {
@@ -123,10 +132,15 @@ async def initialize_zone(
             "zone_id": zone_id
         }
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=_HTTP_400,
+            detail=f"Invalid initial state: {str(e)}"
+        )
     except Exception as e:
-        logger.error(f"Error initializing zone: {str(e)}", exc_info=True)
+        logger.exception("Error initializing zone: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error initializing zone: {str(e)}"
         )
 
@@ -139,7 +153,8 @@ async def initialize_zone(
 async def get_zone_history(
     zone_id: str,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
-    offset: int = Query(0, ge=0, description="Number of records to skip")
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    state_manager: StateManager = Depends(get_state_manager)
 ):
     """
     Get state change history for a zone.
@@ -153,7 +168,6 @@ async def get_zone_history(
         List of state change records
     """
     try:
-        state_manager = get_state_manager()
         history = await state_manager.get_state_history(
             zone_id=zone_id,
             limit=limit,
@@ -169,9 +183,9 @@ async def get_zone_history(
         }
 
     except Exception as e:
-        logger.error(f"Error retrieving zone history: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving zone history: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving zone history: {str(e)}"
         )
 
@@ -181,7 +195,7 @@ async def get_zone_history(
     summary="Get system statistics",
     description="Get statistics about the building management system"
 )
-async def get_statistics():
+async def get_statistics(state_manager: StateManager = Depends(get_state_manager)):
     """
     Get system statistics.
 
@@ -189,15 +203,14 @@ async def get_statistics():
         Dictionary with system statistics
     """
     try:
-        state_manager = get_state_manager()
         stats = await state_manager.get_statistics()
 
         return stats
 
     except Exception as e:
-        logger.error(f"Error retrieving statistics: {str(e)}", exc_info=True)
+        logger.exception("Error retrieving statistics: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error retrieving statistics: {str(e)}"
         )
 
@@ -207,7 +220,10 @@ async def get_statistics():
     summary="Clear zone state",
     description="Clear state data for a zone (testing only)"
 )
-async def clear_zone_state(zone_id: str):
+async def clear_zone_state(
+    zone_id: str,
+    state_manager: StateManager = Depends(get_state_manager)
+):
     """
     Clear state data for a zone (useful for testing).
 
@@ -218,7 +234,6 @@ async def clear_zone_state(zone_id: str):
         Success message
     """
     try:
-        state_manager = get_state_manager()
         await state_manager.clear_state(zone_id)
 
         return {
@@ -227,9 +242,9 @@ async def clear_zone_state(zone_id: str):
         }
 
     except Exception as e:
-        logger.error(f"Error clearing zone state: {str(e)}", exc_info=True)
+        logger.exception("Error clearing zone state: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error clearing zone state: {str(e)}"
         )
 
@@ -239,7 +254,7 @@ async def clear_zone_state(zone_id: str):
     summary="List all zones",
     description="Get list of all zones in the system"
 )
-async def list_zones():
+async def list_zones(state_manager: StateManager = Depends(get_state_manager)):
     """
     Get list of all zones.
 
@@ -247,17 +262,16 @@ async def list_zones():
         List of zone identifiers
     """
     try:
-        state_manager = get_state_manager()
-        stats = await state_manager.get_statistics()
+        zone_ids = await state_manager.get_zone_ids()
 
         return {
-            "total_zones": stats["total_zones"],
-            "zones": stats["zones"]
+            "total_zones": len(zone_ids),
+            "zones": zone_ids
         }
 
     except Exception as e:
-        logger.error(f"Error listing zones: {str(e)}", exc_info=True)
+        logger.exception("Error listing zones: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"Error listing zones: {str(e)}"
         )
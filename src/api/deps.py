@@ -0,0 +1,49 @@
+"""
+Shared service providers for the API routers.
+
+Each service is built once and cached so every router resolves the same
+instance. The public providers are ``async def`` so FastAPI awaits them
+inline instead of dispatching a sync dependency to the thread pool.
+"""
+
+import os
+from functools import lru_cache
+
+from src.services import ActionExecutor, ActionValidator, StateManager
+
+
+@lru_cache(maxsize=1)
+def _state_manager() -> StateManager:
+    """Build the shared state manager instance."""
+    return StateManager()
+
+
+@lru_cache(maxsize=1)
+def _validator() -> ActionValidator:
+    """Build the shared validator instance."""
+    return ActionValidator()
+
+
+@lru_cache(maxsize=1)
+def _executor() -> ActionExecutor:
+    """Build the shared executor instance."""
+    return ActionExecutor(
+        state_manager=_state_manager(),
+        validator=_validator(),
+        simulate_latency=os.getenv("SIMULATE_LATENCY") == "1"
+    )
+
+
+async def get_state_manager() -> StateManager:
+    """Get the shared state manager instance."""
+    return _state_manager()
+
+
+async def get_validator() -> ActionValidator:
+    """Get the shared validator instance."""
+    return _validator()
+
+
+async def get_executor() -> ActionExecutor:
+    """Get the shared executor instance."""
+    return _executor()
@@ -0,0 +1,100 @@
+"""
+Lightweight ASGI middleware for the KBE API.
+
+Implemented directly against the ASGI interface so each request only pays for a
+scan of the raw header list, with no Request/Response object construction.
+"""
+
+from typing import Any, Awaitable, Callable, MutableMapping
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class PermissiveCORSMiddleware:
+    """
+    CORS middleware allowing any origin, method, and header with credentials.
+
+    Matches Starlette's CORSMiddleware configured with ``allow_origins=["*"]``,
+    ``allow_methods=["*"]``, ``allow_headers=["*"]`` and ``allow_credentials=True``.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 600):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Downstream ASGI application
+            max_age: Seconds browsers may cache preflight responses
+        """
+        self.app = app
+        self.max_age = str(max_age).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        has_cookie = False
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._send_preflight(origin, request_headers, send)
+            return
+
+        # Credentialed requests cannot use the "*" wildcard, so echo the origin
+        cors_headers = [
+            (b"access-control-allow-origin", origin if has_cookie else b"*"),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+        if has_cookie:
+            cors_headers.append((b"vary", b"Origin"))
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _send_preflight(
+        self,
+        origin: bytes,
+        request_headers: bytes | None,
+        send: Send
+    ) -> None:
+        """Answer a CORS preflight request without invoking the application."""
+        headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-methods", ALLOW_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", self.max_age),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        ]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
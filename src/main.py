@@ -8,19 +8,23 @@ This application provides REST APIs for:
 - Accessing action audit trail
 """
 
+import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from src.api import actions_router, building_router, audit_router
-from src.services import StateManager
+from src.api.deps import get_executor, get_state_manager
+from src.api.middleware import PermissiveCORSMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -40,11 +44,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     logger.info("Starting KBE Action Execution API")
 
-    # Import here to avoid circular imports
-    from src.api.building import get_state_manager
+    # Widen the thread pool used for sync endpoints/dependencies (anyio default: 40)
+    thread_limiter = anyio.to_thread.current_default_thread_limiter()
+    thread_limiter.total_tokens = int(os.getenv("ANYIO_TOKENS", "100"))
+    logger.info("Thread pool capacity set to %d tokens", thread_limiter.total_tokens)
 
-    # Initialize services and demo zones
-    state_manager = get_state_manager()
+    # Build the shared services up front so the first request doesn't pay for it
+    state_manager = await get_state_manager()
+    await get_executor()
 
     # Initialize demo building zones (matching the web UI)
     demo_zones = [
@@ -85,8 +92,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         }),
     ]
 
-    for zone_id, initial_state in demo_zones:
-        await state_manager.initialize_zone(zone_id, initial_state)
+    await asyncio.gather(*(
+        state_manager.initialize_zone(zone_id, initial_state)
+        for zone_id, initial_state in demo_zones
+    ))
 
     logger.info(f"Initialized {len(demo_zones)} demo zones: Z001-Z005")
 
@@ -106,26 +115,24 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS (allows all origins; configure appropriately for production)
+app.add_middleware(PermissiveCORSMiddleware)
+
+# Compress larger JSON payloads (audit history, building state)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Handle uncaught exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.exception("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -150,10 +157,34 @@ async def health_check():
     }
 
 
+class CachedStaticFiles(StaticFiles):
+    """
+    Static file handler that adds Cache-Control headers.
+
+    Scripts and stylesheets are served as immutable with a long max-age;
+    everything else (HTML pages) gets a short max-age so UI edits show up quickly.
+    Starlette streams the file itself, using sendfile where the server supports it.
+    """
+
+    IMMUTABLE_SUFFIXES = (".js", ".css")
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if str(full_path).endswith(self.IMMUTABLE_SUFFIXES):
+            response.headers["Cache-Control"] = "public, max-age=3600, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=60"
+        return response
+
+
 # Serve static files for demo UI
 static_dir = Path(__file__).parent / "static"
+index_file = static_dir / "index.html"
+# The index page is small and only changes on deploy, so serve it from memory
+_INDEX_BYTES = index_file.read_bytes() if index_file.exists() else None
+
 if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
 
     # Root endpoint serves demo UI
     @app.get(
@@ -164,9 +195,12 @@ if static_dir.exists():
     )
     async def root():
         """Serve the demo web UI."""
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(str(index_file))
+        if _INDEX_BYTES is not None:
+            return Response(
+                content=_INDEX_BYTES,
+                media_type="text/html",
+                headers={"Cache-Control": "public, max-age=60"}
+            )
         # Fallback to API info if UI not available
         return {
             "name": "KBE Action Execution API",
@@ -216,11 +250,23 @@ app.include_router(audit_router)
 if __name__ == "__main__":
     import uvicorn
 
+    # Set DEV_RELOAD=1 to restart on code changes; leave unset when measuring performance
+    reload = os.getenv("DEV_RELOAD") == "1"
+    # Each worker is a separate process with its own in-memory StateManager,
+    # so only raise MAX_WORKERS once state is moved to a shared store.
+    # Reload mode supports a single worker only.
+    workers = 1 if reload else int(os.getenv("MAX_WORKERS", "1"))
+
     logger.info("Starting development server...")
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=8008,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1024,
+        backlog=2048,
         log_level="info"
     )
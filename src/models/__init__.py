@@ -5,9 +5,10 @@ This package contains Pydantic models for the Knowledge-Based Engine Proof of Co
 Includes building infrastructure models and action definition/execution models.
 """
 
+import sys
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from .building import Building, Zone, Equipment
 from .kbe_actions import (
@@ -15,9 +16,30 @@ from .kbe_actions import (
     ActionExecution,
     ActionInput,
     SideEffect,
+    as_utc,
+    cached_json_schema,
+    utc_now,
 )
 
 
+# orjson, the default response encoder, only serializes integers in this range
+_JSON_INT_MIN = -(2 ** 63)
+_JSON_INT_MAX = 2 ** 64 - 1
+
+
+def check_json_ints(value: Any) -> None:
+    """Raise ValueError for integers too wide to serialize, at any nesting depth."""
+    if isinstance(value, int):
+        if not _JSON_INT_MIN <= value <= _JSON_INT_MAX:
+            raise ValueError(f"Integer {value} exceeds the 64-bit range")
+    elif isinstance(value, dict):
+        for item in value.values():
+            check_json_ints(item)
+    elif isinstance(value, list):
+        for item in value:
+            check_json_ints(item)
+
+
 # API Request/Response Models for FastAPI endpoints
 class ActionRequest(BaseModel):
     """Request model for action execution."""
@@ -26,12 +48,25 @@ class ActionRequest(BaseModel):
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Action parameters")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
+    @field_validator("action_type")
+    @classmethod
+    def intern_action_type(cls, v: str) -> str:
+        """Intern the action type so handler and registry lookups hit identity checks."""
+        return sys.intern(v)
+
+    @field_validator("parameters")
+    @classmethod
+    def check_parameter_ints(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+        """Reject integers the audit and response encoders cannot serialize."""
+        check_json_ints(v)
+        return v
+
 
 class ActionResponse(BaseModel):
     """Response model for action execution."""
     action_id: str = Field(..., description="Unique action identifier")
     status: str = Field(..., description="Execution status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     result: Optional[Dict[str, Any]] = None
     errors: Optional[List[str]] = None
 
@@ -53,7 +88,7 @@ class ValidationResponse(BaseModel):
 class BuildingState(BaseModel):
     """Model for building/zone state."""
     zone_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     state: Dict[str, Any] = Field(default_factory=dict)
     metadata: Optional[Dict[str, Any]] = None
 
@@ -79,6 +114,12 @@ __all__ = [
     "ActionExecution",
     "ActionInput",
     "SideEffect",
+    "cached_json_schema",
+    # JSON helpers
+    "check_json_ints",
+    # Time helpers
+    "as_utc",
+    "utc_now",
     # API models
     "ActionRequest",
     "ActionResponse",
@@ -5,11 +5,17 @@ Self-describing action metadata that drives UI generation, graph representation,
 audit logging, and validation. Each action is a fully modular, self-contained entity.
 """
 
-from typing import Literal, Optional, Any
-from pydantic import BaseModel, Field
+import sys
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional, Any
 
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
 
-class UIFieldDescriptor(BaseModel):
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(extra="forbid"))
+class UIFieldDescriptor:
     """
     Describes a single UI input field with all rendering metadata.
     """
@@ -32,7 +38,7 @@ class UIFieldDescriptor(BaseModel):
     max_length: int | None = Field(default=None, description="Maximum length (text)")
 
     # Select/multi-select options
-    options: list[dict[str, str]] | None = Field(
+    options: tuple[dict[str, str], ...] | None = Field(
         default=None,
         description="Options for select/multi-select [{'value': 'id', 'label': 'Display'}]"
     )
@@ -45,8 +51,30 @@ class UIFieldDescriptor(BaseModel):
     grid_column: str | None = Field(default=None, description="CSS grid-column property")
     css_class: str | None = Field(default=None, description="Additional CSS classes")
 
+    @field_validator("options")
+    @classmethod
+    def intern_option_values(
+        cls, v: tuple[dict[str, str], ...] | None
+    ) -> tuple[dict[str, str], ...] | None:
+        """
+        Intern option keys and values so every descriptor shares one copy.
+
+        Option values such as "operator:Operator" repeat across actions and are
+        compared against submitted form values; labels are free text and kept as-is.
+        """
+        if v is None:
+            return None
+        return tuple(
+            {
+                sys.intern(key): sys.intern(text) if key == "value" else text
+                for key, text in option.items()
+            }
+            for option in v
+        )
+
 
-class GraphNodeDescriptor(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(extra="forbid"))
+class GraphNodeDescriptor:
     """
     Describes how action appears in the knowledge graph.
     """
@@ -59,13 +87,14 @@ class GraphNodeDescriptor(BaseModel):
     color: str | None = Field(default=None, description="Node color override")
 
     # Relationships
-    relationships: list[dict[str, str]] = Field(
-        default_factory=list,
+    relationships: tuple[dict[str, str], ...] = Field(
+        default=(),
         description="Edges to other nodes [{'target': 'node_id', 'type': 'has_constraint'}]"
     )
 
 
-class AuditLogDescriptor(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(extra="forbid"))
+class AuditLogDescriptor:
     """
     Describes how to format action in audit log.
     """
@@ -73,8 +102,8 @@ class AuditLogDescriptor(BaseModel):
         ...,
         description="Summary line template with {param} placeholders"
     )
-    detail_fields: list[dict[str, str]] = Field(
-        default_factory=list,
+    detail_fields: tuple[dict[str, str], ...] = Field(
+        default=(),
         description="Fields to show in details [{'param': 'field_name', 'label': 'Display', 'format': 'temperature'}]"
     )
     icon: str | None = Field(default=None, description="Emoji icon for action")
@@ -86,6 +115,29 @@ class AuditLogDescriptor(BaseModel):
     )
 
 
+def freeze_policies(policies: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Prepare an ODRL policy literal for a descriptor built with model_construct().
+
+    Role names are interned because they are looked up on every permission
+    check, and constraint lists become tuples so descriptors sharing the
+    policies cannot mutate them.
+
+    Args:
+        policies: Role name -> {"permitted", "constraints", "reason"} mapping
+
+    Returns:
+        Policies with interned role keys and tuple constraints
+    """
+    frozen = {}
+    for role, policy in policies.items():
+        policy = dict(policy)
+        if "constraints" in policy:
+            policy["constraints"] = tuple(policy["constraints"])
+        frozen[sys.intern(role)] = policy
+    return frozen
+
+
 class ActionDescriptor(BaseModel):
     """
     Complete self-describing action metadata.
@@ -106,7 +158,7 @@ class ActionDescriptor(BaseModel):
     version: str = Field(default="1.0.0", description="Action schema version")
 
     # UI Generation
-    ui_fields: list[UIFieldDescriptor] = Field(
+    ui_fields: tuple[UIFieldDescriptor, ...] = Field(
         ...,
         description="UI form fields in display order"
     )
@@ -116,7 +168,7 @@ class ActionDescriptor(BaseModel):
     )
 
     # Graph Representation
-    graph_nodes: list[GraphNodeDescriptor] = Field(
+    graph_nodes: tuple[GraphNodeDescriptor, ...] = Field(
         ...,
         description="Nodes and relationships for knowledge graph"
     )
@@ -128,8 +180,8 @@ class ActionDescriptor(BaseModel):
     )
 
     # SHACL Constraints (semantic validation)
-    shacl_constraints: list[str] = Field(
-        default_factory=list,
+    shacl_constraints: tuple[str, ...] = Field(
+        default=(),
         description="Human-readable constraint descriptions"
     )
 
@@ -141,12 +193,12 @@ class ActionDescriptor(BaseModel):
 
     # Target ontology
     target_type: str = Field(..., description="Brick schema target type")
-    required_permissions: list[str] = Field(
-        default_factory=list,
+    required_permissions: tuple[str, ...] = Field(
+        default=(),
         description="Required permission strings"
     )
-    side_effects: list[str] = Field(
-        default_factory=list,
+    side_effects: tuple[str, ...] = Field(
+        default=(),
         description="Expected side effects"
     )
 
@@ -160,8 +212,11 @@ class ActionDescriptor(BaseModel):
         description="Function name for cost calculation"
     )
 
-    class Config:
-        json_schema_extra = {
+    # Descriptors are registered once and shared read-only by every request
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "action_id": "adjust-setpoint",
                 "action_name": "Adjust Temperature Setpoint",
@@ -186,6 +241,20 @@ class ActionDescriptor(BaseModel):
                 ]
             }
         }
+    )
+
+    def can(self, role: str) -> bool:
+        """
+        Check whether a role is permitted to run this action.
+
+        Args:
+            role: Role name such as "operator" or "energy_manager"
+
+        Returns:
+            True if the role has a policy that permits the action
+        """
+        policy = self.odrl_policies.get(role)
+        return policy is not None and policy.get("permitted", False)
 
 
 class ActionRegistry:
@@ -196,37 +265,98 @@ class ActionRegistry:
 
     def __init__(self):
         self._actions: dict[str, ActionDescriptor] = {}
+        self._actions_view: Mapping[str, ActionDescriptor] = MappingProxyType(self._actions)
+        # Listings and exports are rebuilt lazily after each registration
+        self._list_cache: tuple[ActionDescriptor, ...] | None = None
+        self._json_cache: dict[str, Any] | None = None
+        self._json_bytes: bytes | None = None
+        self._completeness: dict[tuple[str, str], tuple[bool, tuple[str, ...]]] = {}
+
+    @property
+    def actions_view(self) -> Mapping[str, ActionDescriptor]:
+        """Read-only live view of registered actions keyed by action ID."""
+        return self._actions_view
+
+    def register(self, descriptor: ActionDescriptor) -> ActionDescriptor:
+        """
+        Register an action descriptor, replacing any with the same action_id.
+
+        Re-registering an identical descriptor (e.g. when a descriptor module is
+        reloaded) is a no-op that keeps the cached listings and exports.
+
+        Returns:
+            The registered descriptor (the existing one if it was identical)
+        """
+        existing = self._actions.get(descriptor.action_id)
+        if existing is not None and (existing is descriptor or existing == descriptor):
+            return existing
 
-    def register(self, descriptor: ActionDescriptor) -> None:
-        """Register a new action descriptor."""
         self._actions[descriptor.action_id] = descriptor
+        self._completeness = {
+            key: result for key, result in self._completeness.items()
+            if key[0] != descriptor.action_id
+        }
+        self._list_cache = None
+        self._json_cache = None
+        self._json_bytes = None
+        return descriptor
 
     def get(self, action_id: str) -> ActionDescriptor | None:
         """Get action descriptor by ID."""
         return self._actions.get(action_id)
 
-    def list_all(self) -> list[ActionDescriptor]:
-        """List all registered actions."""
-        return list(self._actions.values())
+    def list_all(self) -> tuple[ActionDescriptor, ...]:
+        """List all registered actions, cached until the next register() call."""
+        if self._list_cache is None:
+            self._list_cache = tuple(self._actions.values())
+        return self._list_cache
 
     def to_json_schema(self) -> dict[str, Any]:
-        """Export all actions as JSON schema for frontend."""
-        return {
-            action_id: descriptor.model_dump()
-            for action_id, descriptor in self._actions.items()
-        }
+        """
+        Export all actions as JSON schema for frontend.
 
-    def validate_completeness(self, action_id: str) -> tuple[bool, list[str]]:
+        The export is cached until the next register() call, so callers share
+        the returned dict and must not modify it.
+        """
+        if self._json_cache is None:
+            self._json_cache = {
+                action_id: descriptor.model_dump()
+                for action_id, descriptor in self._actions.items()
+            }
+        return self._json_cache
+
+    def to_json_bytes(self) -> bytes:
+        """Export all actions as pre-serialized JSON, cached like to_json_schema()."""
+        if self._json_bytes is None:
+            self._json_bytes = orjson.dumps({
+                action_id: descriptor.model_dump(mode="json")
+                for action_id, descriptor in self._actions.items()
+            })
+        return self._json_bytes
+
+    def validate_completeness(self, action_id: str) -> tuple[bool, tuple[str, ...]]:
         """
         Validate that action has all required elements.
 
+        Descriptors are frozen, so results are cached per (action_id, version)
+        until the action is registered again.
+
         Returns:
-            (is_valid, list_of_errors)
+            (is_valid, tuple_of_errors)
         """
         descriptor = self.get(action_id)
         if not descriptor:
-            return False, [f"Action '{action_id}' not found in registry"]
+            return False, (f"Action '{action_id}' not found in registry",)
+
+        key = (action_id, descriptor.version)
+        cached = self._completeness.get(key)
+        if cached is None:
+            cached = self._completeness[key] = self._check_completeness(descriptor)
+        return cached
 
+    @staticmethod
+    def _check_completeness(descriptor: ActionDescriptor) -> tuple[bool, tuple[str, ...]]:
+        """Run the completeness checks for a single descriptor."""
         errors = []
 
         # Check UI fields
@@ -257,7 +387,7 @@ class ActionRegistry:
         if not descriptor.validation_class:
             errors.append("No validation class specified")
 
-        return len(errors) == 0, errors
+        return len(errors) == 0, tuple(errors)
 
 
 # Global registry instance
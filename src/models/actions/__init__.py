@@ -3,11 +3,27 @@ KBE Action Implementations Package
 
 Specific action model implementations for the KBE system.
 Each module contains a specific action type with its input validation and execution logic.
+
+Submodules are imported on first attribute access (PEP 562), so importing the
+package only builds the Pydantic schemas of the actions actually used.
 """
 
-from .adjust_setpoint import AdjustSetpointAction, AdjustSetpointInput
-from .load_shed import LoadShedAction, LoadShedInput
-from .pre_cooling import PreCoolingAction, PreCoolingInput
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .adjust_setpoint import AdjustSetpointAction, AdjustSetpointInput
+    from .load_shed import LoadShedAction, LoadShedInput
+    from .pre_cooling import PreCoolingAction, PreCoolingInput
+
+_LAZY_IMPORTS = {
+    "AdjustSetpointAction": "adjust_setpoint",
+    "AdjustSetpointInput": "adjust_setpoint",
+    "LoadShedAction": "load_shed",
+    "LoadShedInput": "load_shed",
+    "PreCoolingAction": "pre_cooling",
+    "PreCoolingInput": "pre_cooling",
+}
 
 __all__ = [
     "AdjustSetpointAction",
@@ -17,3 +33,29 @@ __all__ = [
     "PreCoolingAction",
     "PreCoolingInput",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodule defining a public name on first access.
+
+    Args:
+        name: Attribute requested from the package
+
+    Returns:
+        The requested class
+
+    Raises:
+        AttributeError: If name is not a public export of this package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,97 @@
+"""
+Helpers for read-only action metadata.
+
+Action schemas, conditions, and policies are static, so each action module
+builds them once at import time and hands out the same frozen objects.
+"""
+
+import ast
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
+
+import orjson
+
+# (predicate_name, argument_names) parsed from a condition expression
+ConditionCall = tuple[str, tuple[str, ...]]
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Args:
+        value: JSON-like value built from dicts, lists, and scalars
+
+    Returns:
+        Equivalent value that cannot be mutated by callers
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def dump_json(value: Any) -> bytes:
+    """
+    Serialize a frozen value to JSON bytes.
+
+    Args:
+        value: Value produced by freeze()
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(value, default=dict)
+
+
+def compile_conditions(expressions: Iterable[str]) -> tuple[ConditionCall, ...]:
+    """
+    Parse condition expressions like ``"zone_exists(zone_id)"`` once.
+
+    Args:
+        expressions: Condition strings, each a call with plain-name arguments
+
+    Returns:
+        Tuple of (predicate_name, argument_names) pairs
+
+    Raises:
+        ValueError: If an expression is not a simple call
+    """
+    compiled = []
+    for expression in expressions:
+        call = ast.parse(expression, mode="eval").body
+        if not (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Name)
+            and all(isinstance(arg, ast.Name) for arg in call.args)
+            and not call.keywords
+        ):
+            raise ValueError(f"Condition is not a simple call: {expression!r}")
+        compiled.append((call.func.id, tuple(arg.id for arg in call.args)))
+    return tuple(compiled)
+
+
+def conditions_hold(
+    conditions: Iterable[ConditionCall],
+    predicates: Mapping[str, Callable[..., bool]],
+    context: Mapping[str, Any]
+) -> bool:
+    """
+    Evaluate compiled conditions against a context without parsing strings.
+
+    Args:
+        conditions: Pairs produced by compile_conditions()
+        predicates: Predicate functions keyed by name
+        context: Argument values keyed by name
+
+    Returns:
+        True if every predicate returns a truthy value
+
+    Raises:
+        KeyError: If a predicate or argument is missing
+    """
+    return all(
+        predicates[name](*(context[arg] for arg in args))
+        for name, args in conditions
+    )
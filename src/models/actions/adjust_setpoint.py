@@ -5,9 +5,11 @@ Action model for adjusting temperature setpoints in building zones.
 Includes validation for safe and efficient setpoint changes.
 """
 
-from typing import Literal
-from pydantic import Field, field_validator, model_validator
+from typing import Any, Literal, Mapping
+from pydantic import Field, TypeAdapter, model_validator
 from ..kbe_actions import ActionInput
+from ..types import Fahrenheit
+from ._frozen import ConditionCall, compile_conditions, dump_json, freeze
 
 
 class AdjustSetpointInput(ActionInput):
@@ -27,10 +29,8 @@ class AdjustSetpointInput(ActionInput):
         min_length=1,
         description="Target zone identifier"
     )
-    new_setpoint: float = Field(
+    new_setpoint: Fahrenheit = Field(
         ...,
-        ge=50.0,
-        le=90.0,
         description="New temperature setpoint in Fahrenheit"
     )
     reason: str = Field(
@@ -48,46 +48,31 @@ class AdjustSetpointInput(ActionInput):
         le=15.0,
         description="Maximum allowed temperature change in degrees F"
     )
-    current_setpoint: float | None = Field(
+    current_setpoint: Fahrenheit | None = Field(
         default=None,
-        ge=50.0,
-        le=90.0,
         description="Current setpoint for validation (optional)"
     )
 
-    @field_validator("new_setpoint")
-    @classmethod
-    def validate_comfort_range(cls, v: float) -> float:
+    @model_validator(mode="after")
+    def validate_setpoint(self) -> "AdjustSetpointInput":
         """
-        Validate setpoint is within comfort range.
+        Validate the new setpoint against comfort range and max_change.
 
-        Args:
-            v: New setpoint temperature
+        The 60-80°F comfort range only applies to low/medium priority; high and
+        emergency adjustments are bounded by the 50-90°F field limits alone.
 
         Returns:
-            Validated setpoint
+            Validated model instance
 
         Raises:
-            ValueError: If setpoint is outside typical comfort range
+            ValueError: If setpoint is outside comfort range or change exceeds max_change
         """
-        if v < 60.0 or v > 80.0:
+        if self.priority in ("low", "medium") and not 60.0 <= self.new_setpoint <= 80.0:
             raise ValueError(
-                f"Setpoint {v}°F is outside typical comfort range (60-80°F). "
+                f"Setpoint {self.new_setpoint}°F is outside typical comfort range (60-80°F). "
                 "Use high/emergency priority if intentional."
             )
-        return v
-
-    @model_validator(mode="after")
-    def validate_setpoint_change(self) -> "AdjustSetpointInput":
-        """
-        Validate that setpoint change doesn't exceed max_change.
-
-        Returns:
-            Validated model instance
 
-        Raises:
-            ValueError: If change exceeds max_change limit
-        """
         if self.current_setpoint is not None:
             change = abs(self.new_setpoint - self.current_setpoint)
             if change > self.max_change:
@@ -97,6 +82,72 @@ class AdjustSetpointInput(ActionInput):
         return self
 
 
+_INPUT_SCHEMA = freeze({
+    "type": "object",
+    "properties": {
+        "zone_id": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Target zone identifier"
+        },
+        "new_setpoint": {
+            "type": "number",
+            "minimum": 50.0,
+            "maximum": 90.0,
+            "description": "New temperature setpoint in Fahrenheit"
+        },
+        "reason": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Reason for setpoint adjustment"
+        },
+        "priority": {
+            "type": "string",
+            "enum": ["low", "medium", "high", "emergency"],
+            "default": "medium",
+            "description": "Adjustment priority"
+        },
+        "max_change": {
+            "type": "number",
+            "minimum": 0.0,
+            "maximum": 15.0,
+            "default": 5.0,
+            "description": "Maximum allowed temperature change"
+        },
+        "current_setpoint": {
+            "type": "number",
+            "minimum": 50.0,
+            "maximum": 90.0,
+            "description": "Current setpoint for validation"
+        }
+    },
+    "required": ["zone_id", "new_setpoint", "reason"],
+    "additionalProperties": False
+})
+
+_INPUT_SCHEMA_JSON = dump_json(_INPUT_SCHEMA)
+
+# Validates whole batches in one pydantic-core call
+_INPUT_LIST_ADAPTER = TypeAdapter(list[AdjustSetpointInput])
+
+_PRECONDITIONS = freeze([
+    "zone_exists(zone_id)",
+    "zone_is_online(zone_id)",
+    "setpoint_within_limits(new_setpoint, zone_id)",
+    "no_override_active(zone_id)"
+])
+
+_POSTCONDITIONS = freeze([
+    "zone_setpoint_equals(zone_id, new_setpoint)",
+    "zone_responding(zone_id)",
+    "audit_log_created(action_id)"
+])
+
+# Parsed once so evaluators dispatch on names instead of re-parsing strings
+_PRECONDITION_CALLS = compile_conditions(_PRECONDITIONS)
+_POSTCONDITION_CALLS = compile_conditions(_POSTCONDITIONS)
+
+
 class AdjustSetpointAction:
     """
     Action implementation for adjusting zone temperature setpoints.
@@ -109,84 +160,64 @@ class AdjustSetpointAction:
     ACTION_NAME = "Adjust Zone Setpoint"
 
     @staticmethod
-    def get_input_schema() -> dict:
+    def get_input_schema() -> Mapping[str, Any]:
         """
         Get JSON Schema for AdjustSetpointInput.
 
         Returns:
-            JSON Schema dictionary for action inputs
-        """
-        return {
-            "type": "object",
-            "properties": {
-                "zone_id": {
-                    "type": "string",
-                    "minLength": 1,
-                    "description": "Target zone identifier"
-                },
-                "new_setpoint": {
-                    "type": "number",
-                    "minimum": 50.0,
-                    "maximum": 90.0,
-                    "description": "New temperature setpoint in Fahrenheit"
-                },
-                "reason": {
-                    "type": "string",
-                    "minLength": 1,
-                    "description": "Reason for setpoint adjustment"
-                },
-                "priority": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high", "emergency"],
-                    "default": "medium",
-                    "description": "Adjustment priority"
-                },
-                "max_change": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 15.0,
-                    "default": 5.0,
-                    "description": "Maximum allowed temperature change"
-                },
-                "current_setpoint": {
-                    "type": "number",
-                    "minimum": 50.0,
-                    "maximum": 90.0,
-                    "description": "Current setpoint for validation"
-                }
-            },
-            "required": ["zone_id", "new_setpoint", "reason"],
-            "additionalProperties": False
-        }
+            Read-only JSON Schema mapping for action inputs
+        """
+        return _INPUT_SCHEMA
+
+    @staticmethod
+    def get_input_schema_json() -> bytes:
+        """
+        Get the input JSON Schema pre-serialized for HTTP responses.
+
+        Returns:
+            JSON Schema encoded as UTF-8 bytes
+        """
+        return _INPUT_SCHEMA_JSON
 
     @staticmethod
-    def get_preconditions() -> list[str]:
+    def get_preconditions() -> tuple[str, ...]:
         """
         Get preconditions that must be true before executing this action.
 
         Returns:
-            List of precondition expression strings
+            Tuple of precondition expression strings
         """
-        return [
-            "zone_exists(zone_id)",
-            "zone_is_online(zone_id)",
-            "setpoint_within_limits(new_setpoint, zone_id)",
-            "no_override_active(zone_id)"
-        ]
+        return _PRECONDITIONS
 
     @staticmethod
-    def get_postconditions() -> list[str]:
+    def get_postconditions() -> tuple[str, ...]:
         """
         Get expected postconditions after successful execution.
 
         Returns:
-            List of postcondition expression strings
+            Tuple of postcondition expression strings
+        """
+        return _POSTCONDITIONS
+
+    @staticmethod
+    def get_precondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get preconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled precondition calls
+        """
+        return _PRECONDITION_CALLS
+
+    @staticmethod
+    def get_postcondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get postconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled postcondition calls
         """
-        return [
-            "zone_setpoint_equals(zone_id, new_setpoint)",
-            "zone_responding(zone_id)",
-            "audit_log_created(action_id)"
-        ]
+        return _POSTCONDITION_CALLS
 
     @staticmethod
     def validate_input(input_data: dict) -> AdjustSetpointInput:
@@ -203,3 +234,54 @@ class AdjustSetpointAction:
             ValidationError: If input data is invalid
         """
         return AdjustSetpointInput(**input_data)
+
+    @staticmethod
+    def validate_input_json(raw: bytes | str) -> AdjustSetpointInput:
+        """
+        Validate a raw JSON document against AdjustSetpointInput model.
+
+        Parses and validates in one pass inside pydantic-core, skipping the
+        intermediate Python dict that validate_input() requires.
+
+        Args:
+            raw: JSON-encoded input object
+
+        Returns:
+            Validated AdjustSetpointInput instance
+
+        Raises:
+            ValidationError: If input data is invalid
+        """
+        return AdjustSetpointInput.model_validate_json(raw)
+
+    @staticmethod
+    def validate_inputs(items: list[dict]) -> list[AdjustSetpointInput]:
+        """
+        Validate a batch of raw input dictionaries against AdjustSetpointInput model.
+
+        Args:
+            items: Raw input dictionaries
+
+        Returns:
+            Validated AdjustSetpointInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_python(items)
+
+    @staticmethod
+    def validate_inputs_json(raw: bytes | str) -> list[AdjustSetpointInput]:
+        """
+        Validate a JSON array of inputs against AdjustSetpointInput model.
+
+        Args:
+            raw: JSON-encoded array of input objects
+
+        Returns:
+            Validated AdjustSetpointInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_json(raw)
@@ -5,9 +5,11 @@ Action model for demand management through strategic load shedding.
 Enables temporary reduction of building energy consumption during peak demand.
 """
 
-from typing import Literal
-from pydantic import Field, field_validator, model_validator
+from typing import Any, Literal, Mapping
+from pydantic import Field, TypeAdapter, field_validator, model_validator
 from ..kbe_actions import ActionInput
+from ..types import ComfortHighTemp, ComfortLowTemp, EquipmentType
+from ._frozen import ConditionCall, compile_conditions, dump_json, freeze
 
 
 class LoadShedInput(ActionInput):
@@ -40,7 +42,7 @@ class LoadShedInput(ActionInput):
         le=240,
         description="Duration to maintain load shed (max 4 hours)"
     )
-    equipment_types: list[Literal["hvac", "lighting", "fan", "pump", "chiller", "boiler"]] = Field(
+    equipment_types: list[EquipmentType] = Field(
         default_factory=list,
         description="Equipment types to shed (empty = all)"
     )
@@ -49,16 +51,12 @@ class LoadShedInput(ActionInput):
         min_length=1,
         description="Reason for load shedding"
     )
-    min_comfort_temp: float = Field(
+    min_comfort_temp: ComfortLowTemp = Field(
         default=68.0,
-        ge=60.0,
-        le=75.0,
         description="Minimum acceptable temperature in Fahrenheit"
     )
-    max_comfort_temp: float = Field(
+    max_comfort_temp: ComfortHighTemp = Field(
         default=78.0,
-        ge=70.0,
-        le=85.0,
         description="Maximum acceptable temperature in Fahrenheit"
     )
     priority_zones: list[str] = Field(
@@ -86,12 +84,15 @@ class LoadShedInput(ActionInput):
         Raises:
             ValueError: If duplicate zone IDs or empty strings found
         """
-        if len(v) != len(set(v)):
-            raise ValueError("Duplicate zone IDs not allowed")
-
+        # Single pass; isspace() checks blanks without allocating a stripped copy
+        seen = set()
+        seen_add = seen.add
         for zone_id in v:
-            if not zone_id.strip():
+            if not zone_id or zone_id.isspace():
                 raise ValueError("Zone IDs cannot be empty or whitespace")
+            if zone_id in seen:
+                raise ValueError("Duplicate zone IDs not allowed")
+            seen_add(zone_id)
 
         return v
 
@@ -133,7 +134,9 @@ class LoadShedInput(ActionInput):
             ValueError: If priority zones overlap with shed zones
         """
         if self.priority_zones:
-            overlap = set(self.zone_ids) & set(self.priority_zones)
+            # priority_zones is usually tiny, so scan it against one set
+            shed_zones = set(self.zone_ids)
+            overlap = {zone_id for zone_id in self.priority_zones if zone_id in shed_zones}
             if overlap:
                 raise ValueError(
                     f"Priority zones cannot be in shed zone list: {overlap}"
@@ -169,6 +172,100 @@ class LoadShedInput(ActionInput):
         return v
 
 
+_INPUT_SCHEMA = freeze({
+    "type": "object",
+    "properties": {
+        "zone_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 1,
+            "description": "Target zone identifiers"
+        },
+        "shed_level": {
+            "type": "integer",
+            "enum": [1, 2, 3, 4, 5],
+            "description": "Load shed intensity"
+        },
+        "duration_minutes": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": 240,
+            "description": "Duration in minutes"
+        },
+        "equipment_types": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["hvac", "lighting", "fan", "pump", "chiller", "boiler"]
+            },
+            "description": "Equipment types to shed"
+        },
+        "reason": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Reason for load shedding"
+        },
+        "min_comfort_temp": {
+            "type": "number",
+            "minimum": 60.0,
+            "maximum": 75.0,
+            "default": 68.0,
+            "description": "Minimum comfort temperature"
+        },
+        "max_comfort_temp": {
+            "type": "number",
+            "minimum": 70.0,
+            "maximum": 85.0,
+            "default": 78.0,
+            "description": "Maximum comfort temperature"
+        },
+        "priority_zones": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Zones to protect from shedding"
+        },
+        "expected_savings_kw": {
+            "type": "number",
+            "minimum": 0.0,
+            "description": "Expected energy savings in kW"
+        }
+    },
+    "required": ["zone_ids", "shed_level", "duration_minutes", "reason"],
+    "additionalProperties": False
+})
+
+_INPUT_SCHEMA_JSON = dump_json(_INPUT_SCHEMA)
+
+# Validates whole batches in one pydantic-core call
+_INPUT_LIST_ADAPTER = TypeAdapter(list[LoadShedInput])
+
+_PRECONDITIONS = freeze([
+    "all_zones_exist(zone_ids)",
+    "all_zones_online(zone_ids)",
+    "no_critical_operations_active(zone_ids)",
+    "no_active_overrides(zone_ids)",
+    "sufficient_shed_capacity(zone_ids, shed_level)",
+    "weather_conditions_appropriate()",
+    "occupancy_acceptable_for_shed(zone_ids)"
+])
+
+_POSTCONDITIONS = freeze([
+    "load_reduced_by_target(zone_ids, shed_level)",
+    "temperatures_within_comfort_range(zone_ids, min_comfort_temp, max_comfort_temp)",
+    "equipment_shed_as_specified(zone_ids, equipment_types)",
+    "shed_schedule_created(duration_minutes)",
+    "audit_log_created(action_id)",
+    "power_monitoring_active(zone_ids)"
+])
+
+# Parsed once so evaluators dispatch on names instead of re-parsing strings
+_PRECONDITION_CALLS = compile_conditions(_PRECONDITIONS)
+_POSTCONDITION_CALLS = compile_conditions(_POSTCONDITIONS)
+
+# Shed percentage by level: 1=20%, 2=35%, 3=50%, 4=65%, 5=80%
+_SHED_PERCENTAGES = (0.20, 0.35, 0.50, 0.65, 0.80)
+
+
 class LoadShedAction:
     """
     Action implementation for demand management load shedding.
@@ -181,109 +278,64 @@ class LoadShedAction:
     ACTION_NAME = "Load Shed for Demand Management"
 
     @staticmethod
-    def get_input_schema() -> dict:
+    def get_input_schema() -> Mapping[str, Any]:
         """
         Get JSON Schema for LoadShedInput.
 
         Returns:
-            JSON Schema dictionary for action inputs
+            Read-only JSON Schema mapping for action inputs
         """
-        return {
-            "type": "object",
-            "properties": {
-                "zone_ids": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "minItems": 1,
-                    "description": "Target zone identifiers"
-                },
-                "shed_level": {
-                    "type": "integer",
-                    "enum": [1, 2, 3, 4, 5],
-                    "description": "Load shed intensity"
-                },
-                "duration_minutes": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 240,
-                    "description": "Duration in minutes"
-                },
-                "equipment_types": {
-                    "type": "array",
-                    "items": {
-                        "type": "string",
-                        "enum": ["hvac", "lighting", "fan", "pump", "chiller", "boiler"]
-                    },
-                    "description": "Equipment types to shed"
-                },
-                "reason": {
-                    "type": "string",
-                    "minLength": 1,
-                    "description": "Reason for load shedding"
-                },
-                "min_comfort_temp": {
-                    "type": "number",
-                    "minimum": 60.0,
-                    "maximum": 75.0,
-                    "default": 68.0,
-                    "description": "Minimum comfort temperature"
-                },
-                "max_comfort_temp": {
-                    "type": "number",
-                    "minimum": 70.0,
-                    "maximum": 85.0,
-                    "default": 78.0,
-                    "description": "Maximum comfort temperature"
-                },
-                "priority_zones": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Zones to protect from shedding"
-                },
-                "expected_savings_kw": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "description": "Expected energy savings in kW"
-                }
-            },
-            "required": ["zone_ids", "shed_level", "duration_minutes", "reason"],
-            "additionalProperties": False
-        }
+        return _INPUT_SCHEMA
 
     @staticmethod
-    def get_preconditions() -> list[str]:
+    def get_input_schema_json() -> bytes:
+        """
+        Get the input JSON Schema pre-serialized for HTTP responses.
+
+        Returns:
+            JSON Schema encoded as UTF-8 bytes
+        """
+        return _INPUT_SCHEMA_JSON
+
+    @staticmethod
+    def get_preconditions() -> tuple[str, ...]:
         """
         Get preconditions that must be true before executing this action.
 
         Returns:
-            List of precondition expression strings
+            Tuple of precondition expression strings
         """
-        return [
-            "all_zones_exist(zone_ids)",
-            "all_zones_online(zone_ids)",
-            "no_critical_operations_active(zone_ids)",
-            "no_active_overrides(zone_ids)",
-            "sufficient_shed_capacity(zone_ids, shed_level)",
-            "weather_conditions_appropriate()",
-            "occupancy_acceptable_for_shed(zone_ids)"
-        ]
+        return _PRECONDITIONS
 
     @staticmethod
-    def get_postconditions() -> list[str]:
+    def get_postconditions() -> tuple[str, ...]:
         """
         Get expected postconditions after successful execution.
 
         Returns:
-            List of postcondition expression strings
+            Tuple of postcondition expression strings
+        """
+        return _POSTCONDITIONS
+
+    @staticmethod
+    def get_precondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get preconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled precondition calls
         """
-        return [
-            "load_reduced_by_target(zone_ids, shed_level)",
-            "temperatures_within_comfort_range(zone_ids, min_comfort_temp, max_comfort_temp)",
-            "equipment_shed_as_specified(zone_ids, equipment_types)",
-            "shed_schedule_created(duration_minutes)",
-            "audit_log_created(action_id)",
-            "power_monitoring_active(zone_ids)"
-        ]
+        return _PRECONDITION_CALLS
+
+    @staticmethod
+    def get_postcondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get postconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled postcondition calls
+        """
+        return _POSTCONDITION_CALLS
 
     @staticmethod
     def validate_input(input_data: dict) -> LoadShedInput:
@@ -301,6 +353,57 @@ class LoadShedAction:
         """
         return LoadShedInput(**input_data)
 
+    @staticmethod
+    def validate_input_json(raw: bytes | str) -> LoadShedInput:
+        """
+        Validate a raw JSON document against LoadShedInput model.
+
+        Parses and validates in one pass inside pydantic-core, skipping the
+        intermediate Python dict that validate_input() requires.
+
+        Args:
+            raw: JSON-encoded input object
+
+        Returns:
+            Validated LoadShedInput instance
+
+        Raises:
+            ValidationError: If input data is invalid
+        """
+        return LoadShedInput.model_validate_json(raw)
+
+    @staticmethod
+    def validate_inputs(items: list[dict]) -> list[LoadShedInput]:
+        """
+        Validate a batch of raw input dictionaries against LoadShedInput model.
+
+        Args:
+            items: Raw input dictionaries
+
+        Returns:
+            Validated LoadShedInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_python(items)
+
+    @staticmethod
+    def validate_inputs_json(raw: bytes | str) -> list[LoadShedInput]:
+        """
+        Validate a JSON array of inputs against LoadShedInput model.
+
+        Args:
+            raw: JSON-encoded array of input objects
+
+        Returns:
+            Validated LoadShedInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_json(raw)
+
     @staticmethod
     def calculate_estimated_savings(
         zone_count: int,
@@ -318,10 +421,7 @@ class LoadShedAction:
         Returns:
             Estimated savings in kilowatts
         """
-        # Shed percentage by level: 1=20%, 2=35%, 3=50%, 4=65%, 5=80%
-        shed_percentages = {1: 0.20, 2: 0.35, 3: 0.50, 4: 0.65, 5: 0.80}
-
-        total_load = zone_count * avg_zone_load_kw
-        shed_percentage = shed_percentages.get(shed_level, 0.50)
+        index = shed_level - 1
+        shed_percentage = _SHED_PERCENTAGES[index] if 0 <= index < 5 else 0.50
 
-        return total_load * shed_percentage
+        return zone_count * avg_zone_load_kw * shed_percentage
@@ -5,10 +5,54 @@ Action model for proactive cooling optimization to reduce peak demand costs.
 Pre-cools building zones during off-peak hours before anticipated high occupancy/temperature periods.
 """
 
-from typing import Literal
-from datetime import datetime, time
-from pydantic import Field, field_validator, model_validator
+from typing import Any, Iterable, Literal, Mapping
+from pydantic import Field, TypeAdapter, field_validator, model_validator
+from pydantic_core import PydanticCustomError
 from ..kbe_actions import ActionInput
+from ..types import HHMM_PATTERN
+from ._frozen import ConditionCall, compile_conditions, dump_json, freeze
+
+
+def _minutes_since_midnight(value: str) -> int:
+    """
+    Convert an HH:MM string to minutes since midnight.
+
+    Args:
+        value: Time string in HH:MM 24-hour format
+
+    Returns:
+        Minutes since midnight
+
+    Raises:
+        ValueError: If value is not a valid HH:MM time
+    """
+    # Slicing and int() beat a regex match here; the field pattern has already run
+    if len(value) == 5 and value[2] == ":" and value.isascii():
+        hours, minutes = value[:2], value[3:]
+        if hours.isdigit() and minutes.isdigit():
+            hour, minute = int(hours), int(minutes)
+            if hour < 24 and minute < 60:
+                return hour * 60 + minute
+    raise ValueError(f"Invalid time format: {value!r}")
+
+
+def time_window_minutes(start_time: str, occupancy_start: str) -> int:
+    """
+    Minutes from start_time until occupancy_start, wrapping past midnight.
+
+    Args:
+        start_time: Pre-cooling start in HH:MM 24-hour format
+        occupancy_start: Occupancy start in HH:MM 24-hour format
+
+    Returns:
+        Length of the pre-cooling window in minutes (0 to 1439)
+
+    Raises:
+        ValueError: If either value is not a valid HH:MM time
+    """
+    window = _minutes_since_midnight(occupancy_start) - _minutes_since_midnight(start_time)
+    # Handle overnight scenarios (e.g., pre-cool at 23:00 for 07:00 occupancy)
+    return window + 24 * 60 if window < 0 else window
 
 
 class PreCoolingInput(ActionInput):
@@ -16,7 +60,7 @@ class PreCoolingInput(ActionInput):
     Input model for pre-cooling optimization actions.
 
     Attributes:
-        zone_ids: List of zone identifiers to pre-cool
+        zone_ids: Sorted zone identifiers to pre-cool
         target_temp: Target temperature to achieve before occupancy period (°F)
         start_time: Time to begin pre-cooling (HH:MM format)
         occupancy_start: Expected occupancy/high-load start time (HH:MM format)
@@ -27,10 +71,10 @@ class PreCoolingInput(ActionInput):
         reason: Reason for pre-cooling action
     """
 
-    zone_ids: list[str] = Field(
+    zone_ids: tuple[str, ...] = Field(
         ...,
         min_length=1,
-        description="Target zone identifiers for pre-cooling"
+        description="Target zone identifiers for pre-cooling (stored sorted)"
     )
     target_temp: float = Field(
         ...,
@@ -40,12 +84,12 @@ class PreCoolingInput(ActionInput):
     )
     start_time: str = Field(
         ...,
-        pattern=r'^([01]\d|2[0-3]):([0-5]\d)$',
+        pattern=HHMM_PATTERN,
         description="Pre-cooling start time in HH:MM format (24-hour)"
     )
     occupancy_start: str = Field(
         ...,
-        pattern=r'^([01]\d|2[0-3]):([0-5]\d)$',
+        pattern=HHMM_PATTERN,
         description="Expected occupancy start time in HH:MM format (24-hour)"
     )
     max_rate_delta: float = Field(
@@ -87,88 +131,82 @@ class PreCoolingInput(ActionInput):
 
     @field_validator("zone_ids")
     @classmethod
-    def validate_zone_ids(cls, v: list[str]) -> list[str]:
+    def validate_zone_ids(cls, v: tuple[str, ...]) -> tuple[str, ...]:
         """
-        Validate zone IDs are non-empty and unique.
+        Validate zone IDs are non-empty and unique, and sort them.
+
+        Sorted tuples are hashable and order-independent, so the same zone set
+        always yields the same key for caching or conflict checks.
 
         Args:
-            v: List of zone IDs
+            v: Tuple of zone IDs
 
         Returns:
-            Validated zone ID list
+            Validated zone IDs in sorted order
 
         Raises:
             ValueError: If duplicate zone IDs or empty strings found
         """
-        if len(v) != len(set(v)):
-            raise ValueError("Duplicate zone IDs not allowed")
-
+        # Single pass; isspace() checks blanks without allocating a stripped copy
+        seen = set()
+        seen_add = seen.add
         for zone_id in v:
-            if not zone_id.strip():
+            if not zone_id or zone_id.isspace():
                 raise ValueError("Zone IDs cannot be empty or whitespace")
+            if zone_id in seen:
+                raise ValueError("Duplicate zone IDs not allowed")
+            seen_add(zone_id)
 
-        return v
+        return tuple(sorted(v))
 
     @model_validator(mode="after")
-    def validate_time_window(self) -> "PreCoolingInput":
+    def validate_cross_field_constraints(self) -> "PreCoolingInput":
         """
-        Validate that start_time is before occupancy_start and allows sufficient time.
+        Validate the pre-cooling window and outdoor temperature range.
+
+        Both checks live in one validator so construction makes a single
+        Python callback after pydantic-core has applied the per-field bounds.
 
         Returns:
             Validated model instance
 
         Raises:
-            ValueError: If time window is invalid
+            PydanticCustomError: If the time window or outdoor temp range is invalid
         """
-        try:
-            start = datetime.strptime(self.start_time, "%H:%M").time()
-            occupancy = datetime.strptime(self.occupancy_start, "%H:%M").time()
-        except ValueError as e:
-            raise ValueError(f"Invalid time format: {e}")
-
-        # Convert to minutes for comparison
-        start_minutes = start.hour * 60 + start.minute
-        occupancy_minutes = occupancy.hour * 60 + occupancy.minute
-
-        # Handle overnight scenarios (e.g., pre-cool at 23:00 for 07:00 occupancy)
-        if occupancy_minutes < start_minutes:
-            occupancy_minutes += 24 * 60
-
-        time_window = occupancy_minutes - start_minutes
+        time_window = time_window_minutes(self.start_time, self.occupancy_start)
 
         # Minimum 30 minutes pre-cooling window
         if time_window < 30:
-            raise ValueError(
-                f"Pre-cooling window too short ({time_window} minutes). "
-                "Minimum 30 minutes required between start_time and occupancy_start."
+            raise PydanticCustomError(
+                "precooling_window_too_short",
+                "Pre-cooling window too short ({time_window} minutes). "
+                "Minimum 30 minutes required between start_time and occupancy_start.",
+                {"time_window": time_window}
             )
 
         # Maximum 8 hours pre-cooling window (reasonable for overnight pre-cooling)
         if time_window > 480:
-            raise ValueError(
-                f"Pre-cooling window too long ({time_window} minutes). "
-                "Maximum 8 hours (480 minutes) allowed."
+            raise PydanticCustomError(
+                "precooling_window_too_long",
+                "Pre-cooling window too long ({time_window} minutes). "
+                "Maximum 8 hours (480 minutes) allowed.",
+                {"time_window": time_window}
             )
 
-        return self
-
-    @model_validator(mode="after")
-    def validate_outdoor_temps(self) -> "PreCoolingInput":
-        """
-        Validate outdoor temperature constraints if specified.
-
-        Returns:
-            Validated model instance
-
-        Raises:
-            ValueError: If outdoor temp range is invalid
-        """
-        if self.min_outdoor_temp is not None and self.max_outdoor_temp is not None:
-            if self.min_outdoor_temp >= self.max_outdoor_temp:
-                raise ValueError(
-                    f"min_outdoor_temp ({self.min_outdoor_temp}°F) must be less than "
-                    f"max_outdoor_temp ({self.max_outdoor_temp}°F)"
-                )
+        if (
+            self.min_outdoor_temp is not None
+            and self.max_outdoor_temp is not None
+            and self.min_outdoor_temp >= self.max_outdoor_temp
+        ):
+            raise PydanticCustomError(
+                "outdoor_temp_range",
+                "min_outdoor_temp ({min_outdoor_temp}°F) must be less than "
+                "max_outdoor_temp ({max_outdoor_temp}°F)",
+                {
+                    "min_outdoor_temp": self.min_outdoor_temp,
+                    "max_outdoor_temp": self.max_outdoor_temp
+                }
+            )
 
         return self
 
@@ -185,17 +223,160 @@ class PreCoolingInput(ActionInput):
             Validated temperature
 
         Raises:
-            ValueError: If temperature is too aggressive
+            PydanticCustomError: If temperature is too aggressive
         """
         if v < 62.0:
-            raise ValueError(
-                f"Target temperature {v}°F is too aggressive for pre-cooling. "
-                "Minimum 62°F to avoid excessive energy waste."
+            raise PydanticCustomError(
+                "target_temp_too_aggressive",
+                "Target temperature {target_temp}°F is too aggressive for pre-cooling. "
+                "Minimum 62°F to avoid excessive energy waste.",
+                {"target_temp": v}
             )
 
         return v
 
 
+_INPUT_SCHEMA = freeze({
+    "type": "object",
+    "properties": {
+        "zone_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 1,
+            "description": "Target zone identifiers"
+        },
+        "target_temp": {
+            "type": "number",
+            "minimum": 60.0,
+            "maximum": 75.0,
+            "description": "Target pre-cooling temperature in °F"
+        },
+        "start_time": {
+            "type": "string",
+            "pattern": HHMM_PATTERN,
+            "description": "Start time (HH:MM, 24-hour)"
+        },
+        "occupancy_start": {
+            "type": "string",
+            "pattern": HHMM_PATTERN,
+            "description": "Occupancy start time (HH:MM, 24-hour)"
+        },
+        "max_rate_delta": {
+            "type": "number",
+            "minimum": 1.0,
+            "maximum": 10.0,
+            "default": 5.0,
+            "description": "Max cooling rate (°F/hr)"
+        },
+        "priority": {
+            "type": "string",
+            "enum": ["low", "medium", "high"],
+            "default": "medium",
+            "description": "Priority level"
+        },
+        "enable_adaptive": {
+            "type": "boolean",
+            "default": True,
+            "description": "Enable adaptive learning"
+        },
+        "cost_limit_usd": {
+            "type": "number",
+            "minimum": 0.0,
+            "description": "Maximum cost in USD"
+        },
+        "reason": {
+            "type": "string",
+            "minLength": 1,
+            "description": "Reason for pre-cooling"
+        },
+        "min_outdoor_temp": {
+            "type": "number",
+            "minimum": -20.0,
+            "maximum": 100.0,
+            "description": "Min outdoor temp (°F)"
+        },
+        "max_outdoor_temp": {
+            "type": "number",
+            "minimum": -20.0,
+            "maximum": 120.0,
+            "description": "Max outdoor temp (°F)"
+        }
+    },
+    "required": ["zone_ids", "target_temp", "start_time", "occupancy_start", "reason"],
+    "additionalProperties": False
+})
+
+_INPUT_SCHEMA_JSON = dump_json(_INPUT_SCHEMA)
+
+# Validates whole batches in one pydantic-core call
+_INPUT_LIST_ADAPTER = TypeAdapter(list[PreCoolingInput])
+
+_PRECONDITIONS = freeze([
+    "all_zones_exist(zone_ids)",
+    "all_zones_online(zone_ids)",
+    "current_time_before_start_time(start_time)",
+    "sufficient_precooling_window(start_time, occupancy_start)",
+    "hvac_systems_operational(zone_ids)",
+    "no_conflicting_schedules(zone_ids, start_time)",
+    "weather_forecast_available()",
+    "outdoor_temps_within_limits(min_outdoor_temp, max_outdoor_temp)",
+    "energy_prices_within_budget(cost_limit_usd)"
+])
+
+_POSTCONDITIONS = freeze([
+    "zones_at_target_temp(zone_ids, target_temp)",
+    "cooling_rate_within_limits(max_rate_delta)",
+    "pre_cooling_schedule_created(start_time, occupancy_start)",
+    "energy_consumption_logged(zone_ids)",
+    "cost_within_budget(cost_limit_usd)",
+    "occupants_notified_if_needed(zone_ids)",
+    "adaptive_data_recorded(enable_adaptive)",
+    "audit_log_created(action_id)"
+])
+
+# Parsed once so evaluators dispatch on names instead of re-parsing strings
+_PRECONDITION_CALLS = compile_conditions(_PRECONDITIONS)
+_POSTCONDITION_CALLS = compile_conditions(_POSTCONDITIONS)
+
+_VALIDATION_RULES = freeze([
+    "Target temp: 60-75°F (aggressive cooling avoided)",
+    "Time window: 30 min - 8 hours before occupancy",
+    "Cooling rate: Max 10°F/hr (equipment protection)",
+    "Priority: Emergency not allowed (planned action only)",
+    "Energy Manager: Required for cost > $100",
+    "Facility Manager: Required for multi-zone (>3 zones)",
+    "Adaptive learning: Historical data used when enabled",
+    "Weather integration: Outdoor temp constraints enforced"
+])
+
+_ODRL_POLICIES = freeze({
+    "operator": {
+        "permitted": False,
+        "reason": "Pre-cooling requires optimization expertise"
+    },
+    "facility_manager": {
+        "permitted": True,
+        "constraints": [
+            "max_zones: 3",
+            "max_cost: $50",
+            "priority: low/medium only"
+        ]
+    },
+    "energy_manager": {
+        "permitted": True,
+        "constraints": [
+            "max_zones: unlimited",
+            "max_cost: $500",
+            "priority: low/medium/high"
+        ]
+    },
+    "contractor": {
+        "permitted": False,
+        "reason": "Pre-cooling requires building system knowledge"
+    }
+})
+
+
 class PreCoolingAction:
     """
     Action implementation for pre-cooling optimization.
@@ -208,175 +389,84 @@ class PreCoolingAction:
     ACTION_NAME = "Pre-Cooling for Demand Optimization"
 
     @staticmethod
-    def get_input_schema() -> dict:
+    def get_input_schema() -> Mapping[str, Any]:
         """
         Get JSON Schema for PreCoolingInput.
 
         Returns:
-            JSON Schema dictionary for action inputs
-        """
-        return {
-            "type": "object",
-            "properties": {
-                "zone_ids": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "minItems": 1,
-                    "description": "Target zone identifiers"
-                },
-                "target_temp": {
-                    "type": "number",
-                    "minimum": 60.0,
-                    "maximum": 75.0,
-                    "description": "Target pre-cooling temperature in °F"
-                },
-                "start_time": {
-                    "type": "string",
-                    "pattern": "^([01]\\d|2[0-3]):([0-5]\\d)$",
-                    "description": "Start time (HH:MM, 24-hour)"
-                },
-                "occupancy_start": {
-                    "type": "string",
-                    "pattern": "^([01]\\d|2[0-3]):([0-5]\\d)$",
-                    "description": "Occupancy start time (HH:MM, 24-hour)"
-                },
-                "max_rate_delta": {
-                    "type": "number",
-                    "minimum": 1.0,
-                    "maximum": 10.0,
-                    "default": 5.0,
-                    "description": "Max cooling rate (°F/hr)"
-                },
-                "priority": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"],
-                    "default": "medium",
-                    "description": "Priority level"
-                },
-                "enable_adaptive": {
-                    "type": "boolean",
-                    "default": True,
-                    "description": "Enable adaptive learning"
-                },
-                "cost_limit_usd": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "description": "Maximum cost in USD"
-                },
-                "reason": {
-                    "type": "string",
-                    "minLength": 1,
-                    "description": "Reason for pre-cooling"
-                },
-                "min_outdoor_temp": {
-                    "type": "number",
-                    "minimum": -20.0,
-                    "maximum": 100.0,
-                    "description": "Min outdoor temp (°F)"
-                },
-                "max_outdoor_temp": {
-                    "type": "number",
-                    "minimum": -20.0,
-                    "maximum": 120.0,
-                    "description": "Max outdoor temp (°F)"
-                }
-            },
-            "required": ["zone_ids", "target_temp", "start_time", "occupancy_start", "reason"],
-            "additionalProperties": False
-        }
+            Read-only JSON Schema mapping for action inputs
+        """
+        return _INPUT_SCHEMA
+
+    @staticmethod
+    def get_input_schema_json() -> bytes:
+        """
+        Get the input JSON Schema pre-serialized for HTTP responses.
+
+        Returns:
+            JSON Schema encoded as UTF-8 bytes
+        """
+        return _INPUT_SCHEMA_JSON
 
     @staticmethod
-    def get_validation_rules() -> list[str]:
+    def get_validation_rules() -> tuple[str, ...]:
         """
         Get SHACL-style validation rules for pre-cooling actions.
 
         Returns:
-            List of validation rule descriptions
+            Tuple of validation rule descriptions
         """
-        return [
-            "Target temp: 60-75°F (aggressive cooling avoided)",
-            "Time window: 30 min - 8 hours before occupancy",
-            "Cooling rate: Max 10°F/hr (equipment protection)",
-            "Priority: Emergency not allowed (planned action only)",
-            "Energy Manager: Required for cost > $100",
-            "Facility Manager: Required for multi-zone (>3 zones)",
-            "Adaptive learning: Historical data used when enabled",
-            "Weather integration: Outdoor temp constraints enforced"
-        ]
+        return _VALIDATION_RULES
 
     @staticmethod
-    def get_odrl_policies() -> dict[str, dict]:
+    def get_odrl_policies() -> Mapping[str, Mapping[str, Any]]:
         """
         Get ODRL governance policies for pre-cooling actions.
 
         Returns:
-            Dictionary mapping roles to their permissions
-        """
-        return {
-            "operator": {
-                "permitted": False,
-                "reason": "Pre-cooling requires optimization expertise"
-            },
-            "facility_manager": {
-                "permitted": True,
-                "constraints": [
-                    "max_zones: 3",
-                    "max_cost: $50",
-                    "priority: low/medium only"
-                ]
-            },
-            "energy_manager": {
-                "permitted": True,
-                "constraints": [
-                    "max_zones: unlimited",
-                    "max_cost: $500",
-                    "priority: low/medium/high"
-                ]
-            },
-            "contractor": {
-                "permitted": False,
-                "reason": "Pre-cooling requires building system knowledge"
-            }
-        }
+            Read-only mapping of roles to their permissions
+        """
+        return _ODRL_POLICIES
 
     @staticmethod
-    def get_preconditions() -> list[str]:
+    def get_preconditions() -> tuple[str, ...]:
         """
         Get preconditions that must be true before executing this action.
 
         Returns:
-            List of precondition expression strings
+            Tuple of precondition expression strings
         """
-        return [
-            "all_zones_exist(zone_ids)",
-            "all_zones_online(zone_ids)",
-            "current_time_before_start_time(start_time)",
-            "sufficient_precooling_window(start_time, occupancy_start)",
-            "hvac_systems_operational(zone_ids)",
-            "no_conflicting_schedules(zone_ids, start_time)",
-            "weather_forecast_available()",
-            "outdoor_temps_within_limits(min_outdoor_temp, max_outdoor_temp)",
-            "energy_prices_within_budget(cost_limit_usd)"
-        ]
+        return _PRECONDITIONS
 
     @staticmethod
-    def get_postconditions() -> list[str]:
+    def get_postconditions() -> tuple[str, ...]:
         """
         Get expected postconditions after successful execution.
 
         Returns:
-            List of postcondition expression strings
+            Tuple of postcondition expression strings
         """
-        return [
-            "zones_at_target_temp(zone_ids, target_temp)",
-            "cooling_rate_within_limits(max_rate_delta)",
-            "pre_cooling_schedule_created(start_time, occupancy_start)",
-            "energy_consumption_logged(zone_ids)",
-            "cost_within_budget(cost_limit_usd)",
-            "occupants_notified_if_needed(zone_ids)",
-            "adaptive_data_recorded(enable_adaptive)",
-            "audit_log_created(action_id)"
-        ]
+        return _POSTCONDITIONS
+
+    @staticmethod
+    def get_precondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get preconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled precondition calls
+        """
+        return _PRECONDITION_CALLS
+
+    @staticmethod
+    def get_postcondition_calls() -> tuple[ConditionCall, ...]:
+        """
+        Get postconditions parsed into (predicate_name, argument_names) pairs.
+
+        Returns:
+            Tuple of compiled postcondition calls
+        """
+        return _POSTCONDITION_CALLS
 
     @staticmethod
     def validate_input(input_data: dict) -> PreCoolingInput:
@@ -394,6 +484,57 @@ class PreCoolingAction:
         """
         return PreCoolingInput(**input_data)
 
+    @staticmethod
+    def validate_input_json(raw: bytes | str) -> PreCoolingInput:
+        """
+        Validate a raw JSON document against PreCoolingInput model.
+
+        Parses and validates in one pass inside pydantic-core, skipping the
+        intermediate Python dict that validate_input() requires.
+
+        Args:
+            raw: JSON-encoded input object
+
+        Returns:
+            Validated PreCoolingInput instance
+
+        Raises:
+            ValidationError: If input data is invalid
+        """
+        return PreCoolingInput.model_validate_json(raw)
+
+    @staticmethod
+    def validate_inputs(items: list[dict]) -> list[PreCoolingInput]:
+        """
+        Validate a batch of raw input dictionaries against PreCoolingInput model.
+
+        Args:
+            items: Raw input dictionaries
+
+        Returns:
+            Validated PreCoolingInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_python(items)
+
+    @staticmethod
+    def validate_inputs_json(raw: bytes | str) -> list[PreCoolingInput]:
+        """
+        Validate a JSON array of inputs against PreCoolingInput model.
+
+        Args:
+            raw: JSON-encoded array of input objects
+
+        Returns:
+            Validated PreCoolingInput instances, in input order
+
+        Raises:
+            ValidationError: If any item is invalid (errors are indexed by position)
+        """
+        return _INPUT_LIST_ADAPTER.validate_json(raw)
+
     @staticmethod
     def calculate_estimated_cost(
         zone_count: int,
@@ -417,6 +558,29 @@ class PreCoolingAction:
         estimated_kwh = zone_count * target_temp_delta * duration_hours * 3.0
         return estimated_kwh * electricity_rate_per_kwh
 
+    @staticmethod
+    def calculate_estimated_costs(
+        candidates: Iterable[tuple[int, float, float]],
+        electricity_rate_per_kwh: float = 0.12
+    ) -> list[float]:
+        """
+        Calculate estimated costs for many candidate schedules in one call.
+
+        Uses the same formula as calculate_estimated_cost() without a method
+        call per candidate, for optimizers scoring many schedules at once.
+
+        Args:
+            candidates: (zone_count, target_temp_delta, duration_hours) tuples
+            electricity_rate_per_kwh: Cost per kWh in USD
+
+        Returns:
+            Estimated cost in USD for each candidate, in input order
+        """
+        return [
+            zone_count * target_temp_delta * duration_hours * 3.0 * electricity_rate_per_kwh
+            for zone_count, target_temp_delta, duration_hours in candidates
+        ]
+
     @staticmethod
     def calculate_estimated_savings(
         zone_count: int,
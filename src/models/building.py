@@ -6,7 +6,8 @@ These models provide validation and structure for the building management system
 """
 
 from typing import Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from .types import EquipmentType, Fahrenheit
 
 
 class Equipment(BaseModel):
@@ -20,8 +21,10 @@ class Equipment(BaseModel):
         power_usage: Current power consumption in watts
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Unique equipment identifier")
-    type: Literal["hvac", "lighting", "fan", "pump", "chiller", "boiler"] = Field(
+    type: EquipmentType = Field(
         ...,
         description="Equipment type"
     )
@@ -29,31 +32,14 @@ class Equipment(BaseModel):
         ...,
         description="Current equipment status"
     )
+    # Bounds are checked inside pydantic-core; Equipment has no Python validators
     power_usage: float = Field(
         ...,
         ge=0.0,
-        description="Current power usage in watts"
+        le=100000.0,
+        description="Current power usage in watts (max 100kW)"
     )
 
-    @field_validator("power_usage")
-    @classmethod
-    def validate_power_usage(cls, v: float) -> float:
-        """
-        Validate that power usage is a reasonable value.
-
-        Args:
-            v: Power usage value in watts
-
-        Returns:
-            Validated power usage value
-
-        Raises:
-            ValueError: If power usage exceeds 100kW (100000W)
-        """
-        if v > 100000:
-            raise ValueError("Power usage exceeds reasonable maximum (100kW)")
-        return v
-
 
 class Zone(BaseModel):
     """
@@ -68,6 +54,8 @@ class Zone(BaseModel):
         equipment: List of equipment serving this zone
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Unique zone identifier")
     name: str = Field(..., min_length=1, description="Zone name")
     current_temp: float = Field(
@@ -76,10 +64,8 @@ class Zone(BaseModel):
         le=150.0,
         description="Current temperature in Fahrenheit"
     )
-    setpoint: float = Field(
+    setpoint: Fahrenheit = Field(
         ...,
-        ge=50.0,
-        le=90.0,
         description="Target temperature setpoint in Fahrenheit"
     )
     occupancy_mode: Literal["occupied", "unoccupied", "scheduled"] = Field(
@@ -106,7 +92,7 @@ class Zone(BaseModel):
         Raises:
             ValueError: If setpoint is outside comfort range (60-80°F)
         """
-        if v < 60.0 or v > 80.0:
+        if not 60.0 <= v <= 80.0:
             raise ValueError(
                 f"Setpoint {v}°F is outside typical comfort range (60-80°F)"
             )
@@ -143,6 +129,8 @@ class Building(BaseModel):
         zones: List of zones within the building
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Unique building identifier")
     name: str = Field(..., min_length=1, description="Building name")
     zones: list[Zone] = Field(
@@ -185,7 +173,11 @@ class Building(BaseModel):
         Raises:
             ValueError: If duplicate zone IDs are found
         """
-        zone_ids = [zone.id for zone in v]
-        if len(zone_ids) != len(set(zone_ids)):
-            raise ValueError("Duplicate zone IDs found in building")
+        # Single pass that stops at the first duplicate
+        seen = set()
+        seen_add = seen.add
+        for zone in v:
+            if zone.id in seen:
+                raise ValueError("Duplicate zone IDs found in building")
+            seen_add(zone.id)
         return v
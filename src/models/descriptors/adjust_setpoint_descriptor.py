@@ -9,11 +9,13 @@ from src.models.action_descriptor import (
     UIFieldDescriptor,
     GraphNodeDescriptor,
     AuditLogDescriptor,
-    action_registry
+    action_registry,
+    freeze_policies
 )
 
 
-adjust_setpoint_descriptor = ActionDescriptor(
+# Built from trusted literals; tests/test_action_compliance.py checks completeness
+adjust_setpoint_descriptor = ActionDescriptor.model_construct(
     action_id="adjust-setpoint",
     action_name="Adjust Temperature Setpoint",
     action_type="control",
@@ -21,7 +23,7 @@ adjust_setpoint_descriptor = ActionDescriptor(
     version="1.0.0",
 
     # UI Fields - drives form generation
-    ui_fields=[
+    ui_fields=(
         UIFieldDescriptor(
             field_name="user_role",
             field_type="select",
@@ -75,12 +77,12 @@ adjust_setpoint_descriptor = ActionDescriptor(
             placeholder="e.g., Occupant complaint",
             help_text="Optional explanation for audit trail"
         )
-    ],
+    ),
 
     ui_layout="single-column",
 
     # Graph Representation
-    graph_nodes=[
+    graph_nodes=(
         GraphNodeDescriptor(
             node_id="action:adjust-setpoint",
             node_type="action",
@@ -125,7 +127,7 @@ adjust_setpoint_descriptor = ActionDescriptor(
             label="Contractor: No Emergency Priority",
             description="ODRL: Contractors cannot use emergency priority"
         )
-    ],
+    ),
 
     # Audit Log Formatting
     audit_descriptor=AuditLogDescriptor(
@@ -144,15 +146,15 @@ adjust_setpoint_descriptor = ActionDescriptor(
     ),
 
     # SHACL Constraints
-    shacl_constraints=[
+    shacl_constraints=(
         "Setpoint range: 60-80°F (comfort)",
         "Max delta: 5°F for operators, 15°F for managers",
         "Server room protection: 15-25°C critical range",
         "Occupancy constraints enforced"
-    ],
+    ),
 
     # ODRL Governance
-    odrl_policies={
+    odrl_policies=freeze_policies({
         "operator": {
             "permitted": True,
             "constraints": [
@@ -187,12 +189,12 @@ adjust_setpoint_descriptor = ActionDescriptor(
                 "temporary_access: true"
             ]
         }
-    },
+    }),
 
     # Target & Execution
     target_type="brick:Temperature_Setpoint",
-    required_permissions=["zone:write", "setpoint:modify"],
-    side_effects=["hvac:mode_change", "power:consumption_change", "audit:log"],
+    required_permissions=("zone:write", "setpoint:modify"),
+    side_effects=("hvac:mode_change", "power:consumption_change", "audit:log"),
     handler_function="_handle_set_temperature",
     validation_class="AdjustSetpointInput"
 )
@@ -9,11 +9,13 @@ from src.models.action_descriptor import (
     UIFieldDescriptor,
     GraphNodeDescriptor,
     AuditLogDescriptor,
-    action_registry
+    action_registry,
+    freeze_policies
 )
 
 
-load_shed_descriptor = ActionDescriptor(
+# Built from trusted literals; tests/test_action_compliance.py checks completeness
+load_shed_descriptor = ActionDescriptor.model_construct(
     action_id="load-shed",
     action_name="Load Shed - Reduce Lighting",
     action_type="demand_response",
@@ -21,7 +23,7 @@ load_shed_descriptor = ActionDescriptor(
     version="1.0.0",
 
     # UI Fields - drives form generation
-    ui_fields=[
+    ui_fields=(
         UIFieldDescriptor(
             field_name="user_role",
             field_type="select",
@@ -66,12 +68,12 @@ load_shed_descriptor = ActionDescriptor(
             placeholder="e.g., Peak demand event",
             help_text="Optional explanation for audit trail"
         )
-    ],
+    ),
 
     ui_layout="single-column",
 
     # Graph Representation
-    graph_nodes=[
+    graph_nodes=(
         GraphNodeDescriptor(
             node_id="action:load-shed",
             node_type="action",
@@ -109,7 +111,7 @@ load_shed_descriptor = ActionDescriptor(
             label="Energy Manager: Required for L4-5",
             description="ODRL: High shed levels require energy manager authorization"
         )
-    ],
+    ),
 
     # Audit Log Formatting
     audit_descriptor=AuditLogDescriptor(
@@ -128,15 +130,15 @@ load_shed_descriptor = ActionDescriptor(
     ),
 
     # SHACL Constraints
-    shacl_constraints=[
+    shacl_constraints=(
         "Shed level: 1-5 discrete levels",
         "Duration: Max 240 minutes, Level 4-5 max 120 minutes",
         "Occupancy-aware: Min 40% illumination when occupied",
         "Server room exemption enforced"
-    ],
+    ),
 
     # ODRL Governance
-    odrl_policies={
+    odrl_policies=freeze_policies({
         "operator": {
             "permitted": True,
             "constraints": [
@@ -166,12 +168,12 @@ load_shed_descriptor = ActionDescriptor(
             "permitted": False,
             "reason": "Load shedding requires operational authority"
         }
-    },
+    }),
 
     # Target & Execution
     target_type="brick:Lighting_System",
-    required_permissions=["zone:write", "lighting:control", "demand:manage"],
-    side_effects=["power:reduction", "comfort:degradation", "occupancy:notification"],
+    required_permissions=("zone:write", "lighting:control", "demand:manage"),
+    side_effects=("power:reduction", "comfort:degradation", "occupancy:notification"),
     handler_function="_handle_load_shed",
     validation_class="LoadShedInput"
 )
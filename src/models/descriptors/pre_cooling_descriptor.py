@@ -9,11 +9,14 @@ from src.models.action_descriptor import (
     UIFieldDescriptor,
     GraphNodeDescriptor,
     AuditLogDescriptor,
-    action_registry
+    action_registry,
+    freeze_policies
 )
+from src.models.types import HHMM_PATTERN
 
 
-pre_cooling_descriptor = ActionDescriptor(
+# Built from trusted literals; tests/test_action_compliance.py checks completeness
+pre_cooling_descriptor = ActionDescriptor.model_construct(
     action_id="pre-cooling",
     action_name="Pre-Cooling - Optimize Peak Demand",
     action_type="optimization",
@@ -21,7 +24,7 @@ pre_cooling_descriptor = ActionDescriptor(
     version="1.0.0",
 
     # UI Fields - drives form generation
-    ui_fields=[
+    ui_fields=(
         UIFieldDescriptor(
             field_name="user_role",
             field_type="select",
@@ -61,7 +64,7 @@ pre_cooling_descriptor = ActionDescriptor(
             label="Start Time (HH:MM, 24-hour)",
             required=True,
             default_value="05:00",
-            pattern=r"^([01]\d|2[0-3]):([0-5]\d)$",
+            pattern=HHMM_PATTERN,
             placeholder="05:00",
             help_text="When to begin pre-cooling"
         ),
@@ -71,7 +74,7 @@ pre_cooling_descriptor = ActionDescriptor(
             label="Occupancy Start (HH:MM, 24-hour)",
             required=True,
             default_value="08:00",
-            pattern=r"^([01]\d|2[0-3]):([0-5]\d)$",
+            pattern=HHMM_PATTERN,
             placeholder="08:00",
             help_text="When occupants arrive"
         ),
@@ -113,12 +116,12 @@ pre_cooling_descriptor = ActionDescriptor(
             placeholder="e.g., Peak demand reduction",
             help_text="Explanation for pre-cooling action"
         )
-    ],
+    ),
 
     ui_layout="single-column",
 
     # Graph Representation
-    graph_nodes=[
+    graph_nodes=(
         GraphNodeDescriptor(
             node_id="action:pre-cooling",
             node_type="action",
@@ -184,7 +187,7 @@ pre_cooling_descriptor = ActionDescriptor(
             label="Contractor: No Access",
             description="ODRL: Requires building system knowledge"
         )
-    ],
+    ),
 
     # Audit Log Formatting
     audit_descriptor=AuditLogDescriptor(
@@ -214,17 +217,17 @@ pre_cooling_descriptor = ActionDescriptor(
     ),
 
     # SHACL Constraints
-    shacl_constraints=[
+    shacl_constraints=(
         "Target temperature: 60-75°F (≥62°F for economics)",
         "Time window: 30 minutes to 8 hours",
         "Max cooling rate: 1-10°F/hr",
         "No duplicate zones, no empty zone IDs",
         "Time format: HH:MM (24-hour)",
         "Overnight windows supported"
-    ],
+    ),
 
     # ODRL Governance
-    odrl_policies={
+    odrl_policies=freeze_policies({
         "operator": {
             "permitted": False,
             "reason": "Pre-cooling requires optimization expertise"
@@ -250,12 +253,12 @@ pre_cooling_descriptor = ActionDescriptor(
             "permitted": False,
             "reason": "Pre-cooling requires building system knowledge"
         }
-    },
+    }),
 
     # Target & Execution
     target_type="brick:HVAC_System",
-    required_permissions=["zone:write", "hvac:control", "demand:optimize", "pre-cooling:execute"],
-    side_effects=["power:consumption_increase", "peak:demand_reduction", "cost:savings", "comfort:optimization"],
+    required_permissions=("zone:write", "hvac:control", "demand:optimize", "pre-cooling:execute"),
+    side_effects=("power:consumption_increase", "peak:demand_reduction", "cost:savings", "comfort:optimization"),
     handler_function="_handle_pre_cooling",
     validation_class="PreCoolingInput",
     cost_calculator="calculate_pre_cooling_cost"
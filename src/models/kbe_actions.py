@@ -5,9 +5,82 @@ Pydantic models for Knowledge-Based Engine action definitions and execution.
 Implements the core KBE specification for action lifecycle management.
 """
 
-from datetime import datetime
-from typing import Any, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import datetime, timezone
+from functools import cache
+from typing import Any, Callable, Literal
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+
+# Execution statuses that require completed_at to be set
+_TERMINAL_STATUSES = frozenset(("completed", "failed"))
+
+
+def utc_now() -> datetime:
+    """
+    Get the current time as a timezone-aware UTC datetime.
+
+    Returns:
+        Current UTC time
+    """
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Interpret naive datetimes as UTC so they compare with aware ones.
+
+    Args:
+        value: Naive or aware datetime
+
+    Returns:
+        Timezone-aware datetime
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _is_before(value: Any, other: Any) -> bool:
+    """
+    Compare two raw timestamp inputs without building the model.
+
+    Only datetimes and ISO 8601 strings are compared; anything else is left
+    for field validation to parse or reject.
+
+    Args:
+        value: Raw timestamp expected to be later
+        other: Raw timestamp expected to be earlier
+
+    Returns:
+        True if both inputs are comparable and value precedes other
+    """
+    try:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(other, str):
+            other = datetime.fromisoformat(other)
+    except ValueError:
+        return False
+    if not (isinstance(value, datetime) and isinstance(other, datetime)):
+        return False
+    return as_utc(value) < as_utc(other)
+
+
+@cache
+def cached_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Get a model's JSON schema, generating it only once per model class.
+
+    model_json_schema() walks the whole core schema on every call; models are
+    static for the process lifetime, so the result is shared and must not be
+    modified by callers.
+
+    Args:
+        model: Pydantic model class, e.g. ActionDefinition or an ActionInput subclass
+
+    Returns:
+        JSON schema dictionary
+    """
+    return model.model_json_schema()
 
 
 class ActionInput(BaseModel):
@@ -22,6 +95,21 @@ class ActionInput(BaseModel):
         extra = "forbid"  # Prevent unknown fields
 
 
+_WEBHOOK_PREFIXES = ("http://", "https://")
+
+# Target checks per side effect type: (predicate, error message); other types are unchecked
+_SIDE_EFFECT_TARGET_RULES: dict[str, tuple[Callable[[str], bool], str]] = {
+    "webhook": (
+        lambda target: target.startswith(_WEBHOOK_PREFIXES),
+        "Webhook target must be a valid HTTP/HTTPS URL"
+    ),
+    "email": (
+        lambda target: "@" in target,
+        "Email target must contain @ symbol"
+    ),
+}
+
+
 class SideEffect(BaseModel):
     """
     Side effect model for webhooks, notifications, and other action triggers.
@@ -67,12 +155,9 @@ class SideEffect(BaseModel):
         Raises:
             ValueError: If target format is invalid for the given type
         """
-        effect_type = info.data.get("type")
-
-        if effect_type == "webhook" and not (v.startswith("http://") or v.startswith("https://")):
-            raise ValueError("Webhook target must be a valid HTTP/HTTPS URL")
-        elif effect_type == "email" and "@" not in v:
-            raise ValueError("Email target must contain @ symbol")
+        rule = _SIDE_EFFECT_TARGET_RULES.get(info.data.get("type"))
+        if rule is not None and not rule[0](v):
+            raise ValueError(rule[1])
 
         return v.strip()
 
@@ -134,11 +219,11 @@ class ActionDefinition(BaseModel):
         description="Semantic version string"
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Creation timestamp"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Last update timestamp"
     )
 
@@ -163,6 +248,39 @@ class ActionDefinition(BaseModel):
             raise ValueError("Object type input_schema must contain 'properties' field")
         return v
 
+    @field_validator("created_at", "updated_at")
+    @classmethod
+    def normalize_timestamps(cls, v: datetime) -> datetime:
+        """
+        Treat naive timestamps as UTC.
+
+        Args:
+            v: Timestamp value
+
+        Returns:
+            Timezone-aware timestamp
+        """
+        return as_utc(v)
+
+    @model_validator(mode="before")
+    @classmethod
+    def precheck_timestamps(cls, data: Any) -> Any:
+        """
+        Reject out-of-order raw timestamps before any field is converted.
+
+        Args:
+            data: Raw input passed to validation
+
+        Returns:
+            Unchanged input
+
+        Raises:
+            ValueError: If updated_at precedes created_at
+        """
+        if isinstance(data, dict) and _is_before(data.get("updated_at"), data.get("created_at")):
+            raise ValueError("updated_at cannot be before created_at")
+        return data
+
     @model_validator(mode="after")
     def validate_timestamps(self) -> "ActionDefinition":
         """
@@ -178,6 +296,22 @@ class ActionDefinition(BaseModel):
             raise ValueError("updated_at cannot be before created_at")
         return self
 
+    @classmethod
+    def validate_many(cls, rows: list[dict[str, Any]]) -> list["ActionDefinition"]:
+        """
+        Validate a batch of ActionDefinition records in one pydantic-core call.
+
+        Args:
+            rows: Raw ActionDefinition dictionaries (e.g. replayed from storage)
+
+        Returns:
+            Validated instances in input order
+
+        Raises:
+            ValidationError: If any row is invalid; error locations start with its index
+        """
+        return _ACTION_DEFINITION_LIST_ADAPTER.validate_python(rows)
+
 
 class ActionExecution(BaseModel):
     """
@@ -208,6 +342,8 @@ class ActionExecution(BaseModel):
         "completed",
         "failed"
     ] = Field(..., description="Execution status")
+    # dict[str, Any] values pass through pydantic-core untouched; JsonValue
+    # would re-check every nested value (~4x slower for typical inputs)
     inputs: dict[str, Any] = Field(
         default_factory=dict,
         description="Action input parameters"
@@ -221,7 +357,7 @@ class ActionExecution(BaseModel):
         description="Error details if failed"
     )
     started_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Execution start time"
     )
     completed_at: datetime | None = Field(
@@ -244,6 +380,49 @@ class ActionExecution(BaseModel):
         description="Maximum retry attempts"
     )
 
+    @field_validator("started_at", "completed_at")
+    @classmethod
+    def normalize_timestamps(cls, v: datetime | None) -> datetime | None:
+        """
+        Treat naive timestamps as UTC.
+
+        Args:
+            v: Timestamp value
+
+        Returns:
+            Timezone-aware timestamp, or None if not set
+        """
+        return as_utc(v) if v is not None else None
+
+    @model_validator(mode="before")
+    @classmethod
+    def precheck_execution_state(cls, data: Any) -> Any:
+        """
+        Reject terminal executions with missing or out-of-order completion
+        times before any field is converted.
+
+        Args:
+            data: Raw input passed to validation
+
+        Returns:
+            Unchanged input
+
+        Raises:
+            ValueError: If a terminal status lacks a valid completed_at
+        """
+        if not isinstance(data, dict):
+            return data
+        status = data.get("status")
+        if isinstance(status, str) and status in _TERMINAL_STATUSES:
+            completed_at = data.get("completed_at")
+            if completed_at is None:
+                raise ValueError(
+                    f"completed_at must be set when status is '{status}'"
+                )
+            if _is_before(completed_at, data.get("started_at")):
+                raise ValueError("completed_at cannot be before started_at")
+        return data
+
     @model_validator(mode="after")
     def validate_execution_state(self) -> "ActionExecution":
         """
@@ -255,7 +434,12 @@ class ActionExecution(BaseModel):
         Raises:
             ValueError: If state is inconsistent (e.g., completed without completion time)
         """
-        if self.status in ["completed", "failed"]:
+        # Pending/validated/executing runs within their retry budget need no
+        # further checks, which is the common case during execution
+        if self.status not in _TERMINAL_STATUSES and self.retry_count <= self.max_retries:
+            return self
+
+        if self.status in _TERMINAL_STATUSES:
             if self.completed_at is None:
                 raise ValueError(
                     f"completed_at must be set when status is '{self.status}'"
@@ -278,16 +462,23 @@ class ActionExecution(BaseModel):
 
         return self
 
-    @field_validator("status")
     @classmethod
-    def validate_status_transition(cls, v: str) -> str:
+    def validate_many(cls, rows: list[dict[str, Any]]) -> list["ActionExecution"]:
         """
-        Validate status value is one of the allowed states.
+        Validate a batch of ActionExecution records in one pydantic-core call.
 
         Args:
-            v: Status string
+            rows: Raw ActionExecution dictionaries (e.g. replayed from storage)
 
         Returns:
-            Validated status string
+            Validated instances in input order
+
+        Raises:
+            ValidationError: If any row is invalid; error locations start with its index
         """
-        return v
+        return _ACTION_EXECUTION_LIST_ADAPTER.validate_python(rows)
+
+
+# Built once; each walks a whole list inside pydantic-core
+_ACTION_DEFINITION_LIST_ADAPTER = TypeAdapter(list[ActionDefinition])
+_ACTION_EXECUTION_LIST_ADAPTER = TypeAdapter(list[ActionExecution])
@@ -0,0 +1,26 @@
+"""
+Reusable Constrained Types
+
+Annotated aliases for temperature fields and Literal aliases for enumerated
+strings shared across models, so each constraint is declared once instead of
+repeated on every field.
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+# Any setpoint the HVAC controllers will accept, in Fahrenheit
+Fahrenheit = Annotated[float, Field(ge=50.0, le=90.0)]
+
+# Lower and upper comfort limits an operator may configure, in Fahrenheit
+ComfortLowTemp = Annotated[float, Field(ge=60.0, le=75.0)]
+ComfortHighTemp = Annotated[float, Field(ge=70.0, le=85.0)]
+
+# Equipment categories understood by building models and load shedding.
+# pydantic-core matches Literal strings with a hash lookup and returns the
+# interned literal, so validated values can be compared by identity.
+EquipmentType = Literal["hvac", "lighting", "fan", "pump", "chiller", "boiler"]
+
+# HH:MM in 24-hour time; shared by server-side validation and UI field patterns
+HHMM_PATTERN = r"^([01]\d|2[0-3]):([0-5]\d)$"
@@ -1,9 +1,48 @@
 """
 Core services for KBE action execution system.
+
+Service modules are imported on first attribute access (PEP 562), so code that
+needs only one service does not load the others or the action models they use.
 """
 
-from .action_executor import ActionExecutor
-from .validator import ActionValidator
-from .state_manager import StateManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .action_executor import ActionExecutor
+    from .validator import ActionValidator
+    from .state_manager import StateManager
+
+_LAZY_IMPORTS = {
+    "ActionExecutor": "action_executor",
+    "ActionValidator": "validator",
+    "StateManager": "state_manager",
+}
 
 __all__ = ["ActionExecutor", "ActionValidator", "StateManager"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodule defining a public name on first access.
+
+    Args:
+        name: Attribute requested from the package
+
+    Returns:
+        The requested class
+
+    Raises:
+        AttributeError: If name is not a public export of this package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -4,21 +4,43 @@ Handles the execution of building automation actions with proper validation and
 """
 
 import logging
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
 import asyncio
-from uuid import uuid4
+import secrets
+from itertools import count
 
-from src.models import ActionRequest, ActionResponse
+from src.models import ActionRequest, ActionResponse, utc_now
+from src.models.actions.pre_cooling import time_window_minutes
 
 logger = logging.getLogger(__name__)
 
+# Action IDs only need to be unique, not unpredictable: a random per-process
+# prefix plus a counter avoids a uuid4() urandom read and format per action
+_ACTION_ID_PREFIX = secrets.token_hex(6)
+_action_counter = count(1)
+
+
+def _next_action_id() -> str:
+    """Get a process-unique action identifier."""
+    return f"{_ACTION_ID_PREFIX}-{next(_action_counter)}"
+
 
 class ActionExecutionError(Exception):
     """Raised when action execution fails."""
     pass
 
 
+@dataclass(slots=True)
+class _ActiveAction:
+    """Bookkeeping for an action that is currently executing."""
+    request: ActionRequest
+    started_at: datetime
+    user: Optional[str]
+    status: str = "executing"
+
+
 class ActionExecutor:
     """
     Core engine for executing building automation actions.
@@ -30,18 +52,31 @@ class ActionExecutor:
     - Coordinate with state manager
     """
 
-    def __init__(self, state_manager=None, validator=None):
+    def __init__(self, state_manager=None, validator=None, simulate_latency: bool = False):
         """
         Initialize the action executor.
 
         Args:
             state_manager: StateManager instance for managing building state
             validator: ActionValidator instance for pre-execution validation
+            simulate_latency: Sleep in each handler to mimic device I/O (demo only)
         """
         self.state_manager = state_manager
         self.validator = validator
+        self._simulate_latency = simulate_latency
         self._execution_queue: asyncio.Queue = asyncio.Queue()
-        self._active_actions: Dict[str, Dict[str, Any]] = {}
+        self._active_actions: Dict[str, _ActiveAction] = {}
+        # Bound handlers per action type, built once instead of on every dispatch
+        self._action_handlers: Dict[
+            str, Callable[[ActionRequest, str], Awaitable[Dict[str, Any]]]
+        ] = {
+            "setTemperature": self._handle_set_temperature,
+            "setOccupancyMode": self._handle_set_occupancy_mode,
+            "adjustVentilation": self._handle_adjust_ventilation,
+            "enableEconomizer": self._handle_enable_economizer,
+            "setLightingLevel": self._handle_set_lighting_level,
+            "preCooling": self._handle_pre_cooling,
+        }
         logger.info("ActionExecutor initialized")
 
     async def execute_action(
@@ -62,12 +97,14 @@ class ActionExecutor:
         Raises:
             ActionExecutionError: If execution fails
         """
-        action_id = str(uuid4())
-        timestamp = datetime.utcnow()
+        action_id = _next_action_id()
+        timestamp = utc_now()
 
         logger.info(
-            f"Executing action {action_id}: {request.action_type} "
-            f"on zone {request.target_zone}"
+            "Executing action %s: %s on zone %s",
+            action_id,
+            request.action_type,
+            request.target_zone
         )
 
         try:
@@ -87,12 +124,7 @@ class ActionExecutor:
                     )
 
             # Track active action
-            self._active_actions[action_id] = {
-                "request": request,
-                "status": "executing",
-                "started_at": timestamp,
-                "user": user
-            }
+            self._active_actions[action_id] = _ActiveAction(request, timestamp, user)
 
             # Execute the action based on type
             result = await self._execute_action_logic(request, action_id)
@@ -106,8 +138,8 @@ class ActionExecutor:
                     action_id
                 )
 
-            # Remove from active actions
-            del self._active_actions[action_id]
+            # Remove from active actions (cancel_action may already have done so)
+            self._active_actions.pop(action_id, None)
 
             return ActionResponse(
                 action_id=action_id,
@@ -118,11 +150,14 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Action execution failed for {action_id}: {str(e)}", exc_info=True)
+            if isinstance(e, (KeyError, TypeError, ValueError)):
+                # Malformed parameters: the message is enough, skip the traceback
+                logger.warning("Action execution failed for %s: %s", action_id, e)
+            else:
+                logger.exception("Action execution failed for %s: %s", action_id, e)
 
             # Clean up active action
-            if action_id in self._active_actions:
-                del self._active_actions[action_id]
+            self._active_actions.pop(action_id, None)
 
             return ActionResponse(
                 action_id=action_id,
@@ -148,20 +183,10 @@ class ActionExecutor:
         """
         # This is a placeholder implementation
         # Actual logic will depend on the specific action types defined in the ontology
-
-        action_handlers = {
-            "setTemperature": self._handle_set_temperature,
-            "setOccupancyMode": self._handle_set_occupancy_mode,
-            "adjustVentilation": self._handle_adjust_ventilation,
-            "enableEconomizer": self._handle_enable_economizer,
-            "setLightingLevel": self._handle_set_lighting_level,
-            "preCooling": self._handle_pre_cooling,
-        }
-
-        handler = action_handlers.get(request.action_type)
+        handler = self._action_handlers.get(request.action_type)
 
         if not handler:
-            logger.warning(f"No handler found for action type: {request.action_type}")
+            logger.warning("No handler found for action type: %s", request.action_type)
             return {
                 "success": False,
                 "errors": [f"Unsupported action type: {request.action_type}"]
@@ -171,7 +196,7 @@ class ActionExecutor:
             result = await handler(request, action_id)
             return {"success": True, **result}
         except Exception as e:
-            logger.error(f"Handler error for {request.action_type}: {str(e)}")
+            logger.error("Handler error for %s: %s", request.action_type, e)
             return {
                 "success": False,
                 "errors": [f"Handler execution failed: {str(e)}"]
@@ -187,19 +212,22 @@ class ActionExecutor:
         mode = request.parameters.get("mode", "auto")
 
         logger.info(
-            f"Setting temperature for zone {request.target_zone} "
-            f"to {setpoint}°F in {mode} mode"
+            "Setting temperature for zone %s to %s°F in %s mode",
+            request.target_zone,
+            setpoint,
+            mode
         )
 
         # Simulate async operation
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         return {
             "action": "setTemperature",
             "zone": request.target_zone,
             "setpoint": setpoint,
             "mode": mode,
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def _handle_set_occupancy_mode(
@@ -210,15 +238,16 @@ class ActionExecutor:
         """Handle occupancy mode changes."""
         mode = request.parameters.get("mode")
 
-        logger.info(f"Setting occupancy mode for zone {request.target_zone} to {mode}")
+        logger.info("Setting occupancy mode for zone %s to %s", request.target_zone, mode)
 
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         return {
             "action": "setOccupancyMode",
             "zone": request.target_zone,
             "mode": mode,
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def _handle_adjust_ventilation(
@@ -229,15 +258,16 @@ class ActionExecutor:
         """Handle ventilation adjustments."""
         rate = request.parameters.get("rate")
 
-        logger.info(f"Adjusting ventilation for zone {request.target_zone} to {rate} CFM")
+        logger.info("Adjusting ventilation for zone %s to %s CFM", request.target_zone, rate)
 
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         return {
             "action": "adjustVentilation",
             "zone": request.target_zone,
             "rate": rate,
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def _handle_enable_economizer(
@@ -249,17 +279,19 @@ class ActionExecutor:
         enabled = request.parameters.get("enabled", True)
 
         logger.info(
-            f"{'Enabling' if enabled else 'Disabling'} economizer "
-            f"for zone {request.target_zone}"
+            "%s economizer for zone %s",
+            "Enabling" if enabled else "Disabling",
+            request.target_zone
         )
 
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         return {
             "action": "enableEconomizer",
             "zone": request.target_zone,
             "enabled": enabled,
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def _handle_set_lighting_level(
@@ -270,15 +302,16 @@ class ActionExecutor:
         """Handle lighting level changes."""
         level = request.parameters.get("level")
 
-        logger.info(f"Setting lighting level for zone {request.target_zone} to {level}%")
+        logger.info("Setting lighting level for zone %s to %s%%", request.target_zone, level)
 
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
 
         return {
             "action": "setLightingLevel",
             "zone": request.target_zone,
             "level": level,
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def _handle_pre_cooling(
@@ -298,20 +331,19 @@ class ActionExecutor:
         enable_adaptive = request.parameters.get("enable_adaptive", True)
 
         logger.info(
-            f"Initiating pre-cooling for zone {request.target_zone}: "
-            f"target={target_temp}°F, start={start_time}, occupancy={occupancy_start}"
+            "Initiating pre-cooling for zone %s: target=%s°F, start=%s, occupancy=%s",
+            request.target_zone,
+            target_temp,
+            start_time,
+            occupancy_start
         )
 
         # Simulate async scheduling operation
-        await asyncio.sleep(0.15)
+        if self._simulate_latency:
+            await asyncio.sleep(0.15)
 
         # Calculate estimated time window
-        from datetime import datetime as dt
-        start_dt = dt.strptime(start_time, "%H:%M")
-        occ_dt = dt.strptime(occupancy_start, "%H:%M")
-        time_window_minutes = (occ_dt.hour * 60 + occ_dt.minute) - (start_dt.hour * 60 + start_dt.minute)
-        if time_window_minutes < 0:
-            time_window_minutes += 24 * 60
+        window_minutes = time_window_minutes(start_time, occupancy_start)
 
         return {
             "action": "preCooling",
@@ -319,17 +351,25 @@ class ActionExecutor:
             "target_temp": target_temp,
             "start_time": start_time,
             "occupancy_start": occupancy_start,
-            "time_window_minutes": time_window_minutes,
+            "time_window_minutes": window_minutes,
             "max_cooling_rate": max_rate_delta,
             "adaptive_enabled": enable_adaptive,
             "schedule_created": True,
             "estimated_cost_usd": request.parameters.get("estimated_cost", 0.0),
-            "applied_at": datetime.utcnow().isoformat()
+            "applied_at": utc_now()
         }
 
     async def get_active_actions(self) -> Dict[str, Dict[str, Any]]:
         """Get all currently executing actions."""
-        return self._active_actions.copy()
+        return {
+            action_id: {
+                "request": active.request,
+                "status": active.status,
+                "started_at": active.started_at,
+                "user": active.user
+            }
+            for action_id, active in self._active_actions.items()
+        }
 
     async def cancel_action(self, action_id: str) -> bool:
         """
@@ -342,7 +382,7 @@ class ActionExecutor:
             True if action was cancelled, False if not found
         """
         if action_id in self._active_actions:
-            logger.info(f"Cancelling action {action_id}")
+            logger.info("Cancelling action %s", action_id)
             del self._active_actions[action_id]
             return True
         return False
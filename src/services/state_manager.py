@@ -4,16 +4,67 @@ Maintains current state and tracks state transitions.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import compress
 import asyncio
 
-from src.models import BuildingState, AuditEntry
+from src.models import BuildingState, AuditEntry, as_utc, utc_now
 
 logger = logging.getLogger(__name__)
 
 
+def _set_temperature_updates(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """State updates for setTemperature actions."""
+    return {
+        "temperature_setpoint": parameters.get("setpoint"),
+        "hvac_mode": parameters.get("mode", "auto")
+    }
+
+
+def _set_occupancy_mode_updates(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """State updates for setOccupancyMode actions."""
+    return {"occupancy_mode": parameters.get("mode")}
+
+
+def _adjust_ventilation_updates(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """State updates for adjustVentilation actions."""
+    updates = {"ventilation_rate": parameters.get("rate")}
+    if "mode" in parameters:
+        updates["ventilation_mode"] = parameters["mode"]
+    return updates
+
+
+def _enable_economizer_updates(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """State updates for enableEconomizer actions."""
+    updates = {"economizer_enabled": parameters.get("enabled", True)}
+    if "min_outdoor_temp" in parameters:
+        updates["economizer_min_temp"] = parameters["min_outdoor_temp"]
+    if "max_outdoor_temp" in parameters:
+        updates["economizer_max_temp"] = parameters["max_outdoor_temp"]
+    return updates
+
+
+def _set_lighting_level_updates(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """State updates for setLightingLevel actions."""
+    updates = {"lighting_level": parameters.get("level")}
+    if "duration" in parameters:
+        updates["lighting_duration"] = parameters["duration"]
+    return updates
+
+
+# Zone state updates per action type, dispatched with one dict lookup
+_STATE_UPDATERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "setTemperature": _set_temperature_updates,
+    "setOccupancyMode": _set_occupancy_mode_updates,
+    "adjustVentilation": _adjust_ventilation_updates,
+    "enableEconomizer": _enable_economizer_updates,
+    "setLightingLevel": _set_lighting_level_updates,
+}
+
+
 class StateManager:
     """
     Manages building and zone state.
@@ -25,11 +76,36 @@ class StateManager:
     - Support audit trail
     """
 
-    def __init__(self):
-        """Initialize the state manager."""
+    def __init__(self, history_limit: int = 100_000, audit_limit: int = 100_000):
+        """
+        Initialize the state manager.
+
+        Args:
+            history_limit: Maximum state history records kept in memory
+            audit_limit: Maximum audit entries kept in memory
+        """
+        if history_limit < 1 or audit_limit < 1:
+            raise ValueError("history_limit and audit_limit must be at least 1")
+        self._history_limit = history_limit
+        self._audit_limit = audit_limit
         self._zone_states: Dict[str, Dict[str, Any]] = defaultdict(dict)
         self._state_history: List[Dict[str, Any]] = []
+        # Positions in _state_history per zone, in append (timestamp) order
+        self._history_index_by_zone: Dict[str, List[int]] = defaultdict(list)
         self._audit_trail: List[AuditEntry] = []
+        self._audit_by_id: Dict[str, AuditEntry] = {}
+        # Column-oriented copies of audit fields, kept parallel to _audit_trail
+        self._audit_timestamps: List[datetime] = []
+        self._audit_action_types: List[str] = []
+        self._audit_zones: List[str] = []
+        self._audit_users: List[Optional[str]] = []
+        self._audit_statuses: List[str] = []
+        # Positions in _audit_trail per zone and per action type, in append order
+        self._audit_index_by_zone: Dict[str, List[int]] = defaultdict(list)
+        self._audit_index_by_action: Dict[str, List[int]] = defaultdict(list)
+        self._zone_ids: Optional[Tuple[str, ...]] = None
+        # Serializes writers only; reads never await, so on the event loop they
+        # cannot interleave with a write and run without the lock
         self._lock = asyncio.Lock()
         logger.info("StateManager initialized")
 
@@ -43,16 +119,18 @@ class StateManager:
         Returns:
             BuildingState if zone exists, None otherwise
         """
-        async with self._lock:
-            if zone_id not in self._zone_states:
-                logger.warning(f"Zone {zone_id} not found in state manager")
-                return None
-
-            return BuildingState(
-                zone_id=zone_id,
-                state=self._zone_states[zone_id].copy(),
-                timestamp=datetime.utcnow()
-            )
+        snapshot = self._zone_states.get(zone_id)
+        if snapshot is None:
+            logger.warning("Zone %s not found in state manager", zone_id)
+            return None
+
+        # BuildingState validation copies the dict, so callers never share
+        # the published snapshot
+        return BuildingState(
+            zone_id=zone_id,
+            state=snapshot,
+            timestamp=utc_now()
+        )
 
     async def get_all_zones_state(self) -> List[BuildingState]:
         """
@@ -61,15 +139,16 @@ class StateManager:
         Returns:
             List of BuildingState objects
         """
-        async with self._lock:
-            return [
-                BuildingState(
-                    zone_id=zone_id,
-                    state=state.copy(),
-                    timestamp=datetime.utcnow()
-                )
-                for zone_id, state in self._zone_states.items()
-            ]
+        # One clock read for the whole snapshot
+        now = utc_now()
+        return [
+            BuildingState(
+                zone_id=zone_id,
+                state=state,
+                timestamp=now
+            )
+            for zone_id, state in list(self._zone_states.items())
+        ]
 
     async def update_state(
         self,
@@ -90,37 +169,49 @@ class StateManager:
             user: Optional user who executed the action
         """
         async with self._lock:
-            timestamp = datetime.utcnow()
+            timestamp = utc_now()
 
-            # Get current state or initialize
-            current_state = self._zone_states[zone_id]
-            previous_state = current_state.copy()
+            # Published states are never mutated, so the current one can be
+            # kept as-is for history
+            previous_state = self._zone_states.get(zone_id)
+            if previous_state is None:
+                previous_state = {}
+                self._zone_ids = None
 
             # Update state based on action type
             state_updates = self._compute_state_updates(
                 action_type,
                 parameters,
-                current_state
+                previous_state
             )
 
-            # Apply updates
-            current_state.update(state_updates)
-            current_state["last_updated"] = timestamp.isoformat()
-            current_state["last_action_id"] = action_id
+            # Publish a new dict so lock-free readers always see a whole state
+            new_state = {
+                **previous_state,
+                **state_updates,
+                "last_updated": timestamp.isoformat(),
+                "last_action_id": action_id
+            }
+            self._zone_states[zone_id] = new_state
 
             # Record state transition
+            self._history_index_by_zone[zone_id].append(len(self._state_history))
             self._state_history.append({
                 "zone_id": zone_id,
                 "timestamp": timestamp,
                 "action_id": action_id,
                 "action_type": action_type,
                 "previous_state": previous_state,
-                "new_state": current_state.copy(),
+                "new_state": new_state,
                 "parameters": parameters
             })
+            if len(self._state_history) > self._history_limit:
+                self._trim_history()
 
-            # Add to audit trail
-            self._audit_trail.append(AuditEntry(
+            # Add to audit trail. Recorded inline, not via a background flusher:
+            # the section never awaits, so it blocks no other coroutine, and callers
+            # read their action's audit entry straight after execute returns
+            audit_entry = AuditEntry(
                 action_id=action_id,
                 timestamp=timestamp,
                 action_type=action_type,
@@ -131,13 +222,110 @@ class StateManager:
                     "parameters": parameters,
                     "state_changes": state_updates
                 }
-            ))
+            )
+            self._append_audit_entry(audit_entry)
 
             logger.info(
-                f"Updated state for zone {zone_id} from action {action_id} "
-                f"({action_type})"
+                "Updated state for zone %s from action %s (%s)",
+                zone_id,
+                action_id,
+                action_type
             )
 
+    def _append_audit_entry(self, entry: AuditEntry) -> None:
+        """
+        Append an audit entry and keep the lookup index and columns in sync.
+        Must be called with the lock held.
+
+        Args:
+            entry: Audit entry to record
+        """
+        position = len(self._audit_trail)
+        self._audit_trail.append(entry)
+        self._audit_by_id[entry.action_id] = entry
+        self._audit_index_by_zone[entry.target_zone].append(position)
+        self._audit_index_by_action[entry.action_type].append(position)
+        self._audit_timestamps.append(entry.timestamp)
+        self._audit_action_types.append(entry.action_type)
+        self._audit_zones.append(entry.target_zone)
+        self._audit_users.append(entry.user)
+        self._audit_statuses.append(entry.status)
+        if len(self._audit_trail) > self._audit_limit:
+            self._trim_audit()
+
+    @staticmethod
+    def _evict_count(length: int, limit: int) -> int:
+        """
+        Number of oldest records to drop once a log exceeds its limit.
+
+        An extra tenth of the limit is dropped so index rebuilds happen once per
+        limit // 10 appends rather than on every append.
+        """
+        return length - limit + limit // 10
+
+    @staticmethod
+    def _shift_index(index: Dict[str, List[int]], evicted: int) -> None:
+        """
+        Drop evicted positions from a position index and renumber the rest.
+
+        Args:
+            index: Positions per key, ascending
+            evicted: Number of records removed from the front of the log
+        """
+        for key in list(index):
+            positions = index[key]
+            kept = positions[bisect_left(positions, evicted):]
+            if kept:
+                index[key] = [position - evicted for position in kept]
+            else:
+                del index[key]
+
+    def _trim_history(self) -> None:
+        """Drop the oldest state history records. Must be called with the lock held."""
+        evicted = self._evict_count(len(self._state_history), self._history_limit)
+        del self._state_history[:evicted]
+        self._shift_index(self._history_index_by_zone, evicted)
+
+    def _trim_audit(self) -> None:
+        """Drop the oldest audit entries and their columns. Must be called with the lock held."""
+        evicted = self._evict_count(len(self._audit_trail), self._audit_limit)
+        by_id = self._audit_by_id
+        for entry in self._audit_trail[:evicted]:
+            if by_id.get(entry.action_id) is entry:
+                del by_id[entry.action_id]
+        for column in (
+            self._audit_trail,
+            self._audit_timestamps,
+            self._audit_action_types,
+            self._audit_zones,
+            self._audit_users,
+            self._audit_statuses,
+        ):
+            del column[:evicted]
+        self._shift_index(self._audit_index_by_zone, evicted)
+        self._shift_index(self._audit_index_by_action, evicted)
+
+    def _audit_time_range(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Tuple[int, int]:
+        """
+        Get the [lo, hi) index range of audit entries within a time window.
+        Entries are appended in timestamp order, so the range is found by bisection.
+
+        Args:
+            start_time: Optional inclusive lower bound (naive values are UTC)
+            end_time: Optional inclusive upper bound (naive values are UTC)
+
+        Returns:
+            Tuple of (lo, hi) indices into the audit columns
+        """
+        timestamps = self._audit_timestamps
+        lo = bisect_left(timestamps, as_utc(start_time)) if start_time else 0
+        hi = bisect_right(timestamps, as_utc(end_time)) if end_time else len(timestamps)
+        return lo, max(lo, hi)
+
     def _compute_state_updates(
         self,
         action_type: str,
@@ -153,35 +341,10 @@ class StateManager:
             current_state: Current zone state
 
         Returns:
-            Dictionary of state updates
+            Dictionary of state updates (empty for unknown action types)
         """
-        updates = {}
-
-        if action_type == "setTemperature":
-            updates["temperature_setpoint"] = parameters.get("setpoint")
-            updates["hvac_mode"] = parameters.get("mode", "auto")
-
-        elif action_type == "setOccupancyMode":
-            updates["occupancy_mode"] = parameters.get("mode")
-
-        elif action_type == "adjustVentilation":
-            updates["ventilation_rate"] = parameters.get("rate")
-            if "mode" in parameters:
-                updates["ventilation_mode"] = parameters["mode"]
-
-        elif action_type == "enableEconomizer":
-            updates["economizer_enabled"] = parameters.get("enabled", True)
-            if "min_outdoor_temp" in parameters:
-                updates["economizer_min_temp"] = parameters["min_outdoor_temp"]
-            if "max_outdoor_temp" in parameters:
-                updates["economizer_max_temp"] = parameters["max_outdoor_temp"]
-
-        elif action_type == "setLightingLevel":
-            updates["lighting_level"] = parameters.get("level")
-            if "duration" in parameters:
-                updates["lighting_duration"] = parameters["duration"]
-
-        return updates
+        updater = _STATE_UPDATERS.get(action_type)
+        return updater(parameters) if updater else {}
 
     async def get_state_history(
         self,
@@ -198,22 +361,32 @@ class StateManager:
             offset: Number of records to skip
 
         Returns:
-            List of state change records
+            List of state change records, copied so callers cannot reach the
+            shared snapshots behind the published zone states
         """
-        async with self._lock:
-            history = self._state_history
-
-            if zone_id:
-                history = [h for h in history if h["zone_id"] == zone_id]
-
-            # Sort by timestamp descending
-            history = sorted(
-                history,
-                key=lambda x: x["timestamp"],
-                reverse=True
-            )
-
-            return history[offset:offset + limit]
+        history = self._state_history
+        positions = (
+            self._history_index_by_zone.get(zone_id, []) if zone_id
+            else range(len(history))
+        )
+
+        # Appended in timestamp order, so newest first is a reverse walk
+        count = len(positions)
+        stop = max(count - offset, 0)
+        start = max(stop - limit, 0)
+        return [
+            self._copy_history_record(history[positions[i]])
+            for i in range(stop - 1, start - 1, -1)
+        ]
+
+    @staticmethod
+    def _copy_history_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a history record and the state snapshots it shares with _zone_states."""
+        return {
+            **record,
+            "previous_state": dict(record["previous_state"]),
+            "new_state": dict(record["new_state"])
+        }
 
     async def get_audit_trail(
         self,
@@ -238,30 +411,85 @@ class StateManager:
         Returns:
             List of audit entries
         """
-        async with self._lock:
-            entries = self._audit_trail
-
-            # Apply filters
-            if zone_id:
-                entries = [e for e in entries if e.target_zone == zone_id]
-
-            if action_type:
-                entries = [e for e in entries if e.action_type == action_type]
+        lo, hi = self._audit_time_range(start_time, end_time)
+
+        # Start from the smallest applicable index, then check the other filter
+        candidates: Optional[List[int]] = None
+        if zone_id:
+            candidates = self._audit_index_by_zone.get(zone_id, [])
+        if action_type:
+            by_action = self._audit_index_by_action.get(action_type, [])
+            if candidates is None:
+                candidates = by_action
+            elif len(by_action) < len(candidates):
+                zones = self._audit_zones
+                candidates = [i for i in by_action if zones[i] == zone_id]
+            else:
+                action_types = self._audit_action_types
+                candidates = [i for i in candidates if action_types[i] == action_type]
+
+        # Positions are ascending, so the time window narrows them by bisection
+        if candidates is None:
+            positions = range(lo, hi)
+        else:
+            positions = candidates[bisect_left(candidates, lo):bisect_left(candidates, hi)]
+
+        # Newest first
+        count = len(positions)
+        stop = max(count - offset, 0)
+        start = max(stop - limit, 0)
+        trail = self._audit_trail
+        return [trail[positions[i]] for i in range(stop - 1, start - 1, -1)]
+
+    async def get_audit_summary(
+        self,
+        zone_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get audit trail counts grouped by action type, zone, user, and status.
 
-            if start_time:
-                entries = [e for e in entries if e.timestamp >= start_time]
+        Args:
+            zone_id: Filter by zone
+            start_time: Filter by start time
+            end_time: Filter by end time
 
-            if end_time:
-                entries = [e for e in entries if e.timestamp <= end_time]
+        Returns:
+            Dictionary with total and per-field counts
+        """
+        lo, hi = self._audit_time_range(start_time, end_time)
+        action_types = self._audit_action_types[lo:hi]
+        zones = self._audit_zones[lo:hi]
+        users = self._audit_users[lo:hi]
+        statuses = self._audit_statuses[lo:hi]
+
+        if zone_id:
+            mask = [zone == zone_id for zone in zones]
+            action_types = list(compress(action_types, mask))
+            zones = list(compress(zones, mask))
+            users = list(compress(users, mask))
+            statuses = list(compress(statuses, mask))
+
+        return {
+            "total_actions": len(statuses),
+            "action_type_counts": dict(Counter(action_types)),
+            "zone_counts": dict(Counter(zones)),
+            "user_counts": dict(Counter(filter(None, users))),
+            "status_counts": dict(Counter(statuses))
+        }
+
+    async def get_audit_entry(self, action_id: str) -> Optional[AuditEntry]:
+        """
+        Get a single audit entry by action ID.
 
-            # Sort by timestamp descending
-            entries = sorted(
-                entries,
-                key=lambda x: x.timestamp,
-                reverse=True
-            )
+        Args:
+            action_id: Action identifier
 
-            return entries[offset:offset + limit]
+        Returns:
+            AuditEntry if found, None otherwise
+        """
+        return self._audit_by_id.get(action_id)
 
     async def initialize_zone(
         self,
@@ -277,7 +505,7 @@ class StateManager:
         """
         async with self._lock:
             if zone_id in self._zone_states:
-                logger.warning(f"Zone {zone_id} already initialized, skipping")
+                logger.warning("Zone %s already initialized, skipping", zone_id)
                 return
 
             default_state = {
@@ -287,14 +515,15 @@ class StateManager:
                 "ventilation_rate": 0,
                 "lighting_level": 0,
                 "economizer_enabled": False,
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": utc_now().isoformat()
             }
 
             if initial_state:
                 default_state.update(initial_state)
 
             self._zone_states[zone_id] = default_state
-            logger.info(f"Initialized zone {zone_id} with state: {default_state}")
+            self._zone_ids = None
+            logger.info("Initialized zone %s with state: %s", zone_id, default_state)
 
     async def clear_state(self, zone_id: Optional[str] = None) -> None:
         """
@@ -304,16 +533,41 @@ class StateManager:
             zone_id: Optional zone to clear, or all if None
         """
         async with self._lock:
+            self._zone_ids = None
             if zone_id:
                 if zone_id in self._zone_states:
                     del self._zone_states[zone_id]
-                    logger.info(f"Cleared state for zone {zone_id}")
+                    logger.info("Cleared state for zone %s", zone_id)
             else:
                 self._zone_states.clear()
                 self._state_history.clear()
+                self._history_index_by_zone.clear()
                 self._audit_trail.clear()
+                self._audit_by_id.clear()
+                self._audit_timestamps.clear()
+                self._audit_action_types.clear()
+                self._audit_zones.clear()
+                self._audit_users.clear()
+                self._audit_statuses.clear()
+                self._audit_index_by_zone.clear()
+                self._audit_index_by_action.clear()
                 logger.info("Cleared all state data")
 
+    async def get_zone_ids(self) -> List[str]:
+        """
+        Get identifiers of all known zones.
+
+        The IDs are cached and only rebuilt after zones are added or cleared;
+        each call returns a fresh list so callers cannot alter the cache.
+
+        Returns:
+            List of zone identifiers
+        """
+        zone_ids = self._zone_ids
+        if zone_ids is None:
+            zone_ids = self._zone_ids = tuple(self._zone_states)
+        return list(zone_ids)
+
     async def get_statistics(self) -> Dict[str, Any]:
         """
         Get state manager statistics.
@@ -321,10 +575,9 @@ class StateManager:
         Returns:
             Dictionary with statistics
         """
-        async with self._lock:
-            return {
-                "total_zones": len(self._zone_states),
-                "total_state_changes": len(self._state_history),
-                "total_audit_entries": len(self._audit_trail),
-                "zones": list(self._zone_states.keys())
-            }
+        return {
+            "total_zones": len(self._zone_states),
+            "total_state_changes": len(self._state_history),
+            "total_audit_entries": len(self._audit_trail),
+            "zones": list(self._zone_states.keys())
+        }
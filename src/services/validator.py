@@ -3,11 +3,14 @@ SHACL-style validation logic for KBE action execution.
 Validates action parameters against ontology constraints.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 
 from src.models import ValidationRequest, ValidationResponse
+from src.models.actions._frozen import freeze
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +34,57 @@ class ActionValidator:
     def __init__(self):
         """Initialize the validator with ontology-based rules."""
         self._validation_rules = self._load_validation_rules()
+        self._build_action_types_payload()
         logger.info("ActionValidator initialized with validation rules")
 
+    @property
+    def action_types_payload(self) -> Mapping[str, Any]:
+        """Read-only /actions/types payload of supported action types."""
+        return self._action_types_payload
+
+    @property
+    def supported_actions(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only parameter specs keyed by supported action type."""
+        return self._action_types_payload["supported_actions"]
+
+    @property
+    def action_types_json(self) -> bytes:
+        """Pre-serialized JSON body of the action types payload."""
+        return self._action_types_json
+
+    @property
+    def action_types_etag(self) -> str:
+        """Quoted SHA-256 entity tag for the action types payload."""
+        return self._action_types_etag
+
+    def reload_validation_rules(self) -> None:
+        """Reload validation rules and rebuild derived payloads."""
+        self._validation_rules = self._load_validation_rules()
+        self._build_action_types_payload()
+        logger.info("ActionValidator reloaded validation rules")
+
+    def _build_action_types_payload(self) -> None:
+        """
+        Build the supported action types payload, its JSON body, and its ETag.
+        The rules are static between reloads, so this runs once per rule set.
+        """
+        self._action_types_payload = MappingProxyType({
+            "supported_actions": MappingProxyType({
+                action_type: MappingProxyType({
+                    "required_parameters": tuple(rules["required_params"]),
+                    "optional_parameters": tuple(rules.get("optional_params", ())),
+                    "parameter_specs": freeze(rules["validations"])
+                })
+                for action_type, rules in self._validation_rules.items()
+            })
+        })
+        self._action_types_json = json.dumps(
+            self._action_types_payload,
+            sort_keys=True,
+            default=dict
+        ).encode("utf-8")
+        self._action_types_etag = f'"{hashlib.sha256(self._action_types_json).hexdigest()}"'
+
     def _load_validation_rules(self) -> Dict[str, Dict[str, Any]]:
         """
         Load validation rules from ontology.
@@ -195,9 +247,9 @@ class ActionValidator:
         is_valid = len(errors) == 0
 
         if is_valid:
-            logger.info(f"Validation passed for action {action_type}")
+            logger.info("Validation passed for action %s", action_type)
         else:
-            logger.warning(f"Validation failed for action {action_type}: {errors}")
+            logger.warning("Validation failed for action %s: %s", action_type, errors)
 
         return ValidationResponse(
             is_valid=is_valid,
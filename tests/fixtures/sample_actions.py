@@ -4,7 +4,7 @@ Sample action fixtures for testing.
 Provides action definitions, requests, and expected results.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
@@ -84,7 +84,7 @@ class ActionResult:
     result: Optional[Dict[str, Any]] = None
     error: Optional[Dict[str, Any]] = None
     execution_time_ms: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def __post_init__(self):
         """Validate action result."""
@@ -340,7 +340,7 @@ def create_sample_validation_result(valid: bool = True) -> ValidationResult:
                     "efficiency": 75,
                 }
             ],
-            details={"validation_level": "strict", "timestamp": datetime.utcnow().isoformat()},
+            details={"validation_level": "strict", "timestamp": datetime.now(timezone.utc).isoformat()},
         )
 
 
@@ -415,7 +415,7 @@ def create_sample_successful_action_result() -> ActionResult:
         },
         error=None,
         execution_time_ms=245.5,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
 
 
@@ -435,7 +435,7 @@ def create_sample_failed_action_result() -> ActionResult:
             "details": {"building_id": "BLDG-999"},
         },
         execution_time_ms=123.0,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
 
 
@@ -451,5 +451,5 @@ def create_sample_pending_action_result() -> ActionResult:
         result=None,
         error=None,
         execution_time_ms=0.0,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
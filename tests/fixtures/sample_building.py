@@ -4,7 +4,7 @@ Sample building model fixtures for testing.
 Provides realistic building, zone, and equipment configurations.
 """
 
-from datetime import time, datetime
+from datetime import time, datetime, timezone
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
@@ -108,7 +108,7 @@ class BuildingConfiguration:
     equipment: List[EquipmentConfiguration] = field(default_factory=list)
     demand_limit_kw: float = 500.0
     demand_warning_threshold_kw: float = 400.0
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def __post_init__(self):
         """Validate building configuration."""
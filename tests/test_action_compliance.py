@@ -10,8 +10,12 @@ Validates that all actions meet modularity requirements:
 - Handler and validation class references
 """
 
+from dataclasses import FrozenInstanceError
+
+import orjson
 import pytest
-from src.models.action_descriptor import action_registry
+from pydantic import ValidationError
+from src.models.action_descriptor import ActionDescriptor, action_registry
 
 
 # Import all descriptors to register them
@@ -162,6 +166,96 @@ class TestActionCompliance:
             assert is_valid, \
                 f"{action.action_id}: Completeness validation failed:\n" + "\n".join(errors)
 
+    def test_descriptors_pass_full_validation(self, all_actions):
+        """Test descriptors built without validation would also pass it."""
+        for action in all_actions:
+            validated = ActionDescriptor.model_validate(action.model_dump())
+            assert validated.model_dump() == action.model_dump(), action.action_id
+
+    def test_registry_completeness_is_cached(self, all_actions):
+        """Test completeness results are reused and reset on re-registration."""
+        action = all_actions[0]
+        result = action_registry.validate_completeness(action.action_id)
+        assert result is action_registry.validate_completeness(action.action_id)
+
+        # Identical re-registration keeps the cache; a changed descriptor resets it
+        action_registry.register(action)
+        assert action_registry.validate_completeness(action.action_id) is result
+
+        try:
+            action_registry.register(action.model_copy(update={"description": "Changed"}))
+            assert action_registry.validate_completeness(action.action_id) is not result
+            assert action_registry.validate_completeness(action.action_id) == result
+        finally:
+            action_registry.register(action)
+
+        is_valid, errors = action_registry.validate_completeness("missing-action")
+        assert not is_valid and "not found" in errors[0]
+
+    def test_registry_json_export_is_cached(self, all_actions):
+        """Test registry exports are reused until a new action is registered."""
+        schema = action_registry.to_json_schema()
+        assert schema is action_registry.to_json_schema()
+        assert set(schema) == {a.action_id for a in all_actions}
+
+        exported = orjson.loads(action_registry.to_json_bytes())
+        assert set(exported) == set(schema)
+
+        listing = action_registry.list_all()
+        assert listing is action_registry.list_all()
+
+        original = all_actions[0]
+        assert action_registry.register(original) is original
+        assert action_registry.register(original.model_copy()) is original
+        assert action_registry.to_json_schema() is schema
+        assert action_registry.list_all() is listing
+
+        try:
+            action_registry.register(original.model_copy(update={"version": "9.9.9"}))
+            assert action_registry.to_json_schema() is not schema
+            assert action_registry.list_all() is not listing
+        finally:
+            action_registry.register(original)
+        assert action_registry.get(original.action_id) is original
+        assert action_registry.actions_view["load-shed"] is action_registry.get("load-shed")
+
+    def test_descriptors_are_immutable(self, all_actions):
+        """Test registered descriptors cannot be modified in place."""
+        action = all_actions[0]
+
+        with pytest.raises(ValidationError):
+            action.action_name = "Renamed"
+        with pytest.raises(FrozenInstanceError):
+            action.ui_fields[0].label = "Renamed"
+
+        for descriptor in all_actions:
+            assert isinstance(descriptor.ui_fields, tuple)
+            assert isinstance(descriptor.graph_nodes, tuple)
+            assert isinstance(descriptor.side_effects, tuple)
+            for node in descriptor.graph_nodes:
+                assert isinstance(node.relationships, tuple)
+
+    def test_graph_node_ids_unique_across_registry(self, all_actions):
+        """Test graph node IDs never collide between actions, so merged graphs stay unambiguous."""
+        node_ids = [node.node_id for action in all_actions for node in action.graph_nodes]
+
+        assert len(node_ids) == len(set(node_ids))
+
+    def test_option_values_shared_across_descriptors(self, all_actions):
+        """Test identical select option values are interned to a single object."""
+        role_values = {}
+        for action in all_actions:
+            user_role = next(f for f in action.ui_fields if f.field_name == "user_role")
+            for option in user_role.options:
+                first = role_values.setdefault(option["value"], option["value"])
+                assert option["value"] is first
+
+    def test_descriptor_json_schema_generates(self):
+        """Test the frozen descriptor dataclasses still produce a JSON schema."""
+        schema = ActionDescriptor.model_json_schema()
+
+        assert "AuditLogDescriptor" in schema["$defs"]
+
 
 class TestSpecificActionConstraints:
     """
@@ -222,6 +316,13 @@ class TestSpecificActionConstraints:
         assert any("cooling rate" in c.lower() or ("1" in c and "10" in c and "hr" in c.lower()) for c in constraints), \
             "Missing cooling rate constraint"
 
+        # UI time fields use the same HH:MM pattern the input model enforces
+        from src.models.actions import PreCoolingInput
+        model_pattern = PreCoolingInput.model_json_schema()["properties"]["start_time"]["pattern"]
+        time_fields = [f for f in action.ui_fields if f.field_type == "time"]
+        assert time_fields
+        assert all(f.pattern == model_pattern for f in time_fields)
+
 
 class TestODRLPolicyConsistency:
     """
@@ -263,6 +364,14 @@ class TestODRLPolicyConsistency:
                 assert len(constraints) > 0 or "temporary_access" in str(constraints), \
                     f"{action.action_id}: Contractor has unrestricted access"
 
+    def test_can_matches_policy_permitted(self):
+        """Test can() reflects each role's permitted flag and denies unknown roles."""
+        for action in action_registry.list_all():
+            for role, policy in action.odrl_policies.items():
+                assert action.can(role) is policy["permitted"]
+                assert isinstance(policy.get("constraints", ()), tuple)
+            assert not action.can("visitor")
+
 
 class TestUIFieldConsistency:
     """
@@ -306,3 +415,21 @@ class TestUIFieldConsistency:
                 # Should have at least min or max
                 assert field.min_value is not None or field.max_value is not None, \
                     f"{action.action_id}: Number field {field.field_name} has no constraints"
+
+
+class TestActionModuleConstants:
+    """Test action implementation classes hand out shared, read-only metadata."""
+
+    @pytest.mark.parametrize("class_name", ["AdjustSetpointAction", "LoadShedAction", "PreCoolingAction"])
+    def test_static_getters_return_cached_immutable_values(self, class_name):
+        """Test every no-argument get_* method returns the same frozen object each call."""
+        import src.models.actions as actions
+
+        action_class = getattr(actions, class_name)
+        getters = [name for name in vars(action_class) if name.startswith("get_")]
+        assert getters
+
+        for name in getters:
+            value = getattr(action_class, name)()
+            assert value is getattr(action_class, name)(), f"{class_name}.{name} rebuilds its value"
+            assert not isinstance(value, (dict, list)), f"{class_name}.{name} returns a mutable value"
@@ -5,7 +5,7 @@ Tests audit log retrieval and filtering.
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from tests.fixtures.sample_actions import create_sample_successful_action_result
 
 
@@ -61,10 +61,10 @@ class TestAuditTrailEndpoints:
     @pytest.mark.unit
     def test_audit_log_filtering_by_date(self):
         """Test audit log filtering by date."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         # Date range should be valid
-        start_date = datetime(2024, 1, 1)
+        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end_date = now
 
         assert start_date < end_date
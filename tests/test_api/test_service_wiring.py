@@ -0,0 +1,338 @@
+"""
+Tests for API service wiring.
+
+Ensures all routers resolve the same service instances through dependency injection.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_executor, get_state_manager, get_validator
+from src.main import app
+
+
+@pytest.fixture
+def client():
+    """Test client with application lifespan enabled."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestServiceWiring:
+    """Tests for shared service providers."""
+
+    @pytest.mark.api
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_providers_return_singletons(self):
+        """Test providers return the same instance on every call."""
+        assert await get_state_manager() is await get_state_manager()
+        assert await get_validator() is await get_validator()
+        assert await get_executor() is await get_executor()
+
+    @pytest.mark.api
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_executor_uses_shared_services(self):
+        """Test executor is wired to the shared state manager and validator."""
+        executor = await get_executor()
+        assert executor.state_manager is await get_state_manager()
+        assert executor.validator is await get_validator()
+
+    @pytest.mark.api
+    @pytest.mark.unit
+    def test_routers_share_providers(self):
+        """Test every router resolves services through the shared deps module."""
+        from src.api import actions, audit, building
+
+        assert audit.get_state_manager is building.get_state_manager is get_state_manager
+        assert actions.get_executor is get_executor
+        assert actions.get_validator is get_validator
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_executed_action_visible_to_audit_and_building(self, client):
+        """Test actions executed via /actions are visible through /audit and /building."""
+        response = client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setTemperature",
+                "target_zone": "Z002",
+                "parameters": {"setpoint": 70.5}
+            }
+        )
+        assert response.status_code == 200
+        action_id = response.json()["action_id"]
+        applied_at = response.json()["result"]["applied_at"]
+        assert datetime.fromisoformat(applied_at).tzinfo is not None
+
+        details = client.get(f"/audit/actions/{action_id}")
+        assert details.status_code == 200
+        assert details.json()["target_zone"] == "Z002"
+
+        zone_state = client.get("/building/zones/Z002/state")
+        assert zone_state.status_code == 200
+        assert zone_state.json()["state"]["last_action_id"] == action_id
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_list_zones_reflects_new_zone(self, client):
+        """Test the cached zone list is refreshed when a zone is added."""
+        before = client.get("/building/zones").json()
+        assert "Z001" in before["zones"]
+
+        client.post("/building/zones/Z900/initialize")
+        after = client.get("/building/zones").json()
+        assert "Z900" in after["zones"]
+        assert after["total_zones"] == len(after["zones"])
+
+        client.delete("/building/zones/Z900/state")
+        assert "Z900" not in client.get("/building/zones").json()["zones"]
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_action_types_conditional_get(self, client):
+        """Test /actions/types returns an ETag and honours If-None-Match."""
+        response = client.get("/actions/types")
+        assert response.status_code == 200
+        assert "setTemperature" in response.json()["supported_actions"]
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"].startswith("public")
+
+        cached = client.get("/actions/types", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+        stale = client.get("/actions/types", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_audit_history_streams_json_and_ndjson(self, client):
+        """Test audit history is returned as a JSON array or as NDJSON lines."""
+        client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setLightingLevel",
+                "target_zone": "Z003",
+                "parameters": {"level": 40}
+            }
+        )
+
+        as_json = client.get("/audit/history", params={"zone_id": "Z003"})
+        assert as_json.status_code == 200
+        entries = as_json.json()
+        assert entries and all(e["target_zone"] == "Z003" for e in entries)
+
+        as_ndjson = client.get("/audit/recent", params={"format": "ndjson", "limit": 5})
+        assert as_ndjson.headers["content-type"].startswith("application/x-ndjson")
+        lines = as_ndjson.text.strip().splitlines()
+        assert 1 <= len(lines) <= 5
+
+        empty = client.get("/audit/history", params={"zone_id": "no-such-zone"})
+        assert empty.json() == []
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_streamed_audit_entries_match_detail_endpoint(self, client):
+        """Test streamed and single-entry audit responses share one wire format."""
+        action_id = client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setLightingLevel",
+                "target_zone": "Z005",
+                "parameters": {"level": 55}
+            }
+        ).json()["action_id"]
+
+        detail = client.get(f"/audit/actions/{action_id}").json()
+        streamed = client.get("/audit/history", params={"zone_id": "Z005"}).json()
+        ndjson = client.get("/audit/history", params={"zone_id": "Z005", "format": "ndjson"})
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+
+        assert detail["timestamp"].endswith("Z")
+        assert next(e for e in streamed if e["action_id"] == action_id) == detail
+        assert next(e for e in lines if e["action_id"] == action_id) == detail
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_oversized_integer_parameters_rejected(self, client):
+        """Test integers orjson cannot encode are refused before reaching the audit trail."""
+        response = client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setTemperature",
+                "target_zone": "Z004",
+                "parameters": {"setpoint": 70.5, "ref": [123456789012345678901234567890]}
+            }
+        )
+        assert response.status_code == 422
+
+        assert client.get("/audit/history").status_code == 200
+        assert client.get("/audit/history", params={"format": "ndjson"}).status_code == 200
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_oversized_integer_initial_state_rejected(self, client):
+        """Test a zone cannot be initialized with state the state endpoints cannot encode."""
+        response = client.post("/building/zones/ZX/initialize", json={"foo": 2 ** 70})
+        assert response.status_code == 400
+
+        assert client.get("/building/zones/ZX/state").status_code == 404
+        assert client.get("/building/state").status_code == 200
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_large_responses_are_gzipped(self, client):
+        """Test responses above the size threshold are gzip-encoded."""
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers.get("content-encoding") == "gzip"
+
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_cors_headers(self, client):
+        """Test CORS headers on simple and preflight requests."""
+        simple = client.get("/health", headers={"Origin": "http://example.com"})
+        assert simple.headers["access-control-allow-origin"] == "*"
+        assert simple.headers["access-control-allow-credentials"] == "true"
+
+        preflight = client.options(
+            "/actions/execute",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "x-user-id",
+            }
+        )
+        assert preflight.status_code == 200
+        assert preflight.headers["access-control-allow-origin"] == "http://example.com"
+        assert "POST" in preflight.headers["access-control-allow-methods"]
+        assert preflight.headers["access-control-allow-headers"] == "x-user-id"
+
+        no_origin = client.get("/health")
+        assert "access-control-allow-origin" not in no_origin.headers
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_action_details_conditional_and_missing(self, client):
+        """Test action details support ETag revalidation, HEAD, and 404."""
+        response = client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setOccupancyMode",
+                "target_zone": "Z004",
+                "parameters": {"mode": "occupied"}
+            }
+        )
+        action_id = response.json()["action_id"]
+
+        details = client.get(f"/audit/actions/{action_id}")
+        assert details.status_code == 200
+        etag = details.headers["etag"]
+
+        cached = client.get(f"/audit/actions/{action_id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        head = client.head(f"/audit/actions/{action_id}")
+        assert head.status_code == 200
+        assert head.content == b""
+
+        missing = client.get("/audit/actions/does-not-exist")
+        assert missing.status_code == 404
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_static_files_cache_headers(self, client):
+        """Test the index page and static assets carry Cache-Control headers."""
+        index = client.get("/")
+        assert index.status_code == 200
+        assert index.headers["content-type"].startswith("text/html")
+        assert index.headers["cache-control"] == "public, max-age=60"
+
+        graph = client.get("/static/graph.html")
+        assert graph.status_code == 200
+        assert graph.headers["cache-control"] == "public, max-age=60"
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_list_endpoints_serialize_models(self, client):
+        """Test list endpoints that skip response validation still return model fields."""
+        building = client.get("/building/state").json()
+        z001 = next(zone for zone in building if zone["zone_id"] == "Z001")
+        assert set(z001) == {"zone_id", "state", "timestamp", "metadata"}
+
+        client.post(
+            "/actions/execute",
+            json={
+                "action_type": "setTemperature",
+                "target_zone": "Z005",
+                "parameters": {"setpoint": 69.0}
+            }
+        )
+        history = client.get("/audit/zones/Z005/history").json()
+        assert history and all(entry["target_zone"] == "Z005" for entry in history)
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_action_descriptors_served_from_registry(self, client):
+        """Test /actions/descriptors returns the registry's cached export."""
+        response = client.get("/actions/descriptors")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        descriptors = response.json()
+        assert {"adjust-setpoint", "load-shed", "pre-cooling"} <= set(descriptors)
+        assert descriptors["load-shed"]["ui_fields"]
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_action_input_schema_served_from_module_cache(self, client):
+        """Test /actions/descriptors/{id}/input-schema returns the pre-serialized schema."""
+        from src.models.actions import PreCoolingAction
+
+        response = client.get("/actions/descriptors/pre-cooling/input-schema")
+        assert response.status_code == 200
+        assert response.content == PreCoolingAction.get_input_schema_json()
+        assert "max-age" in response.headers["cache-control"]
+
+        missing = client.get("/actions/descriptors/unknown/input-schema")
+        assert missing.status_code == 404
+
+    @pytest.mark.api
+    @pytest.mark.unit
+    def test_every_registered_action_has_input_schema_route(self):
+        """Test each registered descriptor maps to an action class with a schema."""
+        from src.api.actions import _action_class_for
+        from src.models.action_descriptor import action_registry
+
+        for action_id in action_registry.actions_view:
+            action_class = _action_class_for(action_id)
+            assert action_class is not None, action_id
+            assert action_class.get_input_schema_json()
+
+    @pytest.mark.api
+    @pytest.mark.integration
+    def test_input_schema_route_resolves_newly_registered_action(self, client, monkeypatch):
+        """Test descriptors registered at runtime are resolved through the registry."""
+        from src.api import actions
+        from src.models.action_descriptor import ActionRegistry, action_registry
+        from src.models.actions import PreCoolingAction
+
+        registry = ActionRegistry()
+        registry.register(action_registry.get("load-shed"))
+        registry.register(
+            action_registry.get("pre-cooling").model_copy(update={"action_id": "pre-cooling-v2"})
+        )
+        monkeypatch.setattr(actions, "action_registry", registry)
+
+        response = client.get("/actions/descriptors/pre-cooling-v2/input-schema")
+        assert response.status_code == 200
+        assert response.content == PreCoolingAction.get_input_schema_json()
+        missing = client.get("/actions/descriptors/pre-cooling/input-schema")
+        assert missing.status_code == 404
@@ -0,0 +1,36 @@
+"""
+Tests for the action implementations package.
+
+Tests the package exposes one set of public names and loads submodules lazily.
+"""
+
+import subprocess
+import sys
+
+import src.models.actions as actions
+
+
+class TestActionsPackage:
+    """Test src.models.actions package exports."""
+
+    def test_public_names_resolve_to_submodule_classes(self):
+        """Test every name in __all__ resolves to the class defined in its submodule."""
+        for name in actions.__all__:
+            value = getattr(actions, name)
+            assert value.__name__ == name
+            assert value.__module__.startswith("src.models.actions.")
+
+    def test_import_does_not_load_submodules(self):
+        """Test importing the package alone builds no action models."""
+        code = (
+            "import sys, src.models.actions; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.models.actions.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,115 @@
+"""
+Tests for Adjust Setpoint Action Model
+
+Tests setpoint bounds, the priority-dependent comfort range, and max_change limits.
+"""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from src.models.actions._frozen import compile_conditions, conditions_hold
+from src.models.actions.adjust_setpoint import AdjustSetpointAction, AdjustSetpointInput
+
+
+class TestAdjustSetpointInputValidation:
+    """Test AdjustSetpointInput validation."""
+
+    def test_valid_setpoint(self):
+        """Test a setpoint inside the comfort range is accepted."""
+        result = AdjustSetpointInput(zone_id="Z001", new_setpoint=72.0, reason="Comfort")
+
+        assert result.new_setpoint == 72.0
+        assert result.priority == "medium"
+
+    def test_comfort_range_enforced_for_normal_priority(self):
+        """Test low/medium priority setpoints must stay within 60-80°F."""
+        with pytest.raises(ValidationError) as exc_info:
+            AdjustSetpointInput(zone_id="Z001", new_setpoint=85.0, reason="Test")
+
+        assert "comfort range" in str(exc_info.value)
+
+    def test_comfort_range_skipped_for_emergency_priority(self):
+        """Test high/emergency priority setpoints only need the 50-90°F field bounds."""
+        result = AdjustSetpointInput(
+            zone_id="Z001",
+            new_setpoint=85.0,
+            reason="Server room cooling failure",
+            priority="emergency"
+        )
+
+        assert result.new_setpoint == 85.0
+
+        with pytest.raises(ValidationError):
+            AdjustSetpointInput(
+                zone_id="Z001",
+                new_setpoint=95.0,
+                reason="Out of bounds",
+                priority="emergency"
+            )
+
+    def test_max_change_enforced(self):
+        """Test change from the current setpoint cannot exceed max_change."""
+        with pytest.raises(ValidationError) as exc_info:
+            AdjustSetpointAction.validate_input({
+                "zone_id": "Z001",
+                "new_setpoint": 78.0,
+                "current_setpoint": 70.0,
+                "reason": "Test"
+            })
+
+        assert "exceeds max_change" in str(exc_info.value)
+
+
+class TestAdjustSetpointBatchValidation:
+    """Test batch validation helpers."""
+
+    def test_validate_inputs(self):
+        """Test a batch of inputs validates in order."""
+        items = [
+            {"zone_id": "Z001", "new_setpoint": 70.0, "reason": "Morning"},
+            {"zone_id": "Z002", "new_setpoint": 74.0, "reason": "Afternoon"},
+        ]
+
+        results = AdjustSetpointAction.validate_inputs(items)
+
+        assert [r.zone_id for r in results] == ["Z001", "Z002"]
+        assert AdjustSetpointAction.validate_inputs_json(orjson.dumps(items)) == results
+
+    def test_validate_inputs_reports_failing_index(self):
+        """Test errors in a batch identify the failing item."""
+        items = [
+            {"zone_id": "Z001", "new_setpoint": 70.0, "reason": "OK"},
+            {"zone_id": "Z002", "new_setpoint": 95.0, "reason": "Too hot"},
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            AdjustSetpointAction.validate_inputs(items)
+
+        assert exc_info.value.errors()[0]["loc"][0] == 1
+
+
+class TestAdjustSetpointConditions:
+    """Test compiled precondition tables."""
+
+    def test_precondition_calls_match_strings(self):
+        """Test compiled calls are parsed from the string preconditions."""
+        calls = AdjustSetpointAction.get_precondition_calls()
+
+        assert calls == compile_conditions(AdjustSetpointAction.get_preconditions())
+        assert ("zone_exists", ("zone_id",)) in calls
+
+    def test_conditions_hold_dispatches_predicates(self):
+        """Test compiled calls evaluate through a predicate table."""
+        calls = compile_conditions(["zone_exists(zone_id)", "zone_online(zone_id)"])
+        context = {"zone_id": "Z001"}
+
+        assert conditions_hold(calls, {"zone_exists": bool, "zone_online": bool}, context)
+        assert not conditions_hold(
+            calls, {"zone_exists": bool, "zone_online": lambda _: False}, context
+        )
+
+    def test_compile_rejects_non_call_expressions(self):
+        """Test expressions that are not simple calls are rejected."""
+        with pytest.raises(ValueError):
+            compile_conditions(["zone_id == 'Z001'"])
@@ -4,17 +4,19 @@ Tests for building, zone, and equipment models.
 Tests validation, creation, and manipulation of building configurations.
 """
 
+from datetime import datetime, time
+
 import pytest
-from datetime import time, datetime
+
 from tests.fixtures.sample_building import (
+    BuildingConfiguration,
+    EquipmentConfiguration,
     Location,
     Schedule,
     ZoneConfiguration,
-    EquipmentConfiguration,
-    BuildingConfiguration,
+    create_multi_floor_building,
     create_sample_building,
     create_small_single_zone_building,
-    create_multi_floor_building,
 )
 
 
@@ -550,3 +552,57 @@ class TestBuildingConfiguration:
         )
         assert building.created_at is not None
         assert isinstance(building.created_at, datetime)
+
+
+class TestBuildingModelValidators:
+    """Test custom validators on src.models.building models."""
+
+    def test_duplicate_zone_ids_rejected(self):
+        """Test a building cannot contain two zones with the same ID."""
+        from pydantic import ValidationError
+
+        from src.models.building import Building, Zone
+
+        zone = Zone(id="Z001", name="Lobby", current_temp=71.0, setpoint=72.0, occupancy_mode="occupied")
+
+        with pytest.raises(ValidationError) as exc_info:
+            Building(id="B001", name="HQ", zones=[zone, zone])
+
+        assert "Duplicate zone IDs" in str(exc_info.value)
+
+    def test_equipment_power_usage_limit(self):
+        """Test equipment power usage is capped at 100kW."""
+        from pydantic import ValidationError
+
+        from src.models.building import Equipment
+
+        assert Equipment(id="E1", type="chiller", status="on", power_usage=100000.0).power_usage == 100000.0
+        with pytest.raises(ValidationError):
+            Equipment(id="E1", type="chiller", status="on", power_usage=100000.5)
+
+    @pytest.mark.parametrize("setpoint,valid", [(60.0, True), (80.0, True), (59.5, False), (80.5, False)])
+    def test_zone_setpoint_comfort_range(self, setpoint, valid):
+        """Test zone setpoints are limited to the inclusive 60-80°F comfort range."""
+        from pydantic import ValidationError
+
+        from src.models.building import Zone
+
+        data = {"id": "Z001", "name": "Lobby", "current_temp": 71.0, "setpoint": setpoint, "occupancy_mode": "occupied"}
+        if valid:
+            assert Zone(**data).setpoint == setpoint
+        else:
+            with pytest.raises(ValidationError):
+                Zone(**data)
+
+    def test_models_are_frozen_and_reject_extra_fields(self):
+        """Test building models cannot be mutated and reject unknown fields."""
+        from pydantic import ValidationError
+
+        from src.models.building import Equipment
+
+        equipment = Equipment(id="E1", type="hvac", status="on", power_usage=1200.0)
+
+        with pytest.raises(ValidationError):
+            equipment.status = "off"
+        with pytest.raises(ValidationError):
+            Equipment(id="E2", type="fan", status="on", power_usage=10.0, color="red")
@@ -4,27 +4,29 @@ Tests for KBE action models.
 Tests ActionDefinition, ActionExecution, ActionParameter, and related classes.
 """
 
-import pytest
 from datetime import datetime
+
+import pytest
+
 from tests.fixtures.sample_actions import (
-    ActionType,
-    ActionStatus,
     ActionParameter,
     ActionRequest,
     ActionResult,
-    InferenceRule,
+    ActionStatus,
+    ActionType,
     InferenceResult,
+    InferenceRule,
     ReasoningType,
     create_inference_action_request,
-    create_validation_action_request,
     create_query_action_request,
-    create_transformation_action_request,
+    create_sample_failed_action_result,
     create_sample_inference_result,
-    create_sample_validation_result,
     create_sample_inference_rules,
-    create_sample_successful_action_result,
-    create_sample_failed_action_result,
     create_sample_pending_action_result,
+    create_sample_successful_action_result,
+    create_sample_validation_result,
+    create_transformation_action_request,
+    create_validation_action_request,
 )
 
 
@@ -494,3 +496,177 @@ class TestValidationResult:
         assert len(result.issues) == 2
         assert result.issues[0]["type"] == "missing_equipment"
         assert len(result.warnings) == 1
+
+
+class TestBatchValidation:
+    """Test batch validation of src.models.kbe_actions models."""
+
+    def test_action_definitions_validate_many(self):
+        """Test a batch of definitions validates in order with UTC timestamps."""
+        from src.models.kbe_actions import ActionDefinition
+
+        rows = [
+            {
+                "id": f"action-{i}",
+                "name": f"Action {i}",
+                "description": "Batch loaded",
+                "action_type": "control",
+                "input_schema": {"type": "object", "properties": {}},
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": "2025-01-02T00:00:00"
+            }
+            for i in range(3)
+        ]
+
+        definitions = ActionDefinition.validate_many(rows)
+
+        assert [d.id for d in definitions] == ["action-0", "action-1", "action-2"]
+        assert all(d.created_at.tzinfo is not None for d in definitions)
+
+    def test_action_executions_validate_many_reports_index(self):
+        """Test an invalid execution in a batch is reported by position."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import ActionExecution
+
+        rows = [
+            {"id": "exec-1", "action_id": "a", "status": "pending"},
+            {"id": "exec-2", "action_id": "a", "status": "completed"},
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            ActionExecution.validate_many(rows)
+
+        assert exc_info.value.errors()[0]["loc"][0] == 1
+
+
+class TestSideEffectTargets:
+    """Test SideEffect target validation per effect type."""
+
+    @pytest.mark.parametrize("effect_type,target,valid", [
+        ("webhook", "https://example.com/hook", True),
+        ("webhook", "http://example.com/hook", True),
+        ("webhook", "ftp://example.com/hook", False),
+        ("email", "ops@example.com", True),
+        ("email", "ops.example.com", False),
+        ("log", "anything", True),
+    ])
+    def test_target_rules(self, effect_type, target, valid):
+        """Test targets are checked against the rule for their effect type."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import SideEffect
+
+        if valid:
+            assert SideEffect(type=effect_type, target=f"{target} ").target == target
+        else:
+            with pytest.raises(ValidationError):
+                SideEffect(type=effect_type, target=target)
+
+
+class TestCachedJsonSchema:
+    """Test cached_json_schema for src.models action models."""
+
+    def test_schema_generated_once_per_model(self):
+        """Test each model's schema is built once and matches model_json_schema()."""
+        from src.models import ActionDefinition, ActionExecution, cached_json_schema
+
+        schema = cached_json_schema(ActionDefinition)
+
+        assert schema is cached_json_schema(ActionDefinition)
+        assert schema == ActionDefinition.model_json_schema()
+        assert cached_json_schema(ActionExecution)["title"] == "ActionExecution"
+
+
+class TestExecutionState:
+    """Test ActionExecution state consistency checks."""
+
+    @pytest.mark.parametrize("status", ["completed", "failed"])
+    def test_terminal_status_requires_completed_at(self, status):
+        """Test terminal statuses must record a completion time."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import ActionExecution
+
+        with pytest.raises(ValidationError) as exc_info:
+            ActionExecution(
+                id="exec-1",
+                action_id="a",
+                status=status,
+                outputs={},
+                error_message="boom"
+            )
+
+        assert "completed_at must be set" in str(exc_info.value)
+
+    @pytest.mark.parametrize("status", ["pending", "validated", "executing"])
+    def test_non_terminal_status_needs_no_completion(self, status):
+        """Test in-progress statuses are valid without completion fields."""
+        from src.models.kbe_actions import ActionExecution
+
+        execution = ActionExecution(id="exec-1", action_id="a", status=status)
+
+        assert execution.completed_at is None
+
+    def test_retry_limit_enforced_for_in_progress_status(self):
+        """Test retry_count is checked even when the status is not terminal."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import ActionExecution
+
+        with pytest.raises(ValidationError) as exc_info:
+            ActionExecution(
+                id="exec-1",
+                action_id="a",
+                status="executing",
+                retry_count=4,
+                max_retries=3
+            )
+
+        assert "cannot exceed max_retries" in str(exc_info.value)
+
+    def test_precheck_rejects_raw_out_of_order_timestamps(self):
+        """Test ISO string timestamps are compared before field conversion."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import ActionDefinition, ActionExecution
+
+        with pytest.raises(ValidationError) as exc_info:
+            ActionExecution.model_validate({
+                "id": "exec-1",
+                "action_id": "a",
+                "status": "completed",
+                "outputs": {},
+                "started_at": "2025-01-02T00:00:00Z",
+                "completed_at": "2025-01-01T00:00:00+00:00"
+            })
+
+        assert exc_info.value.errors()[0]["loc"] == ()
+
+        with pytest.raises(ValidationError, match="updated_at cannot be before created_at"):
+            ActionDefinition.model_validate({
+                "id": "action-1",
+                "name": "Action",
+                "description": "Out of order",
+                "action_type": "control",
+                "input_schema": {"type": "object"},
+                "created_at": "2025-01-02T00:00:00",
+                "updated_at": "2025-01-01T12:00:00-05:00"
+            })
+
+    def test_precheck_leaves_unparseable_timestamps_to_fields(self):
+        """Test values the precheck cannot compare are reported by field validation."""
+        from pydantic import ValidationError
+
+        from src.models.kbe_actions import ActionExecution
+
+        with pytest.raises(ValidationError) as exc_info:
+            ActionExecution.model_validate({
+                "id": "exec-1",
+                "action_id": "a",
+                "status": "completed",
+                "outputs": {},
+                "completed_at": "not a date"
+            })
+
+        assert exc_info.value.errors()[0]["loc"] == ("completed_at",)
@@ -5,9 +5,12 @@ Comprehensive tests for pre-cooling input validation, SHACL constraints,
 and ODRL governance policies.
 """
 
+from typing import get_args
+
+import orjson
 import pytest
 from pydantic import ValidationError
-from src.models.actions.pre_cooling import PreCoolingInput, PreCoolingAction
+from src.models.actions.pre_cooling import PreCoolingInput, PreCoolingAction, time_window_minutes
 
 
 class TestPreCoolingInputValidation:
@@ -28,7 +31,7 @@ class TestPreCoolingInputValidation:
 
         result = PreCoolingInput(**input_data)
 
-        assert result.zone_ids == ["Z001", "Z002"]
+        assert result.zone_ids == ("Z001", "Z002")
         assert result.target_temp == 65.0
         assert result.start_time == "05:00"
         assert result.occupancy_start == "08:00"
@@ -222,6 +225,22 @@ class TestPreCoolingInputValidation:
 
         assert "cannot be empty" in str(exc_info.value)
 
+    def test_zone_ids_stored_as_sorted_tuple(self):
+        """Test zone IDs are normalized so the same set gives the same hashable key."""
+        base = {
+            "target_temp": 65.0,
+            "start_time": "05:00",
+            "occupancy_start": "08:00",
+            "reason": "Test"
+        }
+
+        first = PreCoolingInput(zone_ids=["Z003", "Z001", "Z002"], **base)
+        second = PreCoolingInput(zone_ids=["Z002", "Z003", "Z001"], **base)
+
+        assert first.zone_ids == ("Z001", "Z002", "Z003")
+        assert hash(first.zone_ids) == hash(second.zone_ids)
+        assert first.model_dump(mode="json")["zone_ids"] == ["Z001", "Z002", "Z003"]
+
     def test_outdoor_temp_range_validation(self):
         """Test outdoor temperature constraint validation."""
         input_data = {
@@ -239,6 +258,26 @@ class TestPreCoolingInputValidation:
 
         assert "must be less than" in str(exc_info.value)
 
+    def test_time_window_error_reported_before_outdoor_range(self):
+        """Test the combined validator reports the time window first when both checks fail."""
+        input_data = {
+            "zone_ids": ["Z001"],
+            "target_temp": 65.0,
+            "start_time": "07:50",
+            "occupancy_start": "08:00",
+            "min_outdoor_temp": 80.0,
+            "max_outdoor_temp": 70.0,
+            "reason": "Test"
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            PreCoolingInput(**input_data)
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["type"] == "precooling_window_too_short"
+        assert errors[0]["ctx"] == {"time_window": 10}
+
     def test_cost_limit_validation(self):
         """Test cost limit must be non-negative."""
         input_data = {
@@ -270,6 +309,17 @@ class TestPreCoolingActionMethods:
         assert "occupancy_start" in schema["properties"]
         assert "reason" in schema["required"]
 
+    def test_input_schema_is_shared_and_read_only(self):
+        """Test the input schema is built once and cannot be mutated."""
+        schema = PreCoolingAction.get_input_schema()
+
+        assert schema is PreCoolingAction.get_input_schema()
+        with pytest.raises(TypeError):
+            schema["type"] = "array"
+        assert orjson.loads(PreCoolingAction.get_input_schema_json())["required"] == list(
+            schema["required"]
+        )
+
     def test_get_validation_rules(self):
         """Test that validation rules are properly defined."""
         rules = PreCoolingAction.get_validation_rules()
@@ -311,6 +361,39 @@ class TestPreCoolingActionMethods:
         assert isinstance(result, PreCoolingInput)
         assert result.target_temp == 65.0
 
+    def test_validate_input_json(self):
+        """Test JSON validation matches dict validation."""
+        input_data = {
+            "zone_ids": ["Z001"],
+            "target_temp": 65.0,
+            "start_time": "05:00",
+            "occupancy_start": "08:00",
+            "reason": "Test"
+        }
+
+        result = PreCoolingAction.validate_input_json(orjson.dumps(input_data))
+
+        assert result == PreCoolingAction.validate_input(input_data)
+
+        with pytest.raises(ValidationError):
+            PreCoolingAction.validate_input_json(b'{"zone_ids": []}')
+
+    def test_literal_fields_reuse_canonical_strings(self):
+        """Test Literal fields hold the schema's own string objects, not parsed copies."""
+        raw = orjson.dumps({
+            "zone_ids": ["Z001"],
+            "target_temp": 65.0,
+            "start_time": "05:00",
+            "occupancy_start": "08:00",
+            "priority": "high",
+            "reason": "Test"
+        })
+
+        result = PreCoolingAction.validate_input_json(raw)
+
+        literal_values = get_args(PreCoolingInput.model_fields["priority"].annotation)
+        assert any(result.priority is value for value in literal_values)
+
     def test_calculate_estimated_cost(self):
         """Test cost estimation calculation."""
         cost = PreCoolingAction.calculate_estimated_cost(
@@ -324,6 +407,17 @@ class TestPreCoolingActionMethods:
         expected = 2 * 8 * 3 * 3.0 * 0.12
         assert cost == pytest.approx(expected)
 
+    def test_calculate_estimated_costs_matches_scalar(self):
+        """Test batch cost estimates equal the per-candidate scalar results."""
+        candidates = [(10, 5.0, 2.0), (3, 2.5, 1.5), (0, 4.0, 3.0)]
+
+        costs = PreCoolingAction.calculate_estimated_costs(candidates, electricity_rate_per_kwh=0.15)
+
+        assert costs == [
+            PreCoolingAction.calculate_estimated_cost(*c, electricity_rate_per_kwh=0.15)
+            for c in candidates
+        ]
+
     def test_calculate_estimated_savings(self):
         """Test peak demand savings calculation."""
         savings = PreCoolingAction.calculate_estimated_savings(
@@ -425,6 +519,13 @@ class TestPreCoolingEdgeCases:
         result = PreCoolingInput(**input_data)
         assert result.occupancy_start == "08:00"
 
+    def test_time_window_minutes_wraps_midnight(self):
+        """Test window length handles same-day and overnight schedules."""
+        assert time_window_minutes("05:00", "08:00") == 180
+        assert time_window_minutes("23:00", "07:00") == 480
+        with pytest.raises(ValueError):
+            time_window_minutes("5:00", "08:00")
+
     def test_target_temp_at_62_degrees(self):
         """Test target temp at 62°F (minimum for economics)."""
         input_data = {
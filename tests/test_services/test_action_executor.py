@@ -4,20 +4,22 @@ Tests for action execution service.
 Tests ActionExecutor, action queuing, and execution logic.
 """
 
-import pytest
 from datetime import datetime, timedelta
+
+import pytest
+
 from tests.fixtures.sample_actions import (
-    ActionType,
-    ActionStatus,
     ActionRequest,
     ActionResult,
+    ActionStatus,
+    ActionType,
     create_inference_action_request,
-    create_validation_action_request,
     create_query_action_request,
-    create_transformation_action_request,
-    create_sample_successful_action_result,
     create_sample_failed_action_result,
     create_sample_pending_action_result,
+    create_sample_successful_action_result,
+    create_transformation_action_request,
+    create_validation_action_request,
 )
 from tests.fixtures.sample_building import create_sample_building
 
@@ -334,3 +336,124 @@ class TestActionAsyncSupport:
 
         # Should be able to poll status
         assert action_id
+
+
+class TestSimulatedLatency:
+    """Tests for the demo latency switch on the real ActionExecutor."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("simulate_latency,expected_sleeps", [(False, []), (True, [0.1])])
+    async def test_handlers_sleep_only_when_simulating(
+        self, monkeypatch, simulate_latency, expected_sleeps
+    ):
+        """Test handlers skip the simulated device delay unless enabled."""
+        from src.models import ActionRequest as ExecutorRequest
+        from src.services import ActionExecutor, action_executor
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(action_executor.asyncio, "sleep", fake_sleep)
+        executor = ActionExecutor(simulate_latency=simulate_latency)
+
+        response = await executor.execute_action(ExecutorRequest(
+            action_type="setTemperature",
+            target_zone="Z001",
+            parameters={"setpoint": 70.0}
+        ))
+
+        assert response.status == "completed"
+        assert sleeps == expected_sleeps
+
+
+class TestHandlerDispatch:
+    """Tests for ActionExecutor handler dispatch."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unsupported_action_type_fails(self):
+        """Test action types without a handler fail without touching state."""
+        from src.models import ActionRequest as ExecutorRequest
+        from src.services import ActionExecutor, StateManager
+
+        state_manager = StateManager()
+        executor = ActionExecutor(state_manager=state_manager)
+
+        response = await executor.execute_action(ExecutorRequest(
+            action_type="openWindows",
+            target_zone="Z001",
+            parameters={}
+        ))
+
+        assert response.status == "failed"
+        assert response.errors == ["Unsupported action type: openWindows"]
+        assert await state_manager.get_zone_state("Z001") is None
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    def test_action_type_is_interned(self):
+        """Test request action types share identity with the handler table keys."""
+        from src.models import ActionRequest as ExecutorRequest
+        from src.services import ActionExecutor
+
+        executor = ActionExecutor()
+        action_type = "".join(["setLighting", "Level"])
+
+        request = ExecutorRequest(action_type=action_type, target_zone="Z001")
+
+        key = next(k for k in executor._action_handlers if k == request.action_type)
+        assert request.action_type is key
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_during_execution(self, monkeypatch):
+        """Test an action cancelled mid-handler still completes without an error."""
+        from src.models import ActionRequest as ExecutorRequest
+        from src.services import ActionExecutor, action_executor
+
+        executor = ActionExecutor(simulate_latency=True)
+        seen = {}
+
+        async def cancel_while_sleeping(delay):
+            active = await executor.get_active_actions()
+            seen.update(active)
+            for action_id in active:
+                assert await executor.cancel_action(action_id)
+
+        monkeypatch.setattr(action_executor.asyncio, "sleep", cancel_while_sleeping)
+
+        response = await executor.execute_action(ExecutorRequest(
+            action_type="setTemperature",
+            target_zone="Z001",
+            parameters={"setpoint": 70.0}
+        ), user="alice")
+
+        assert response.status == "completed"
+        assert seen[response.action_id]["status"] == "executing"
+        assert seen[response.action_id]["user"] == "alice"
+        assert await executor.get_active_actions() == {}
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_action_ids_are_unique(self):
+        """Test each execution gets a distinct action ID with the process prefix."""
+        from src.models import ActionRequest as ExecutorRequest
+        from src.services import ActionExecutor
+        from src.services.action_executor import _ACTION_ID_PREFIX
+
+        executor = ActionExecutor()
+        request = ExecutorRequest(
+            action_type="setLightingLevel", target_zone="Z001", parameters={"level": 40}
+        )
+
+        ids = [(await executor.execute_action(request)).action_id for _ in range(5)]
+
+        assert len(set(ids)) == 5
+        assert all(action_id.startswith(f"{_ACTION_ID_PREFIX}-") for action_id in ids)
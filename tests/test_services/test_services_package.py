@@ -0,0 +1,37 @@
+"""
+Tests for the services package.
+
+Tests the package exposes its services and loads their modules lazily.
+"""
+
+import subprocess
+import sys
+
+import src.services as services
+
+
+class TestServicesPackage:
+    """Test src.services package exports."""
+
+    def test_public_names_resolve_to_service_classes(self):
+        """Test every name in __all__ resolves to the class defined in its submodule."""
+        for name in services.__all__:
+            value = getattr(services, name)
+            assert value.__name__ == name
+            assert value.__module__.startswith("src.services.")
+
+    def test_state_manager_import_skips_executor(self):
+        """Test importing one service does not load the executor or action models."""
+        code = (
+            "import sys; from src.services import StateManager; "
+            "print('src.services.action_executor' in sys.modules, "
+            "'src.models.actions.pre_cooling' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "False False"
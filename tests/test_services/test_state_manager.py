@@ -0,0 +1,340 @@
+"""
+Tests for state management service.
+
+Tests StateManager zone state, history, and audit trail lookups.
+"""
+
+import pytest
+
+from src.services import StateManager
+
+
+@pytest.fixture
+def state_manager() -> StateManager:
+    """Fresh state manager instance."""
+    return StateManager()
+
+
+class TestAuditLookup:
+    """Tests for audit trail lookups."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_audit_entry_by_id(self, state_manager):
+        """Test audit entries can be fetched directly by action ID."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "act-1")
+        await state_manager.update_state("Z002", "setLightingLevel", {"level": 40}, "act-2")
+
+        entry = await state_manager.get_audit_entry("act-2")
+
+        assert entry is not None
+        assert entry.target_zone == "Z002"
+        assert entry.action_type == "setLightingLevel"
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_audit_entry_missing(self, state_manager):
+        """Test unknown action IDs return None."""
+        assert await state_manager.get_audit_entry("missing") is None
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_state_resets_audit_index(self, state_manager):
+        """Test clearing all state also clears the action ID index."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "act-1")
+        await state_manager.clear_state()
+
+        assert await state_manager.get_audit_entry("act-1") is None
+
+
+class TestAuditSummary:
+    """Tests for audit trail summary counts."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_summary_counts(self, state_manager):
+        """Test summary groups entries by action type, zone, user, and status."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1", user="alice")
+        await state_manager.update_state("Z001", "setLightingLevel", {"level": 50}, "a2")
+        await state_manager.update_state("Z002", "setTemperature", {"setpoint": 71.0}, "a3", user="alice")
+
+        summary = await state_manager.get_audit_summary()
+
+        assert summary["total_actions"] == 3
+        assert summary["action_type_counts"] == {"setTemperature": 2, "setLightingLevel": 1}
+        assert summary["zone_counts"] == {"Z001": 2, "Z002": 1}
+        assert summary["user_counts"] == {"alice": 2}
+        assert summary["status_counts"] == {"completed": 3}
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_summary_filters(self, state_manager):
+        """Test summary honours zone and time filters."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1")
+        first = await state_manager.get_audit_entry("a1")
+        await state_manager.update_state("Z002", "setTemperature", {"setpoint": 71.0}, "a2")
+        await state_manager.update_state("Z001", "setLightingLevel", {"level": 50}, "a3")
+
+        by_zone = await state_manager.get_audit_summary(zone_id="Z001")
+        assert by_zone["total_actions"] == 2
+        assert by_zone["zone_counts"] == {"Z001": 2}
+
+        until_first = await state_manager.get_audit_summary(end_time=first.timestamp)
+        assert until_first["total_actions"] == 1
+
+
+class TestAuditTrail:
+    """Tests for indexed audit trail queries."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_filters_and_ordering(self, state_manager):
+        """Test zone and action filters combine and results are newest first."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1")
+        await state_manager.update_state("Z002", "setTemperature", {"setpoint": 71.0}, "a2")
+        await state_manager.update_state("Z001", "setLightingLevel", {"level": 50}, "a3")
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 72.0}, "a4")
+
+        by_zone = await state_manager.get_audit_trail(zone_id="Z001")
+        assert [e.action_id for e in by_zone] == ["a4", "a3", "a1"]
+
+        by_action = await state_manager.get_audit_trail(action_type="setTemperature")
+        assert [e.action_id for e in by_action] == ["a4", "a2", "a1"]
+
+        both = await state_manager.get_audit_trail(zone_id="Z001", action_type="setTemperature")
+        assert [e.action_id for e in both] == ["a4", "a1"]
+
+        assert await state_manager.get_audit_trail(zone_id="Z999") == []
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_time_window_and_pagination(self, state_manager):
+        """Test time bounds and limit/offset apply to the filtered entries."""
+        for i in range(5):
+            await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0 + i}, f"a{i}")
+        second = await state_manager.get_audit_entry("a1")
+        fourth = await state_manager.get_audit_entry("a3")
+
+        window = await state_manager.get_audit_trail(
+            zone_id="Z001", start_time=second.timestamp, end_time=fourth.timestamp
+        )
+        assert [e.action_id for e in window] == ["a3", "a2", "a1"]
+
+        page = await state_manager.get_audit_trail(limit=2, offset=1)
+        assert [e.action_id for e in page] == ["a3", "a2"]
+
+        past_end = await state_manager.get_audit_trail(offset=10)
+        assert past_end == []
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_naive_time_bounds_are_utc(self, state_manager):
+        """Test naive filter bounds are compared as UTC against aware timestamps."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1")
+        entry = await state_manager.get_audit_entry("a1")
+        assert entry.timestamp.tzinfo is not None
+
+        naive_start = entry.timestamp.replace(tzinfo=None)
+        trail = await state_manager.get_audit_trail(start_time=naive_start)
+        assert [e.action_id for e in trail] == ["a1"]
+
+
+class TestStateHistory:
+    """Tests for indexed state history queries."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_zone_filter_ordering_and_pagination(self, state_manager):
+        """Test history is newest first per zone and honours limit/offset."""
+        for i in range(4):
+            await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0 + i}, f"a{i}")
+        await state_manager.update_state("Z002", "setLightingLevel", {"level": 50}, "b0")
+
+        by_zone = await state_manager.get_state_history(zone_id="Z001")
+        assert [h["action_id"] for h in by_zone] == ["a3", "a2", "a1", "a0"]
+
+        page = await state_manager.get_state_history(limit=2, offset=1)
+        assert [h["action_id"] for h in page] == ["a3", "a2"]
+
+        assert await state_manager.get_state_history(zone_id="Z999") == []
+
+        await state_manager.clear_state()
+        assert await state_manager.get_state_history(zone_id="Z001") == []
+
+
+class TestZoneStateSnapshots:
+    """Tests for copy-on-write zone state updates."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_update_publishes_new_state(self, state_manager):
+        """Test updates replace the zone state dict instead of mutating it."""
+        await state_manager.initialize_zone("Z001")
+        before = await state_manager.get_zone_state("Z001")
+
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 68.0}, "a1")
+        after = await state_manager.get_zone_state("Z001")
+        history = await state_manager.get_state_history(zone_id="Z001")
+
+        assert before.state["temperature_setpoint"] == 72.0
+        assert after.state["temperature_setpoint"] == 68.0
+        assert history[0]["previous_state"] == before.state
+        assert history[0]["new_state"] == after.state
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_state_updates_per_action_type(self, state_manager):
+        """Test each action type updates its own state keys and unknown types change none."""
+        await state_manager.update_state(
+            "Z001", "adjustVentilation", {"rate": 400, "mode": "boost"}, "a1"
+        )
+        await state_manager.update_state("Z001", "enableEconomizer", {"max_outdoor_temp": 70}, "a2")
+        await state_manager.update_state("Z001", "unknownAction", {"rate": 0}, "a3")
+
+        state = (await state_manager.get_zone_state("Z001")).state
+
+        assert state["ventilation_rate"] == 400
+        assert state["ventilation_mode"] == "boost"
+        assert state["economizer_enabled"] is True
+        assert state["economizer_max_temp"] == 70
+        assert "economizer_min_temp" not in state
+        assert state["last_action_id"] == "a3"
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_audit_visible_immediately_after_update(self, state_manager):
+        """Test history and audit entries are readable as soon as update_state returns."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 69.0}, "a1")
+
+        entry = await state_manager.get_audit_entry("a1")
+        stats = await state_manager.get_statistics()
+
+        assert entry.details["state_changes"]["temperature_setpoint"] == 69.0
+        assert stats["total_state_changes"] == stats["total_audit_entries"] == 1
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_update_logs_lazy_message(self, state_manager, caplog):
+        """Test update logging passes arguments for the logging framework to format."""
+        with caplog.at_level("INFO", logger="src.services.state_manager"):
+            await state_manager.update_state("Z001", "setTemperature", {"setpoint": 69.0}, "a1")
+
+        record = next(r for r in caplog.records if r.msg.startswith("Updated state"))
+        assert record.args == ("Z001", "a1", "setTemperature")
+        assert record.getMessage() == "Updated state for zone Z001 from action a1 (setTemperature)"
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_returned_state_is_independent_copy(self, state_manager):
+        """Test mutating a returned state does not change the stored zone state."""
+        await state_manager.initialize_zone("Z001")
+
+        returned = await state_manager.get_zone_state("Z001")
+        returned.state["temperature_setpoint"] = 50.0
+        (await state_manager.get_all_zones_state())[0].state["hvac_mode"] = "off"
+
+        stored = (await state_manager.get_zone_state("Z001")).state
+        assert stored["temperature_setpoint"] == 72.0
+        assert stored["hvac_mode"] == "auto"
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_zone_ids_cache_unaffected_by_callers(self, state_manager):
+        """Test mutating a returned zone ID list does not change the cached IDs."""
+        await state_manager.initialize_zone("Z002")
+        await state_manager.initialize_zone("Z001")
+
+        returned = await state_manager.get_zone_ids()
+        returned.append("Z999")
+        returned.sort()
+
+        assert await state_manager.get_zone_ids() == ["Z002", "Z001"]
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_history_states_are_independent_copies(self, state_manager):
+        """Test mutating returned history does not change the stored zone state or history."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1")
+
+        record = (await state_manager.get_state_history(zone_id="Z001"))[0]
+        record["new_state"]["temperature_setpoint"] = -999
+        record["previous_state"]["occupancy_mode"] = "vacant"
+
+        assert (await state_manager.get_zone_state("Z001")).state["temperature_setpoint"] == 70.0
+        stored = (await state_manager.get_state_history(zone_id="Z001"))[0]
+        assert stored["new_state"]["temperature_setpoint"] == 70.0
+        assert stored["previous_state"] == {}
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_history_shares_snapshots_but_returns_copies(self, state_manager):
+        """Test history stores one dict per update yet callers cannot reach it."""
+        await state_manager.update_state("Z001", "setTemperature", {"setpoint": 70.0}, "a1")
+        await state_manager.update_state("Z001", "setLightingLevel", {"level": 30}, "a2")
+
+        oldest, newest = state_manager._state_history
+        assert newest["previous_state"] is oldest["new_state"]
+        assert newest["new_state"] is state_manager._zone_states["Z001"]
+
+        returned = (await state_manager.get_state_history(zone_id="Z001"))[0]
+        assert returned["new_state"] == newest["new_state"]
+        returned["new_state"]["lighting_level"] = -1
+        returned["previous_state"]["temperature_setpoint"] = -999
+
+        live = (await state_manager.get_zone_state("Z001")).state
+        assert live["lighting_level"] == 30
+        assert live["temperature_setpoint"] == 70.0
+        assert oldest["new_state"]["temperature_setpoint"] == 70.0
+
+
+class TestRetentionLimits:
+    """Tests for bounded history and audit retention."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_oldest_records_evicted_and_indexes_renumbered(self):
+        """Test logs stay within their limits and filtered queries still match."""
+        state_manager = StateManager(history_limit=10, audit_limit=10)
+        for i in range(25):
+            zone_id = "Z001" if i % 2 == 0 else "Z002"
+            await state_manager.update_state(zone_id, "setLightingLevel", {"level": i}, f"a{i}")
+
+        stats = await state_manager.get_statistics()
+        assert stats["total_state_changes"] <= 10
+        assert stats["total_audit_entries"] <= 10
+
+        history = await state_manager.get_state_history(zone_id="Z001")
+        assert [h["action_id"] for h in history[:2]] == ["a24", "a22"]
+        assert all(h["zone_id"] == "Z001" for h in history)
+
+        trail = await state_manager.get_audit_trail(zone_id="Z002", action_type="setLightingLevel")
+        assert [e.action_id for e in trail[:2]] == ["a23", "a21"]
+        assert all(e.target_zone == "Z002" for e in trail)
+
+        assert await state_manager.get_audit_entry("a0") is None
+        assert await state_manager.get_audit_entry("a24") is not None
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    def test_limits_must_be_positive(self):
+        """Test a zero retention limit is rejected."""
+        with pytest.raises(ValueError):
+            StateManager(audit_limit=0)
@@ -5,6 +5,7 @@ Tests ValidationService, building validation, action validation, etc.
 """
 
 import pytest
+from src.services import ActionValidator
 from tests.fixtures.sample_building import (
     Location,
     Schedule,
@@ -383,3 +384,49 @@ class TestValidationIntegration:
         # Check floor consistency
         floor_numbers = {z.floor_number for z in building.zones}
         assert len(floor_numbers) > 1
+
+
+class TestSupportedActions:
+    """Tests for the precomputed supported action specs."""
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    def test_supported_actions_is_cached_and_read_only(self):
+        """Test supported actions are built once and cannot be mutated."""
+        validator = ActionValidator()
+
+        supported = validator.supported_actions
+        assert supported is validator.supported_actions
+        assert "setTemperature" in supported
+        assert "setpoint" in supported["setTemperature"]["required_parameters"]
+
+        with pytest.raises(TypeError):
+            supported["newAction"] = {}
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    def test_parameter_specs_are_detached_from_rules(self):
+        """Test payload parameter specs cannot be used to mutate the validation rules."""
+        validator = ActionValidator()
+        specs = validator.supported_actions["setTemperature"]["parameter_specs"]
+
+        with pytest.raises(TypeError):
+            specs["setpoint"]["max"] = 200.0
+        with pytest.raises(AttributeError):
+            specs["mode"]["enum"].append("turbo")
+
+        rules = validator._validation_rules["setTemperature"]["validations"]
+        assert specs["setpoint"] is not rules["setpoint"]
+        assert specs["setpoint"] == rules["setpoint"]
+
+    @pytest.mark.services
+    @pytest.mark.unit
+    def test_reload_rebuilds_supported_actions(self):
+        """Test reloading rules replaces the cached specs."""
+        validator = ActionValidator()
+        before = validator.supported_actions
+
+        validator.reload_validation_rules()
+
+        assert validator.supported_actions is not before
+        assert validator.supported_actions.keys() == before.keys()